@@ -7,6 +7,7 @@ Implements a chess AI using the minimax algorithm with alpha-beta pruning.
 import random
 from typing import List, Tuple, Optional
 from .move import Move
+from .ai_numba import NUMBA_AVAILABLE, build_tables, encode_board, evaluate_material
 
 class ChessAI:
     """
@@ -87,6 +88,9 @@ class ChessAI:
         ]
     }
     
+    # Value and bonus tables indexed by piece code, for the compiled evaluator
+    _VALUE_TABLE, _BONUS_TABLE = build_tables(PIECE_VALUES, POSITION_BONUSES)
+    
     def __init__(self, difficulty: int = 3):
         """
         Initialize the chess AI.
@@ -277,6 +281,10 @@ class ChessAI:
         if board.stalemate:
             return 0  # Draw
         
+        # Compiled material evaluation when numba is installed
+        if NUMBA_AVAILABLE:
+            return int(evaluate_material(encode_board(board), self._VALUE_TABLE, self._BONUS_TABLE))
+        
         # Material evaluation
         score = 0
         
@@ -0,0 +1,87 @@
+"""
+AI Numba Module
+
+Numba-compiled position evaluation for the minimax AI.
+The board is read as its 64 signed piece codes (Board.piece_codes, row * 8 + col,
+row 0 is rank 8): 0 for an empty square, 1-6 for white P/N/B/R/Q/K and -1 to -6 for black.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; callers fall back to pure Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Piece letters in code order (code 0 is an empty square), as in board.PIECE_CODES
+PIECE_ORDER = "PNBRQK"
+
+
+def build_tables(piece_values, position_bonuses):
+    """
+    Pack piece values and position bonuses into arrays indexed by piece code.
+
+    Args:
+        piece_values: Dict of piece type to value
+        position_bonuses: Dict of piece type to 8x8 bonus table from white's side
+
+    Returns:
+        Tuple of (values, bonuses) arrays with shapes (7,) and (7, 8, 8)
+    """
+    values = np.zeros(7, dtype=np.int32)
+    bonuses = np.zeros((7, 8, 8), dtype=np.int32)
+    for index, piece_type in enumerate(PIECE_ORDER, 1):
+        values[index] = piece_values.get(piece_type, 0)
+        if piece_type in position_bonuses:
+            bonuses[index] = position_bonuses[piece_type]
+    return values, bonuses
+
+
+def encode_board(board):
+    """
+    Get a board's signed piece codes as a NumPy array.
+
+    The board keeps the codes up to date as moves are made, so this is a
+    view of them rather than a fresh encoding of the pieces.
+
+    Args:
+        board: Chess board
+
+    Returns:
+        int8 array of 64 piece codes (shares memory with board.piece_codes)
+    """
+    return np.frombuffer(board.piece_codes, dtype=np.int8)
+
+
+@njit(cache=True)
+def evaluate_material(squares, values, bonuses):
+    """
+    Score material and piece placement, positive for white.
+
+    Args:
+        squares: int8 array of 64 piece codes
+        values: Piece values indexed by code
+        bonuses: Position bonuses indexed by (code, row, col) from white's side
+
+    Returns:
+        Material and position score
+    """
+    score = 0
+    for square in range(64):
+        code = squares[square]
+        if code == 0:
+            continue
+        row = square >> 3
+        col = square & 7
+        if code > 0:
+            score += values[code] + bonuses[code, 7 - row, col]
+        else:
+            score -= values[-code] + bonuses[-code, row, col]
+    return score
@@ -3,9 +3,205 @@ Chess board representation and state management.
 Handles an 8x8 chess board, initializes pieces, updates positions, and provides legal move validation.
 """
 
+import random
+from array import array
+
 from .pieces import Pawn, Rook, Knight, Bishop, Queen, King
 from .move import Move
 
+# 10x12 mailbox: the 8x8 board padded with a -1 sentinel border, so a single
+# table lookup tells whether a step has left the board.
+# MAILBOX maps mailbox index -> square (row * 8 + col) or -1,
+# MAILBOX64 maps square -> mailbox index.
+MAILBOX = array('b', [-1] * 120)
+MAILBOX64 = array('b', [0] * 64)
+for _square in range(64):
+    MAILBOX64[_square] = 21 + (_square // 8) * 10 + _square % 8
+    MAILBOX[MAILBOX64[_square]] = _square
+del _square
+
+# Mailbox offsets for each direction of travel
+ROOK_OFFSETS = (-10, 1, 10, -1)  # up, right, down, left
+BISHOP_OFFSETS = (-11, -9, 11, 9)  # up-left, up-right, down-right, down-left
+KNIGHT_OFFSETS = (-21, -19, -12, -8, 8, 12, 19, 21)
+KING_OFFSETS = (-11, -10, -9, -1, 1, 9, 10, 11)
+
+# Zobrist keys: a random 64-bit value per (piece code, square) and one for black to move.
+# The fixed seed keeps hashes stable between runs.
+_zobrist_rng = random.Random(0x5EED)
+ZOBRIST_PIECE_KEYS = {color + piece_type: tuple(_zobrist_rng.getrandbits(64) for _ in range(64))
+                      for color in ('w', 'b') for piece_type in ('P', 'N', 'B', 'R', 'Q', 'K')}
+ZOBRIST_BLACK_TO_MOVE = _zobrist_rng.getrandbits(64)
+del _zobrist_rng
+
+# Signed piece codes kept in Board.piece_codes: 1-6 for white P/N/B/R/Q/K,
+# negated for black (0 is an empty square)
+PIECE_CODES = {color + piece_type: sign * code
+               for color, sign in (('w', 1), ('b', -1))
+               for code, piece_type in enumerate("PNBRQK", 1)}
+
+# Maximum number of cached is_valid_move results per board
+VALID_MOVE_CACHE_SIZE = 1 << 16
+
+# Sets a square without _BoardRow's bookkeeping, for board code that keeps
+# the position hash and piece codes in step itself (or restores the square)
+_store = list.__setitem__
+
+
+def _piece_code(piece):
+    """
+    Get the signed piece code of a piece.
+    
+    Args:
+        piece: Piece object or None
+        
+    Returns:
+        int: Code from PIECE_CODES, or 0 for None
+    """
+    return PIECE_CODES[piece.color + piece.piece_type] if piece is not None else 0
+
+
+def _fixed_size(name):
+    """
+    Make a stand-in for a list method that would resize the board grid.
+    
+    Args:
+        name: Name of the list method
+        
+    Returns:
+        function: Method raising TypeError
+    """
+    def method(self, *args, **kwargs):
+        raise TypeError(f"the board has a fixed size of 8x8; {name}() is not supported")
+    method.__name__ = name
+    return method
+
+
+def _check_slice_size(container, index, values):
+    """
+    Check that a slice assignment keeps the board grid's size.
+    
+    Args:
+        container: Row or grid being assigned to
+        index: Slice being assigned
+        values: New values
+        
+    Returns:
+        list: The new values
+        
+    Raises:
+        ValueError: If the number of values doesn't match the slice
+    """
+    values = list(values)
+    if len(values) != len(range(len(container))[index]):
+        raise ValueError("the board has a fixed size of 8x8")
+    return values
+
+
+class _BoardRow(list):
+    """
+    A row of the board grid.
+    Setting a square updates the board's position hash and piece codes and
+    drops its cached move checks. Methods that would resize the row raise TypeError.
+    """
+    
+    def __init__(self, board, row, pieces):
+        super().__init__(pieces)
+        self._board = board
+        self._row = row
+    
+    def __setitem__(self, col, piece):
+        board = self._board
+        if isinstance(col, slice):
+            list.__setitem__(self, col, _check_slice_size(self, col, piece))
+            board._rebuild_position()
+            return
+        
+        # Normalize once so negative columns hash the same square they set
+        col = range(8)[col]
+        row = self._row
+        board.zobrist_hash ^= board._zobrist_square(row, col)
+        list.__setitem__(self, col, piece)
+        board.zobrist_hash ^= board._zobrist_square(row, col)
+        board.piece_codes[row * 8 + col] = _piece_code(piece)
+        board._position_changed()
+    
+    def __reduce_ex__(self, protocol):
+        # Rebuild through __init__ when copied, since append/extend are disabled
+        return _BoardRow, (self._board, self._row, list(self))
+    
+    def reverse(self):
+        list.reverse(self)
+        self._board._rebuild_position()
+    
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        self._board._rebuild_position()
+    
+    __delitem__ = _fixed_size("__delitem__")
+    __iadd__ = _fixed_size("__iadd__")
+    __imul__ = _fixed_size("__imul__")
+    append = _fixed_size("append")
+    extend = _fixed_size("extend")
+    insert = _fixed_size("insert")
+    pop = _fixed_size("pop")
+    remove = _fixed_size("remove")
+    clear = _fixed_size("clear")
+
+
+class _BoardGrid(list):
+    """
+    The 8x8 board grid, a list of _BoardRow.
+    Assigned rows are wrapped so writes to them are tracked too. Methods that
+    would resize the grid raise TypeError.
+    """
+    
+    def __init__(self, board, rows):
+        super().__init__(_BoardRow(board, row, pieces) for row, pieces in enumerate(rows))
+        self._board = board
+    
+    def __setitem__(self, row, pieces):
+        if isinstance(row, slice):
+            list.__setitem__(self, row, _check_slice_size(self, row, pieces))
+        else:
+            list.__setitem__(self, range(8)[row], pieces)
+        self._rewrap()
+    
+    def __reduce_ex__(self, protocol):
+        # Rebuild through __init__ when copied, since append/extend are disabled
+        return _BoardGrid, (self._board, [list(pieces) for pieces in self])
+    
+    def reverse(self):
+        list.reverse(self)
+        self._rewrap()
+    
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        self._rewrap()
+    
+    def _rewrap(self):
+        """Make every row a tracked row of this board at its index, then rebuild the position."""
+        board = self._board
+        for index, pieces in enumerate(self):
+            if isinstance(pieces, _BoardRow) and pieces._board is board:
+                pieces._row = index
+            else:
+                if len(pieces) != 8:
+                    raise ValueError("the board has a fixed size of 8x8")
+                list.__setitem__(self, index, _BoardRow(board, index, pieces))
+        board._rebuild_position()
+    
+    __delitem__ = _fixed_size("__delitem__")
+    __iadd__ = _fixed_size("__iadd__")
+    __imul__ = _fixed_size("__imul__")
+    append = _fixed_size("append")
+    extend = _fixed_size("extend")
+    insert = _fixed_size("insert")
+    pop = _fixed_size("pop")
+    remove = _fixed_size("remove")
+    clear = _fixed_size("clear")
+
+
 class Board:
     """
     Represents a chess board with pieces and their positions.
@@ -14,9 +210,15 @@ class Board:
     
     def __init__(self):
         """Initialize a new chess board with pieces in starting positions."""
+        # Position hash and signed piece code per square (row * 8 + col), kept in
+        # step with the grid by make_move/undo_move and by writes to its rows
+        self.zobrist_hash = 0
+        self.piece_codes = array('b', bytes(64))
+        self._valid_move_cache = {}
+        
         # 8x8 board representation
         # Each square contains either a piece or None for empty
-        self.board = [[None for _ in range(8)] for _ in range(8)]
+        self.board = _BoardGrid(self, [[None] * 8 for _ in range(8)])
         self.move_log = []
         self.white_to_move = True
         self.white_king_location = (7, 4)
@@ -28,6 +230,8 @@ class Board:
         self.checks = []
         self.en_passant_possible = ()  # coordinates for the square where en passant capture is possible
         self.en_passant_log = []
+        # Incremented whenever the pieces on the board change (never decreases)
+        self.move_counter = 0
         self.current_castling_rights = CastlingRights(True, True, True, True)
         self.castling_rights_log = [CastlingRights(self.current_castling_rights.wks, 
                                                   self.current_castling_rights.bks,
@@ -35,6 +239,59 @@ class Board:
                                                   self.current_castling_rights.bqs)]
         self._initialize_board()
     
+    @property
+    def squares(self):
+        """8x8 grid of Piece objects (None for empty squares); alias of board."""
+        return self.board
+    
+    @squares.setter
+    def squares(self, grid):
+        self.board = _BoardGrid(self, grid)
+        self._rebuild_position()
+    
+    def _position_changed(self):
+        """Note a change to the pieces made outside make_move/undo_move."""
+        self.move_counter += 1
+        self._valid_move_cache.clear()
+    
+    def _rebuild_position(self):
+        """Recompute the position hash and piece codes from the grid."""
+        self.zobrist_hash = self.compute_zobrist_hash()
+        codes = self.piece_codes
+        for row, board_row in enumerate(self.board):
+            for col, piece in enumerate(board_row):
+                codes[row * 8 + col] = _piece_code(piece)
+        self._position_changed()
+    
+    def compute_zobrist_hash(self):
+        """
+        Compute the Zobrist hash of the current position from scratch.
+        
+        Returns:
+            int: 64-bit position hash
+        """
+        zobrist_hash = 0 if self.white_to_move else ZOBRIST_BLACK_TO_MOVE
+        for row in range(8):
+            for col in range(8):
+                zobrist_hash ^= self._zobrist_square(row, col)
+        return zobrist_hash
+    
+    def _zobrist_square(self, row, col):
+        """
+        Get the Zobrist key of the piece on a square.
+        
+        Args:
+            row: Board row (0-7)
+            col: Board column (0-7)
+            
+        Returns:
+            int: Zobrist key, or 0 for an empty square
+        """
+        piece = self.board[row][col]
+        if piece is None:
+            return 0
+        return ZOBRIST_PIECE_KEYS[piece.color + piece.piece_type][row * 8 + col]
+    
     def _initialize_board(self):
         """Initialize the board with pieces in their starting positions."""
         # Place pawns
@@ -87,6 +344,10 @@ class Board:
         """
         Check if a move is valid.
         
+        Results are cached per position (Zobrist hash plus the castling,
+        en passant and check state) and move. Setting squares directly
+        through board/squares clears the cache.
+        
         Args:
             move: Move to check
             
@@ -97,7 +358,32 @@ class Board:
         if not (0 <= move.start_row < 8 and 0 <= move.start_col < 8 and 
                 0 <= move.end_row < 8 and 0 <= move.end_col < 8):
             return False
+        
+        piece = self.board[move.start_row][move.start_col]
+        rights = self.current_castling_rights
+        key = (self.zobrist_hash, move.packed & 0xFFF, self.white_to_move, self.in_check,
+               piece is not None and piece.has_moved,
+               rights.wks, rights.bks, rights.wqs, rights.bqs,
+               self.en_passant_possible, self.white_king_location, self.black_king_location)
+        
+        result = self._valid_move_cache.get(key)
+        if result is None:
+            if len(self._valid_move_cache) >= VALID_MOVE_CACHE_SIZE:
+                self._valid_move_cache.clear()
+            result = self._is_valid_move_uncached(move)
+            self._valid_move_cache[key] = result
+        return result
+    
+    def _is_valid_move_uncached(self, move):
+        """
+        Check if a move is valid, without consulting the cache.
+        
+        Args:
+            move: Move to check (within the board boundaries)
             
+        Returns:
+            bool: True if the move is valid, False otherwise
+        """
         # Get the piece at the start position
         piece = self.get_piece_at(move.start_row, move.start_col)
         if not piece:
@@ -113,22 +399,27 @@ class Board:
         if dest_piece and dest_piece.color == piece.color:
             return False
             
-        # Get all valid moves for this piece
-        valid_moves = self.get_valid_moves(pos=(move.start_row, move.start_col))
+        # Generate this piece's moves; only the matching one needs the check filter
+        candidate_moves = []
+        self._get_piece_moves(move.start_row, move.start_col, candidate_moves)
         
         # Check if the move is in the list of valid moves
-        for valid_move in valid_moves:
+        for valid_move in candidate_moves:
             if move.start_row == valid_move.start_row and move.start_col == valid_move.start_col and \
                move.end_row == valid_move.end_row and move.end_col == valid_move.end_col:
                 
+                # Apply the same filter get_valid_moves uses
+                if not self._passes_check_filter(valid_move):
+                    return False
+                
                 # Check if this move would leave or put the king in check
                 # Make the move temporarily
                 piece_moved = self.board[move.start_row][move.start_col]
                 piece_captured = self.board[move.end_row][move.end_col]
                 
                 # Update the board temporarily
-                self.board[move.end_row][move.end_col] = piece_moved
-                self.board[move.start_row][move.start_col] = None
+                _store(self.board[move.end_row], move.end_col, piece_moved)
+                _store(self.board[move.start_row], move.start_col, None)
                 
                 # Update king position if king is moved
                 king_moved = False
@@ -147,8 +438,8 @@ class Board:
                 in_check = self.is_in_check()
                 
                 # Restore the board
-                self.board[move.start_row][move.start_col] = piece_moved
-                self.board[move.end_row][move.end_col] = piece_captured
+                _store(self.board[move.start_row], move.start_col, piece_moved)
+                _store(self.board[move.end_row], move.end_col, piece_captured)
                 
                 # Restore king position if it was moved
                 if king_moved:
@@ -190,66 +481,10 @@ class Board:
                 
             # Get all possible moves for this piece
             moves = []
-            if piece.piece_type == 'P':
-                self._get_pawn_moves(row, col, moves)
-            elif piece.piece_type == 'R':
-                self._get_rook_moves(row, col, moves)
-            elif piece.piece_type == 'N':
-                self._get_knight_moves(row, col, moves)
-            elif piece.piece_type == 'B':
-                self._get_bishop_moves(row, col, moves)
-            elif piece.piece_type == 'Q':
-                self._get_queen_moves(row, col, moves)
-            elif piece.piece_type == 'K':
-                self._get_king_moves(row, col, moves)
+            self._get_piece_moves(row, col, moves)
                 
             # Filter out moves that would leave the king in check
-            valid_moves = []
-            for move in moves:
-                # Make the move temporarily
-                piece_moved = self.board[move.start_row][move.start_col]
-                piece_captured = self.board[move.end_row][move.end_col]
-                
-                # Update the board temporarily
-                self.board[move.end_row][move.end_col] = piece_moved
-                self.board[move.start_row][move.start_col] = None
-                
-                # Update king position if king is moved
-                king_moved = False
-                king_pos = None
-                if piece_moved and piece_moved.piece_type == 'K':
-                    if piece_moved.color == 'w':
-                        king_pos = self.white_king_location
-                        self.white_king_location = (move.end_row, move.end_col)
-                        king_moved = True
-                    else:
-                        king_pos = self.black_king_location
-                        self.black_king_location = (move.end_row, move.end_col)
-                        king_moved = True
-                
-                # Switch turns temporarily
-                self.white_to_move = not self.white_to_move
-                
-                # Check if the king is in check after the move
-                in_check = self.is_in_check()
-                
-                # Switch turns back
-                self.white_to_move = not self.white_to_move
-                
-                # Restore the board
-                self.board[move.start_row][move.start_col] = piece_moved
-                self.board[move.end_row][move.end_col] = piece_captured
-                
-                # Restore king position if it was moved
-                if king_moved:
-                    if piece_moved.color == 'w':
-                        self.white_king_location = king_pos
-                    else:
-                        self.black_king_location = king_pos
-                
-                # If the move doesn't leave the king in check, it's valid
-                if not in_check:
-                    valid_moves.append(move)
+            valid_moves = [move for move in moves if self._passes_check_filter(move)]
                 
             return valid_moves
             
@@ -262,21 +497,87 @@ class Board:
                     # Only get moves for the current player's pieces
                     if (piece.color == 'w' and self.white_to_move) or \
                        (piece.color == 'b' and not self.white_to_move):
-                        if piece.piece_type == 'P':
-                            self._get_pawn_moves(row, col, moves)
-                        elif piece.piece_type == 'R':
-                            self._get_rook_moves(row, col, moves)
-                        elif piece.piece_type == 'N':
-                            self._get_knight_moves(row, col, moves)
-                        elif piece.piece_type == 'B':
-                            self._get_bishop_moves(row, col, moves)
-                        elif piece.piece_type == 'Q':
-                            self._get_queen_moves(row, col, moves)
-                        elif piece.piece_type == 'K':
-                            self._get_king_moves(row, col, moves)
+                        self._get_piece_moves(row, col, moves)
         
         return moves
     
+    def _get_piece_moves(self, row, col, moves):
+        """
+        Get all moves for the piece on a square, without the check filter.
+        
+        Args:
+            row: Piece row
+            col: Piece column
+            moves: List to add moves to
+        """
+        piece_type = self.board[row][col].piece_type
+        if piece_type == 'P':
+            self._get_pawn_moves(row, col, moves)
+        elif piece_type == 'R':
+            self._get_rook_moves(row, col, moves)
+        elif piece_type == 'N':
+            self._get_knight_moves(row, col, moves)
+        elif piece_type == 'B':
+            self._get_bishop_moves(row, col, moves)
+        elif piece_type == 'Q':
+            self._get_queen_moves(row, col, moves)
+        elif piece_type == 'K':
+            self._get_king_moves(row, col, moves)
+    
+    def _passes_check_filter(self, move):
+        """
+        Check a single move against the check filter used by get_valid_moves.
+        
+        Args:
+            move: Move to check
+            
+        Returns:
+            bool: True if the move passes the filter, False otherwise
+        """
+        # Make the move temporarily
+        piece_moved = self.board[move.start_row][move.start_col]
+        piece_captured = self.board[move.end_row][move.end_col]
+        
+        # Update the board temporarily
+        _store(self.board[move.end_row], move.end_col, piece_moved)
+        _store(self.board[move.start_row], move.start_col, None)
+        
+        # Update king position if king is moved
+        king_moved = False
+        king_pos = None
+        if piece_moved and piece_moved.piece_type == 'K':
+            if piece_moved.color == 'w':
+                king_pos = self.white_king_location
+                self.white_king_location = (move.end_row, move.end_col)
+                king_moved = True
+            else:
+                king_pos = self.black_king_location
+                self.black_king_location = (move.end_row, move.end_col)
+                king_moved = True
+        
+        # Switch turns temporarily
+        self.white_to_move = not self.white_to_move
+        
+        # Check if the king is in check after the move
+        in_check = self.is_in_check()
+        
+        # Switch turns back
+        self.white_to_move = not self.white_to_move
+        
+        # Restore the board
+        _store(self.board[move.start_row], move.start_col, piece_moved)
+        _store(self.board[move.end_row], move.end_col, piece_captured)
+        
+        # Restore king position if it was moved
+        if king_moved:
+            if piece_moved.color == 'w':
+                self.white_king_location = king_pos
+            else:
+                self.black_king_location = king_pos
+        
+        # If the move doesn't leave the king in check, it's valid
+        return not in_check
+    
     def _get_pawn_moves(self, row, col, moves):
         """
         Get all valid pawn moves.
@@ -331,18 +632,18 @@ class Board:
         if not piece or piece.piece_type != 'R':
             return
             
-        # Directions: up, right, down, left
-        directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-        
-        for d_row, d_col in directions:
-            for i in range(1, 8):
-                end_row = row + d_row * i
-                end_col = col + d_col * i
-                
-                # Check if the square is on the board
-                if not (0 <= end_row < 8 and 0 <= end_col < 8):
+        origin = MAILBOX64[row * 8 + col]
+
+        for offset in ROOK_OFFSETS:
+            target = origin + offset
+            while True:
+                # Sentinel border marks the edge of the board
+                square = MAILBOX[target]
+                if square < 0:
                     break
-                    
+                end_row, end_col = square >> 3, square & 7
+                target += offset
+
                 target_piece = self.board[end_row][end_col]
                 if target_piece is None:
                     # Empty square
@@ -368,18 +669,13 @@ class Board:
         if not piece or piece.piece_type != 'N':
             return
             
-        # Knight moves
-        knight_moves = [
-            (-2, -1), (-2, 1), (-1, -2), (-1, 2),
-            (1, -2), (1, 2), (2, -1), (2, 1)
-        ]
-        
-        for d_row, d_col in knight_moves:
-            end_row = row + d_row
-            end_col = col + d_col
-            
-            # Check if the square is on the board
-            if 0 <= end_row < 8 and 0 <= end_col < 8:
+        origin = MAILBOX64[row * 8 + col]
+
+        for offset in KNIGHT_OFFSETS:
+            # Sentinel border marks the edge of the board
+            square = MAILBOX[origin + offset]
+            if square >= 0:
+                end_row, end_col = square >> 3, square & 7
                 target_piece = self.board[end_row][end_col]
                 if target_piece is None or target_piece.color != piece.color:
                     # Empty square or capture
@@ -398,22 +694,22 @@ class Board:
         if not piece or piece.piece_type != 'B':
             return
             
-        # Directions: up-left, up-right, down-right, down-left
-        directions = [(-1, -1), (-1, 1), (1, 1), (1, -1)]
-        
+        origin = MAILBOX64[row * 8 + col]
+
         # Track pawn capture moves separately
         pawn_captures = []
         normal_moves = []
-        
-        for d_row, d_col in directions:
-            for i in range(1, 8):
-                end_row = row + d_row * i
-                end_col = col + d_col * i
-                
-                # Check if the square is on the board
-                if not (0 <= end_row < 8 and 0 <= end_col < 8):
+
+        for offset in BISHOP_OFFSETS:
+            target = origin + offset
+            while True:
+                # Sentinel border marks the edge of the board
+                square = MAILBOX[target]
+                if square < 0:
                     break
-                    
+                end_row, end_col = square >> 3, square & 7
+                target += offset
+
                 target_piece = self.board[end_row][end_col]
                 if target_piece is None:
                     # Empty square - bishop can move here
@@ -459,21 +755,21 @@ class Board:
             
         # Queen moves are a combination of rook and bishop moves
         # Rook-like moves (horizontal and vertical)
-        # Directions: up, right, down, left
-        directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-        
+        origin = MAILBOX64[row * 8 + col]
+
         # Track pawn capture moves separately
         pawn_captures = []
-        
-        for d_row, d_col in directions:
-            for i in range(1, 8):
-                end_row = row + d_row * i
-                end_col = col + d_col * i
-                
-                # Check if the square is on the board
-                if not (0 <= end_row < 8 and 0 <= end_col < 8):
+
+        for offset in ROOK_OFFSETS:
+            target = origin + offset
+            while True:
+                # Sentinel border marks the edge of the board
+                square = MAILBOX[target]
+                if square < 0:
                     break
-                    
+                end_row, end_col = square >> 3, square & 7
+                target += offset
+
                 target_piece = self.board[end_row][end_col]
                 if target_piece is None:
                     # Empty square
@@ -497,18 +793,16 @@ class Board:
                     break
         
         # Bishop-like moves (diagonal)
-        # Directions: up-left, up-right, down-right, down-left
-        directions = [(-1, -1), (-1, 1), (1, 1), (1, -1)]
-        
-        for d_row, d_col in directions:
-            for i in range(1, 8):
-                end_row = row + d_row * i
-                end_col = col + d_col * i
-                
-                # Check if the square is on the board
-                if not (0 <= end_row < 8 and 0 <= end_col < 8):
+        for offset in BISHOP_OFFSETS:
+            target = origin + offset
+            while True:
+                # Sentinel border marks the edge of the board
+                square = MAILBOX[target]
+                if square < 0:
                     break
-                    
+                end_row, end_col = square >> 3, square & 7
+                target += offset
+
                 target_piece = self.board[end_row][end_col]
                 if target_piece is None:
                     # Empty square
@@ -551,21 +845,18 @@ class Board:
             return
             
         # King moves (all 8 surrounding squares)
-        for d_row in [-1, 0, 1]:
-            for d_col in [-1, 0, 1]:
-                if d_row == 0 and d_col == 0:
-                    continue
-                    
-                end_row = row + d_row
-                end_col = col + d_col
-                
-                # Check if the square is on the board
-                if 0 <= end_row < 8 and 0 <= end_col < 8:
-                    target_piece = self.board[end_row][end_col]
-                    if target_piece is None or target_piece.color != piece.color:
-                        # Empty square or capture
-                        move = Move((row, col), (end_row, end_col), self)
-                        moves.append(move)
+        origin = MAILBOX64[row * 8 + col]
+
+        for offset in KING_OFFSETS:
+            # Sentinel border marks the edge of the board
+            square = MAILBOX[origin + offset]
+            if square >= 0:
+                end_row, end_col = square >> 3, square & 7
+                target_piece = self.board[end_row][end_col]
+                if target_piece is None or target_piece.color != piece.color:
+                    # Empty square or capture
+                    move = Move((row, col), (end_row, end_col), self)
+                    moves.append(move)
         
         # Castling
         self._get_castle_moves(row, col, moves)
@@ -625,17 +916,29 @@ class Board:
                (piece_moved.color == 'b' and move.end_row == 7):
                 is_promotion = True
         
+        # Remove the old contents of both squares from the position hash
+        self.zobrist_hash ^= (self._zobrist_square(move.start_row, move.start_col) ^
+                              self._zobrist_square(move.end_row, move.end_col))
+        
         # Update the board
-        self.board[move.end_row][move.end_col] = self.board[move.start_row][move.start_col]
-        self.board[move.start_row][move.start_col] = None
+        _store(self.board[move.end_row], move.end_col, self.board[move.start_row][move.start_col])
+        _store(self.board[move.start_row], move.start_col, None)
         
         # Handle pawn promotion - automatically promote to queen
         if is_promotion:
-            self.board[move.end_row][move.end_col] = Queen(piece_moved.color)
+            _store(self.board[move.end_row], move.end_col, Queen(piece_moved.color))
             print(f"Pawn promoted to Queen at {chr(97 + move.end_col)}{8 - move.end_row}")
         
+        # Add the new contents and the side to move
+        self.zobrist_hash ^= (self._zobrist_square(move.start_row, move.start_col) ^
+                              self._zobrist_square(move.end_row, move.end_col) ^
+                              ZOBRIST_BLACK_TO_MOVE)
+        self.piece_codes[move.start_row * 8 + move.start_col] = 0
+        self.piece_codes[move.end_row * 8 + move.end_col] = _piece_code(self.board[move.end_row][move.end_col])
+        
         # Update move log
         self.move_log.append(move)
+        self.move_counter += 1
         
         # Update king location if king moved
         if move.piece_moved and move.piece_moved.piece_type == 'K':
@@ -668,9 +971,17 @@ class Board:
             
         move = self.move_log.pop()
         
-        # Restore the board
-        self.board[move.start_row][move.start_col] = move.piece_moved
-        self.board[move.end_row][move.end_col] = move.piece_captured
+        # Restore the board, keeping the position hash in step
+        self.zobrist_hash ^= (self._zobrist_square(move.start_row, move.start_col) ^
+                              self._zobrist_square(move.end_row, move.end_col))
+        _store(self.board[move.start_row], move.start_col, move.piece_moved)
+        _store(self.board[move.end_row], move.end_col, move.piece_captured)
+        self.zobrist_hash ^= (self._zobrist_square(move.start_row, move.start_col) ^
+                              self._zobrist_square(move.end_row, move.end_col) ^
+                              ZOBRIST_BLACK_TO_MOVE)
+        self.piece_codes[move.start_row * 8 + move.start_col] = _piece_code(move.piece_moved)
+        self.piece_codes[move.end_row * 8 + move.end_col] = _piece_code(move.piece_captured)
+        self.move_counter += 1
         
         # Restore king location if king moved
         if move.piece_moved and move.piece_moved.piece_type == 'K':
@@ -712,37 +1023,42 @@ class Board:
         Returns:
             bool: True if the square is under attack, False otherwise
         """
-        # Switch turns temporarily to get opponent's moves
-        self.white_to_move = not self.white_to_move
-        
-        # Get all opponent's moves
-        opponent_moves = []
-        for r in range(8):
-            for c in range(8):
-                piece = self.board[r][c]
-                if piece and ((piece.color == 'w' and self.white_to_move) or 
-                             (piece.color == 'b' and not self.white_to_move)):
-                    # Get all possible moves for this piece
-                    if piece.piece_type == 'P':
-                        self._get_pawn_attacks(r, c, opponent_moves)
-                    elif piece.piece_type == 'R':
-                        self._get_rook_attacks(r, c, opponent_moves)
-                    elif piece.piece_type == 'N':
-                        self._get_knight_attacks(r, c, opponent_moves)
-                    elif piece.piece_type == 'B':
-                        self._get_bishop_attacks(r, c, opponent_moves)
-                    elif piece.piece_type == 'Q':
-                        self._get_queen_attacks(r, c, opponent_moves)
-                    elif piece.piece_type == 'K':
-                        self._get_king_attacks(r, c, opponent_moves)
-        
-        # Switch turns back
-        self.white_to_move = not self.white_to_move
-        
-        # Check if any move attacks the square
-        for move in opponent_moves:
-            if move.end_row == row and move.end_col == col:
-                return True
+        # The attacker is the side not to move
+        attacker = 'b' if self.white_to_move else 'w'
+        origin = MAILBOX64[row * 8 + col]
+        
+        # Pawns attack diagonally forward, so look one row behind the square
+        pawn_row = row + 1 if attacker == 'w' else row - 1
+        if 0 <= pawn_row < 8:
+            for pawn_col in (col - 1, col + 1):
+                if 0 <= pawn_col < 8:
+                    piece = self.board[pawn_row][pawn_col]
+                    if piece and piece.color == attacker and piece.piece_type == 'P':
+                        return True
+        
+        # Knights and kings one step away
+        for offsets, piece_type in ((KNIGHT_OFFSETS, 'N'), (KING_OFFSETS, 'K')):
+            for offset in offsets:
+                square = MAILBOX[origin + offset]
+                if square >= 0:
+                    piece = self.board[square >> 3][square & 7]
+                    if piece and piece.color == attacker and piece.piece_type == piece_type:
+                        return True
+        
+        # Sliding pieces: the first piece along each ray decides
+        for offsets, slider_type in ((ROOK_OFFSETS, 'R'), (BISHOP_OFFSETS, 'B')):
+            for offset in offsets:
+                target = origin + offset
+                while True:
+                    square = MAILBOX[target]
+                    if square < 0:
+                        break
+                    piece = self.board[square >> 3][square & 7]
+                    if piece:
+                        if piece.color == attacker and piece.piece_type in (slider_type, 'Q'):
+                            return True
+                        break
+                    target += offset
                 
         return False
     
@@ -780,46 +1096,18 @@ class Board:
             col: Rook column
             moves: List to add moves to
         """
-        # Directions: up, right, down, left
-        directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
-        
-        for d_row, d_col in directions:
-            for i in range(1, 8):
-                end_row = row + d_row * i
-                end_col = col + d_col * i
-                
-                # Check if the square is on the board
-                if not (0 <= end_row < 8 and 0 <= end_col < 8):
-                    break
-                    
-                moves.append(Move((row, col), (end_row, end_col)))
-                
-                # Stop if we hit a piece
-                if self.board[end_row][end_col]:
-                    break
-    
+        self._get_slider_attacks(row, col, ROOK_OFFSETS, moves)
+
     def _get_knight_attacks(self, row, col, moves):
         """
         Get knight attack moves.
-        
+
         Args:
             row: Knight row
             col: Knight column
             moves: List to add moves to
         """
-        # Knight moves
-        knight_moves = [
-            (-2, -1), (-2, 1), (-1, -2), (-1, 2),
-            (1, -2), (1, 2), (2, -1), (2, 1)
-        ]
-        
-        for d_row, d_col in knight_moves:
-            end_row = row + d_row
-            end_col = col + d_col
-            
-            # Check if the square is on the board
-            if 0 <= end_row < 8 and 0 <= end_col < 8:
-                moves.append(Move((row, col), (end_row, end_col)))
+        self._get_step_attacks(row, col, KNIGHT_OFFSETS, moves)
     
     def _get_bishop_attacks(self, row, col, moves):
         """
@@ -830,23 +1118,7 @@ class Board:
             col: Bishop column
             moves: List to add moves to
         """
-        # Directions: up-left, up-right, down-right, down-left
-        directions = [(-1, -1), (-1, 1), (1, 1), (1, -1)]
-        
-        for d_row, d_col in directions:
-            for i in range(1, 8):
-                end_row = row + d_row * i
-                end_col = col + d_col * i
-                
-                # Check if the square is on the board
-                if not (0 <= end_row < 8 and 0 <= end_col < 8):
-                    break
-                    
-                moves.append(Move((row, col), (end_row, end_col)))
-                
-                # Stop if we hit a piece
-                if self.board[end_row][end_col]:
-                    break
+        self._get_slider_attacks(row, col, BISHOP_OFFSETS, moves)
     
     def _get_queen_attacks(self, row, col, moves):
         """
@@ -871,17 +1143,53 @@ class Board:
             moves: List to add moves to
         """
         # King moves (all 8 surrounding squares)
-        for d_row in [-1, 0, 1]:
-            for d_col in [-1, 0, 1]:
-                if d_row == 0 and d_col == 0:
-                    continue
-                    
-                end_row = row + d_row
-                end_col = col + d_col
-                
-                # Check if the square is on the board
-                if 0 <= end_row < 8 and 0 <= end_col < 8:
-                    moves.append(Move((row, col), (end_row, end_col)))
+        self._get_step_attacks(row, col, KING_OFFSETS, moves)
+
+    def _get_slider_attacks(self, row, col, offsets, moves):
+        """
+        Get attack moves along rays, stopping at the first occupied square.
+
+        Args:
+            row: Piece row
+            col: Piece column
+            offsets: Mailbox offsets of the rays to follow
+            moves: List to add moves to
+        """
+        origin = MAILBOX64[row * 8 + col]
+
+        for offset in offsets:
+            target = origin + offset
+            while True:
+                # Sentinel border marks the edge of the board
+                square = MAILBOX[target]
+                if square < 0:
+                    break
+                end_row, end_col = square >> 3, square & 7
+                target += offset
+
+                moves.append(Move((row, col), (end_row, end_col)))
+
+                # Stop if we hit a piece
+                if self.board[end_row][end_col]:
+                    break
+
+    def _get_step_attacks(self, row, col, offsets, moves):
+        """
+        Get single-step attack moves (knight and king).
+
+        Args:
+            row: Piece row
+            col: Piece column
+            offsets: Mailbox offsets of the reachable squares
+            moves: List to add moves to
+        """
+        origin = MAILBOX64[row * 8 + col]
+
+        for offset in offsets:
+            # Sentinel border marks the edge of the board
+            square = MAILBOX[origin + offset]
+            if square >= 0:
+                moves.append(Move((row, col), (square >> 3, square & 7)))
     
     def is_checkmate(self):
         """
@@ -922,8 +1230,8 @@ class Board:
                         piece_captured = self.board[move.end_row][move.end_col]
                         
                         # Update the board temporarily
-                        self.board[move.end_row][move.end_col] = piece_moved
-                        self.board[move.start_row][move.start_col] = None
+                        _store(self.board[move.end_row], move.end_col, piece_moved)
+                        _store(self.board[move.start_row], move.start_col, None)
                         
                         # Update king position if king is moved
                         king_moved = False
@@ -948,8 +1256,8 @@ class Board:
                         self.white_to_move = not self.white_to_move
                         
                         # Restore the board
-                        self.board[move.start_row][move.start_col] = piece_moved
-                        self.board[move.end_row][move.end_col] = piece_captured
+                        _store(self.board[move.start_row], move.start_col, piece_moved)
+                        _store(self.board[move.end_row], move.end_col, piece_captured)
                         
                         # Restore king position if it was moved
                         if king_moved:
@@ -3,6 +3,25 @@ Move class for chess moves.
 Represents a chess move with start and end positions, piece moved, piece captured, etc.
 """
 
+# ASCII codes used by the algebraic notation parser
+_ORD_A, _ORD_H = ord('a'), ord('h')
+_ORD_1, _ORD_8 = ord('1'), ord('8')
+_ORD_X, _ORD_EQUALS, _ORD_DASH = ord('x'), ord('='), ord('-')
+_CASTLE_LETTERS = b"O0"
+_PIECE_LETTERS = b"NBRQK"
+_PROMOTION_LETTERS = b"NBRQ"
+_SUFFIX_CHARS = b"+#!?"
+
+# Flag values stored in the top 4 bits of a packed move
+FLAG_CASTLE = 1
+FLAG_EN_PASSANT = 2
+FLAG_PROMOTION = 4  # Low two bits hold the promotion piece index
+PROMOTION_PIECES = "NBRQ"
+
+# Square name lookup tables, indexed by row * 8 + col (row 0 is rank 8)
+_COORD_TO_ALG = tuple(chr(97 + col) + str(8 - row) for row in range(8) for col in range(8))
+_ALG_TO_COORD = {name: divmod(index, 8) for index, name in enumerate(_COORD_TO_ALG)}
+
 class Move:
     """
     Represents a chess move.
@@ -42,6 +61,10 @@ class Move:
         self.is_pawn_promotion = False
         self.promotion_choice = 'Q'  # Default to queen promotion
         
+        # Set by the UI when the move is played, for end-of-game scoring
+        self.gave_check = False
+        self.end_attacked = False
+        
         # If board is provided, get additional information
         if board:
             self.piece_moved = board.board[self.start_row][self.start_col]
@@ -63,6 +86,145 @@ class Move:
                 (self.end_row == 0 or self.end_row == 7)):
                 self.is_pawn_promotion = True
     
+    @staticmethod
+    def coord_to_algebraic(pos):
+        """
+        Convert a board position to its square name.
+        
+        Args:
+            pos: Board position (row, col)
+            
+        Returns:
+            str: Square name (e.g., "e4")
+        """
+        return _COORD_TO_ALG[pos[0] * 8 + pos[1]]
+    
+    @staticmethod
+    def algebraic_to_coord(square):
+        """
+        Convert a square name to a board position.
+        
+        Args:
+            square: Square name (e.g., "e4")
+            
+        Returns:
+            tuple: Board position (row, col)
+        """
+        return _ALG_TO_COORD[square]
+    
+    @classmethod
+    def from_algebraic(cls, notation, board, color):
+        """
+        Create a move from standard algebraic notation (e.g. "Nf3", "exd5", "O-O", "e8=Q+").
+        
+        Args:
+            notation: Move in standard algebraic notation
+            board: Board the move is played on
+            color: Color making the move ("white" or "black")
+            
+        Returns:
+            Move: The matching legal move, or None if there is none
+        """
+        try:
+            buf = notation.strip().encode('ascii')
+        except UnicodeEncodeError:
+            return None
+        return cls._parse_algebraic_bytes(buf, board, color)
+    
+    @classmethod
+    def _parse_algebraic_bytes(cls, buf, board, color):
+        """
+        Parse ASCII algebraic notation by dispatching on raw byte values.
+        
+        Args:
+            buf: Move in standard algebraic notation as ASCII bytes
+            board: Board the move is played on
+            color: Color making the move ("white" or "black")
+            
+        Returns:
+            Move: The matching legal move, or None if there is none
+        """
+        end = len(buf)
+        
+        # Check, mate and annotation suffixes don't affect the move
+        while end and buf[end - 1] in _SUFFIX_CHARS:
+            end -= 1
+        if end < 2:
+            return None
+        
+        start_row = start_col = -1
+        promotion = None
+        
+        if buf[0] in _CASTLE_LETTERS:
+            # Castling: "O-O" (kingside) or "O-O-O" (queenside)
+            letters = 0
+            for i in range(end):
+                if buf[i] in _CASTLE_LETTERS:
+                    letters += 1
+                elif buf[i] != _ORD_DASH:
+                    return None
+            if letters == 2:
+                end_col = 6
+            elif letters == 3:
+                end_col = 2
+            else:
+                return None
+            piece_type = 'K'
+            end_row = 7 if color == "white" else 0
+        else:
+            # Promotion: "e8=Q" or "e8Q"
+            if buf[end - 1] in _PROMOTION_LETTERS:
+                promotion = chr(buf[end - 1])
+                end -= 1
+                if end and buf[end - 1] == _ORD_EQUALS:
+                    end -= 1
+            if end < 2:
+                return None
+            
+            # Destination square is always the last file/rank pair
+            file_char, rank_char = buf[end - 2], buf[end - 1]
+            if not (_ORD_A <= file_char <= _ORD_H and _ORD_1 <= rank_char <= _ORD_8):
+                return None
+            end_col = file_char - _ORD_A
+            end_row = _ORD_8 - rank_char
+            
+            # Leading piece letter, pawn if absent
+            i = 0
+            if buf[0] in _PIECE_LETTERS:
+                piece_type = chr(buf[0])
+                i = 1
+            else:
+                piece_type = 'P'
+            
+            # Disambiguation (file and/or rank) and capture marker
+            for j in range(i, end - 2):
+                c = buf[j]
+                if _ORD_A <= c <= _ORD_H:
+                    start_col = c - _ORD_A
+                elif _ORD_1 <= c <= _ORD_8:
+                    start_row = _ORD_8 - c
+                elif c != _ORD_X:
+                    return None
+        
+        # Find the piece that can legally reach the destination
+        color_code = 'w' if color == "white" else 'b'
+        for row in range(8):
+            if start_row >= 0 and row != start_row:
+                continue
+            for col in range(8):
+                if start_col >= 0 and col != start_col:
+                    continue
+                piece = board.board[row][col]
+                if piece is None or piece.color != color_code or piece.piece_type != piece_type:
+                    continue
+                for move in board.get_valid_moves((row, col)):
+                    if move.end_row == end_row and move.end_col == end_col:
+                        if promotion:
+                            move.promotion_choice = promotion
+                        return move
+        
+        return None
+    
     def get_chess_notation(self):
         """
         Get the move in chess notation (e.g., "e2e4").
@@ -84,7 +246,71 @@ class Move:
         Returns:
             str: Rank and file notation (e.g., "e4")
         """
-        return self.cols_to_files[col] + self.rows_to_ranks[row]
+        return _COORD_TO_ALG[row * 8 + col]
+    
+    @property
+    def packed(self):
+        """
+        Get the move packed into a 16-bit integer.
+        
+        Bits 0-5 hold the start square (row * 8 + col), bits 6-11 the end
+        square and bits 12-15 the castle/en passant/promotion flags.
+        
+        Returns:
+            int: Packed move
+        """
+        flags = 0
+        if self.is_castle_move:
+            flags = FLAG_CASTLE
+        elif self.is_en_passant_move:
+            flags = FLAG_EN_PASSANT
+        elif self.is_pawn_promotion:
+            flags = FLAG_PROMOTION | (PROMOTION_PIECES.find(self.promotion_choice) & 3)
+        
+        return ((self.start_row * 8 + self.start_col) |
+                ((self.end_row * 8 + self.end_col) << 6) |
+                (flags << 12))
+    
+    @classmethod
+    def unpack_from_to(cls, packed):
+        """
+        Get the start and end positions of a packed move.
+        
+        Args:
+            packed: Move packed into a 16-bit integer
+            
+        Returns:
+            tuple: ((start_row, start_col), (end_row, end_col))
+        """
+        start = packed & 0x3F
+        end = (packed >> 6) & 0x3F
+        return (start >> 3, start & 7), (end >> 3, end & 7)
+    
+    @classmethod
+    def from_packed(cls, packed, board=None):
+        """
+        Create a move from its packed 16-bit form.
+        
+        Args:
+            packed: Move packed into a 16-bit integer
+            board: Optional board to get additional move information
+            
+        Returns:
+            Move: The unpacked move
+        """
+        start_pos, end_pos = cls.unpack_from_to(packed)
+        move = cls(start_pos, end_pos, board)
+        
+        flags = packed >> 12
+        if flags & FLAG_PROMOTION:
+            move.is_pawn_promotion = True
+            move.promotion_choice = PROMOTION_PIECES[flags & 3]
+        elif flags == FLAG_CASTLE:
+            move.is_castle_move = True
+        elif flags == FLAG_EN_PASSANT:
+            move.is_en_passant_move = True
+        
+        return move
     
     def __eq__(self, other):
         """
@@ -97,12 +323,19 @@ class Move:
             bool: True if moves are equal, False otherwise
         """
         if isinstance(other, Move):
-            return (self.start_row == other.start_row and
-                    self.start_col == other.start_col and
-                    self.end_row == other.end_row and
-                    self.end_col == other.end_col)
+            # Moves are equal when their start and end squares match
+            return (self.packed & 0xFFF) == (other.packed & 0xFFF)
         return False
     
+    def __hash__(self):
+        """
+        Hash the move by its start and end squares.
+        
+        Returns:
+            int: Hash value
+        """
+        return self.packed & 0xFFF
+    
     def __str__(self):
         """
         Get string representation of the move.
@@ -134,3 +367,48 @@ class Move:
             move_string += "x"
         
         return move_string + end_square
+
+
+class MovePool:
+    """
+    Free list of Move objects that can be reinitialized instead of reallocated.
+    """
+    
+    # Instance attributes (no per-instance __dict__)
+    __slots__ = ('free', 'max_size')
+    
+    def __init__(self, max_size=1024):
+        """
+        Initialize an empty pool.
+        
+        Args:
+            max_size: Maximum number of released moves kept for reuse
+        """
+        self.free = []
+        self.max_size = max_size
+    
+    def acquire(self, start_pos, end_pos, board=None):
+        """
+        Get a move, reusing a released one when available.
+        
+        Args:
+            start_pos: Starting position (row, col)
+            end_pos: Ending position (row, col)
+            board: Optional board to get additional move information
+            
+        Returns:
+            Move: A fully initialized move
+        """
+        move = self.free.pop() if self.free else Move.__new__(Move)
+        move.__init__(start_pos, end_pos, board)
+        return move
+    
+    def release(self, move):
+        """
+        Return a move that is no longer referenced so it can be reused.
+        
+        Args:
+            move: Move to recycle
+        """
+        if len(self.free) < self.max_size:
+            self.free.append(move)
@@ -389,6 +389,9 @@ class GameState:
         else:
             board.en_passant_possible = ()
         
+        # Pieces were placed directly, so rehash the position
+        board.zobrist_hash = board.compute_zobrist_hash()
+        
         # Create game state
         game_state = cls(board)
         
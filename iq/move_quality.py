@@ -0,0 +1,91 @@
+"""
+Move quality scoring for the end-of-game Chess IQ.
+Counts captures, checks, promotions and risky moves over a player's moves
+with a Numba-compiled loop when numba is installed.
+"""
+
+import numpy as np
+
+from chess_engine.ai_numba import PIECE_ORDER, njit
+
+# Piece codes as used by chess_engine.ai_numba (1-6 for P/N/B/R/Q/K, 0 for none)
+_PIECE_CODES = {piece_type: index for index, piece_type in enumerate(PIECE_ORDER, 1)}
+_KNIGHT, _BISHOP, _ROOK, _QUEEN = (_PIECE_CODES[piece_type] for piece_type in "NBRQ")
+
+
+def encode_moves(moves):
+    """
+    Flatten played moves into per-field arrays for score_moves.
+
+    Args:
+        moves: Moves in the order they were played, with gave_check and end_attacked set
+
+    Returns:
+        Tuple of int8 arrays (captured, promoted, gave_check, end_attacked)
+    """
+    count = len(moves)
+    captured = np.zeros(count, dtype=np.int8)
+    promoted = np.zeros(count, dtype=np.int8)
+    gave_check = np.zeros(count, dtype=np.int8)
+    end_attacked = np.zeros(count, dtype=np.int8)
+
+    for i, move in enumerate(moves):
+        if move.piece_captured:
+            captured[i] = _PIECE_CODES.get(move.piece_captured.piece_type, 0)
+        moved = move.piece_moved
+        if moved and moved.piece_type == 'P' and move.end_row == (0 if moved.color == 'w' else 7):
+            promoted[i] = 1
+        gave_check[i] = move.gave_check
+        end_attacked[i] = move.end_attacked
+
+    return captured, promoted, gave_check, end_attacked
+
+
+@njit(cache=True)
+def score_moves(captured, promoted, gave_check, end_attacked):
+    """
+    Tally move quality counters over encoded moves.
+
+    Args:
+        captured: Code of the piece each move captured (0 for none)
+        promoted: 1 where the move promoted a pawn
+        gave_check: 1 where the move put the opponent in check
+        end_attacked: 1 where the move went to a square the opponent attacked
+
+    Returns:
+        Tuple of (good_moves, bad_moves, captures, checks, promotions, risks_taken)
+    """
+    good_moves = 0
+    bad_moves = 0
+    captures = 0
+    checks = 0
+    promotions = 0
+    risks_taken = 0
+
+    for i in range(captured.shape[0]):
+        code = captured[i]
+        if code != 0:
+            captures += 1
+            # Bonus for capturing higher value pieces
+            if code == _QUEEN or code == _ROOK:
+                good_moves += 2
+            elif code == _BISHOP or code == _KNIGHT:
+                good_moves += 1
+
+        if gave_check[i]:
+            checks += 1
+            good_moves += 1
+
+        if promoted[i]:
+            promotions += 1
+            good_moves += 3  # Big bonus for promotion
+
+        # A risk that won material is a good risk
+        if end_attacked[i]:
+            risks_taken += 1
+            if code != 0:
+                good_moves += 1
+            else:
+                bad_moves += 1
+
+    return good_moves, bad_moves, captures, checks, promotions, risks_taken
@@ -5,24 +5,61 @@ Tracks player progress, statistics, and improvement over time.
 """
 
 import os
+import copy
 import json
 import time
-from typing import Dict, List, Any, Optional
+import functools
+import numpy as np
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+from utils.file_handler import load_player_stats, save_player_stats
+
+
+def versioned_cache(method: Callable) -> Callable:
+    """
+    Cache the result of a no-argument ProgressTracker query.
+
+    The cached value is reused until the tracker's stats version changes.
+    Callers get a shallow copy, so changing it doesn't change the cache.
+
+    Args:
+        method: Query method to wrap
+
+    Returns:
+        Wrapped method
+    """
+    @functools.wraps(method)
+    def wrapper(self):
+        cached = self._query_cache.get(method.__name__)
+        if cached is not None and cached[0] == self._version:
+            return copy.copy(cached[1])
+        
+        result = method(self)
+        self._query_cache[method.__name__] = (self._version, result)
+        return copy.copy(result)
+    
+    return wrapper
+
 
 class ProgressTracker:
     """
     Tracks player progress and statistics.
     """
     
-    def __init__(self, stats_file: str = "data/player_stats.json"):
+    def __init__(self, stats_file: Optional[str] = None):
         """
         Initialize the progress tracker.
         
         Args:
-            stats_file: Path to the player stats file
+            stats_file: Path to a JSON player stats file; by default the shared
+                player stats in the data directory are used
         """
         self.stats_file = stats_file
         self.stats = self._load_stats()
+        
+        # Bumped on every stats update to invalidate cached query results
+        self._version = 0
+        self._query_cache = {}
     
     def _load_stats(self) -> Dict[str, Any]:
         """
@@ -57,6 +94,9 @@ class ProgressTracker:
             "improvement_areas": []
         }
         
+        if self.stats_file is None:
+            return load_player_stats() or default_stats
+        
         # Try to load stats from file
         try:
             # Create directory if it doesn't exist
@@ -73,6 +113,13 @@ class ProgressTracker:
     
     def _save_stats(self) -> None:
         """Save player statistics to file."""
+        # Stats have changed, so cached query results are stale
+        self._version += 1
+        
+        if self.stats_file is None:
+            save_player_stats(self.stats)
+            return
+        
         try:
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(self.stats_file), exist_ok=True)
@@ -278,6 +325,7 @@ class ProgressTracker:
             
         return self.stats
     
+    @versioned_cache
     def get_win_rate(self) -> float:
         """
         Get player win rate.
@@ -290,6 +338,20 @@ class ProgressTracker:
             return (self.stats["games"]["wins"] / total_games) * 100
         return 0
     
+    @versioned_cache
+    def get_mistake_distribution(self) -> Dict[str, float]:
+        """
+        Get the distribution of move quality categories.
+        
+        Returns:
+            Dictionary mapping each mistake category to its percentage (0-100)
+        """
+        mistakes = self.stats["mistakes"]
+        total_moves = sum(mistakes.values())
+        if total_moves > 0:
+            return {category: (count / total_moves) * 100 for category, count in mistakes.items()}
+        return {category: 0 for category in mistakes}
+    
     def get_iq_trend(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get IQ trend history.
@@ -314,6 +376,48 @@ class ProgressTracker:
         """
         return self.stats["accuracy"]["history"][-limit:]
     
+    def get_iq_series(self, limit: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get IQ history as parallel arrays for plotting.
+        
+        Args:
+            limit: Maximum number of entries to return
+            
+        Returns:
+            Tuple of (float32 IQ scores, datetime64[s] timestamps)
+        """
+        return self._history_series("iq", "iq", limit)
+    
+    def get_accuracy_series(self, limit: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get accuracy history as parallel arrays for plotting.
+        
+        Args:
+            limit: Maximum number of entries to return
+            
+        Returns:
+            Tuple of (float32 accuracy percentages, datetime64[s] timestamps)
+        """
+        return self._history_series("accuracy", "accuracy", limit)
+    
+    def _history_series(self, section: str, key: str, limit: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Split the latest entries of a history into value and timestamp arrays.
+        
+        Args:
+            section: Stats section holding the history
+            key: Entry field with the value
+            limit: Maximum number of entries to return
+            
+        Returns:
+            Tuple of (float32 values, datetime64[s] timestamps)
+        """
+        entries = self.stats[section]["history"][-limit:]
+        count = len(entries)
+        values = np.fromiter((entry[key] for entry in entries), dtype=np.float32, count=count)
+        timestamps = np.fromiter((entry.get("timestamp", 0) for entry in entries), dtype=np.int64, count=count)
+        return values, timestamps.astype("datetime64[s]")
+    
     def get_best_openings(self, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Get best openings by win rate.
@@ -17,6 +17,11 @@ setup(
         "matplotlib>=3.7.0",
         "pytest>=7.3.1",
     ],
+    extras_require={
+        "jit": ["numba>=0.58.0"],
+        "json": ["orjson>=3.9.0"],
+        "msgpack": ["msgpack>=1.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "chess-iq=main:main",
@@ -0,0 +1,67 @@
+"""Tests for configuration loading, caching and saving."""
+
+import json
+from types import MappingProxyType
+
+import pytest
+from utils import config
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Run each test in an empty directory with a fresh config cache."""
+    monkeypatch.chdir(tmp_path)
+    config.clear_config_cache()
+    yield config.CONFIG_FILE
+    config.clear_config_cache()
+
+
+def write_config(path, data):
+    """Write a config file directly, bypassing save_config."""
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+def test_config_reloaded_when_file_changes(config_file, monkeypatch):
+    """Test that a config is parsed once and parsed again after the file changes."""
+    parses = []
+    loads = config._loads
+    monkeypatch.setattr(config, "_loads", lambda data: parses.append(data) or loads(data))
+
+    write_config(config_file, {"ui": {"theme": "dark"}})
+    assert config.load_config(config_file)["ui"]["theme"] == "dark"
+    assert config.get_config_value("ui.theme") == "dark"
+    assert len(parses) == 1
+
+    write_config(config_file, {"ui": {"theme": "classic"}})
+    assert config.get_config_value("ui.theme") == "classic"
+    assert len(parses) == 2
+
+
+def test_save_config_invalidates_cache(config_file):
+    """Test that values saved with save_config are seen by the next lookup."""
+    assert config.get_config_value("sound.volume") == 0.7
+
+    assert config.update_config_value("sound.volume", 0.25)
+    assert config_file not in config._CONFIG_CACHE
+    assert config.get_config_value("sound.volume") == 0.25
+    assert config.load_config(config_file)["ui"]["theme"] == "default"
+
+
+def test_config_values_are_read_only(config_file):
+    """Test that sections and arrays are returned frozen and can be saved back."""
+    write_config(config_file, {"ui": {"screen_size": [1024, 768]}})
+
+    section = config.get_config_value("ui")
+    assert isinstance(section, MappingProxyType)
+    assert config.get_config_value("ui.screen_size") == (1024, 768)
+    with pytest.raises(TypeError):
+        section["theme"] = "dark"
+
+    assert config.update_config_value("ui", section)
+    assert config.get_config_value("ui.screen_size") == (1024, 768)
+
+
+def test_save_config_reports_unserializable_values(config_file):
+    """Test that a value JSON can't represent makes save_config fail cleanly."""
+    assert not config.save_config({"ui": {"theme": object()}}, config_file)
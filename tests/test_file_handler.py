@@ -0,0 +1,120 @@
+"""Tests for data file persistence: game history, caching and buffered writes."""
+
+import os
+import shutil
+
+import pytest
+from utils import file_handler
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Run each test against an empty data directory with fresh caches."""
+    monkeypatch.chdir(tmp_path)
+    file_handler.flush_all()
+    file_handler.clear_json_cache()
+    yield tmp_path / file_handler.DATA_DIR
+    file_handler.flush_all()
+    file_handler.clear_json_cache()
+
+
+def write_history(data, content):
+    """Replace the game history file's raw contents."""
+    os.makedirs(data, exist_ok=True)
+    with open(file_handler.GAME_HISTORY_JSONL, "wb") as f:
+        f.write(content)
+
+
+def test_add_game_after_truncated_line(data_dir):
+    """Test that a game appended after a crash-truncated line is kept."""
+    write_history(data_dir, b'{"n":1}\n{"n":')
+
+    assert file_handler.add_game_to_history({"n": 9})
+    file_handler.flush_all()
+    file_handler.clear_json_cache()
+
+    assert [game["n"] for game in file_handler.load_game_history()] == [1, 9]
+
+
+def test_cached_history_after_truncated_line(data_dir):
+    """Test that the cached history matches the file after appending past a truncated line."""
+    write_history(data_dir, b'{"n":1}\n{"n":')
+    assert [game["n"] for game in file_handler.load_game_history()] == [1]
+
+    file_handler.add_game_to_history({"n": 9})
+    file_handler.flush_all()
+    cached = file_handler.load_game_history()
+
+    file_handler.clear_json_cache()
+    assert cached == file_handler.load_game_history()
+    assert file_handler._JSON_CACHE[file_handler.GAME_HISTORY_JSONL][1] == cached
+
+
+@pytest.mark.parametrize("chunk_size", [8, 64 * 1024])
+def test_recent_games_skip_invalid_lines(data_dir, monkeypatch, chunk_size):
+    """Test that invalid and blank lines don't count toward the recent games."""
+    monkeypatch.setattr(file_handler, "_TAIL_CHUNK_SIZE", chunk_size)
+    write_history(data_dir, b'{"n":1}\n{"n":2}\n\n{"n":3}\n{"n":4}\n{"n":')
+
+    assert [game["n"] for game in file_handler.load_recent_games(2)] == [3, 4]
+    assert [game["n"] for game in file_handler.load_recent_games(10)] == [1, 2, 3, 4]
+
+
+def test_failed_buffered_write_is_reported_and_retried(data_dir, monkeypatch):
+    """Test that flush_all reports a failed buffered write and keeps it queued."""
+    assert file_handler.save_moves_input({"moves": ["e4"]})
+
+    def fail_write(data, file_path):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(file_handler, "_replace_file", fail_write)
+        assert not file_handler.flush_all()
+        assert file_handler.load_moves_input() == {"moves": ["e4"]}
+
+    assert file_handler.flush_all()
+    file_handler.clear_json_cache()
+    assert file_handler.load_json(file_handler.MOVES_INPUT_FILE) == {"moves": ["e4"]}
+
+
+def test_games_queued_after_failed_write_are_loaded(data_dir, monkeypatch):
+    """Test that games whose write failed are still loaded and retried later."""
+    write_history(data_dir, b'{"n":1}\n')
+    assert file_handler.add_game_to_history({"n": 2})
+
+    with monkeypatch.context() as patched:
+        patched.setattr(file_handler, "_append_lines", lambda lines, file_path: False)
+        assert [game["n"] for game in file_handler.load_game_history()] == [1, 2]
+        assert [game["n"] for game in file_handler.load_recent_games(1)] == [2]
+        assert [game["n"] for game in file_handler.load_recent_games(5)] == [1, 2]
+        assert file_handler._WRITE_BACK._timer is not None
+
+    assert file_handler.flush_all()
+    file_handler.clear_json_cache()
+    assert [game["n"] for game in file_handler.load_game_history()] == [1, 2]
+
+
+def test_parse_cache_is_keyed_by_cache_key(data_dir):
+    """Test that parsers with different cache keys don't share cached results."""
+    os.makedirs(data_dir, exist_ok=True)
+    pgn_path = str(data_dir / "game.pgn")
+    with open(pgn_path, "w") as f:
+        f.write("1. e4 e5 *")
+
+    assert file_handler.load_pgn_cached(pgn_path, lambda text: {"moves": 2}, "count-v1") == {"moves": 2}
+    assert file_handler.load_pgn_cached(pgn_path, lambda text: {"moves": 3}, "count-v2") == {"moves": 3}
+    assert file_handler.load_pgn_cached(pgn_path, lambda text: {"moves": 0}, "count-v1") == {"moves": 2}
+    assert not any(path.startswith(file_handler.PARSE_CACHE_DIR) for path in file_handler._JSON_CACHE)
+
+
+def test_writes_remake_a_removed_data_directory(data_dir):
+    """Test that writes still succeed after the data directory is deleted."""
+    assert file_handler.save_json({"a": 1}, file_handler.MOVES_INPUT_FILE)
+    shutil.rmtree(data_dir)
+
+    assert file_handler.save_json({"a": 2}, file_handler.MOVES_INPUT_FILE)
+    shutil.rmtree(data_dir)
+
+    assert file_handler.add_game_to_history({"n": 1})
+    assert file_handler.flush_all()
+    assert [game["n"] for game in file_handler.load_game_history()] == [1]
@@ -1,257 +1,316 @@
-import unittest
+"""Tests for move generation, notation parsing, and special move cases."""
+
+import copy
+
+import pytest
 from chess_engine.board import Board
 from chess_engine.move import Move
 from chess_engine.pieces import Pawn, Rook, Knight, Bishop, Queen, King
 
 
-class TestMoves(unittest.TestCase):
-    """Tests for move generation, notation parsing, and special move cases."""
-
-    def setUp(self):
-        """Set up a fresh board before each test."""
-        self.board = Board()
-
-    def test_move_creation(self):
-        """Test basic move creation and properties."""
-        move = Move((6, 4), (4, 4))  # e2-e4
-        self.assertEqual(move.start_pos, (6, 4))
-        self.assertEqual(move.end_pos, (4, 4))
-        self.assertFalse(move.is_capture)
-        self.assertFalse(move.is_castling)
-        self.assertFalse(move.is_en_passant)
-        self.assertIsNone(move.promotion_piece)
-
-    def test_move_equality(self):
-        """Test move equality comparison."""
-        move1 = Move((6, 4), (4, 4))
-        move2 = Move((6, 4), (4, 4))
-        move3 = Move((6, 3), (4, 3))
-        
-        self.assertEqual(move1, move2)
-        self.assertNotEqual(move1, move3)
-
-    def test_move_string_representation(self):
-        """Test string representation of moves."""
-        move = Move((6, 4), (4, 4))  # e2-e4
-        self.assertEqual(str(move), "e2-e4")
-        
-        # Test with capture
-        move = Move((6, 4), (5, 5), is_capture=True)  # e2xe3
-        self.assertEqual(str(move), "e2xe3")
-
-    def test_algebraic_notation_conversion(self):
-        """Test conversion between coordinates and algebraic notation."""
-        # Test coordinate to algebraic
-        self.assertEqual(Move.coord_to_algebraic((7, 0)), "a1")
-        self.assertEqual(Move.coord_to_algebraic((0, 7)), "h8")
-        self.assertEqual(Move.coord_to_algebraic((4, 3)), "d4")
-        
-        # Test algebraic to coordinate
-        self.assertEqual(Move.algebraic_to_coord("a1"), (7, 0))
-        self.assertEqual(Move.algebraic_to_coord("h8"), (0, 7))
-        self.assertEqual(Move.algebraic_to_coord("d4"), (4, 3))
-
-    def test_parse_algebraic_notation(self):
-        """Test parsing of algebraic notation into moves."""
-        # Simple pawn move
-        move = Move.from_algebraic("e4", self.board, "white")
-        self.assertEqual(move.start_pos, (6, 4))
-        self.assertEqual(move.end_pos, (4, 4))
-        
-        # Knight move
-        move = Move.from_algebraic("Nf3", self.board, "white")
-        self.assertEqual(move.start_pos, (7, 1))  # Knight at b1
-        self.assertEqual(move.end_pos, (5, 5))    # to f3
-        
-        # Capture
-        # Set up a capture scenario
-        self.board.squares[5][5] = Pawn("black")
-        move = Move.from_algebraic("Nxf3", self.board, "white")
-        self.assertEqual(move.start_pos, (7, 1))
-        self.assertEqual(move.end_pos, (5, 5))
-        self.assertTrue(move.is_capture)
-
-    def test_ambiguous_move_resolution(self):
-        """Test resolution of ambiguous moves in algebraic notation."""
-        # Set up a scenario with two knights that can move to the same square
-        self.board = Board(empty=True)
-        self.board.squares[7][4] = King("white")
-        self.board.squares[0][4] = King("black")
-        self.board.squares[3][1] = Knight("white")  # Knight at b5
-        self.board.squares[3][5] = Knight("white")  # Knight at f5
-        
-        # Specify which knight by file
-        move = Move.from_algebraic("Nbd3", self.board, "white")
-        self.assertEqual(move.start_pos, (3, 1))  # Knight at b5
-        self.assertEqual(move.end_pos, (5, 3))    # to d3
-        
-        # Specify which knight by rank
-        move = Move.from_algebraic("N5d3", self.board, "white")
-        self.assertEqual(move.start_pos, (3, 1))  # Knight at b5 (5th rank)
-        self.assertEqual(move.end_pos, (5, 3))    # to d3
-
-    def test_castling_notation(self):
-        """Test parsing of castling notation."""
-        # Set up a castling scenario
-        self.board = Board(empty=True)
-        self.board.squares[7][4] = King("white")
-        self.board.squares[7][7] = Rook("white")
-        self.board.squares[7][0] = Rook("white")
-        self.board.squares[0][4] = King("black")
-        
-        # Kingside castling
-        move = Move.from_algebraic("O-O", self.board, "white")
-        self.assertEqual(move.start_pos, (7, 4))
-        self.assertEqual(move.end_pos, (7, 6))
-        self.assertTrue(move.is_castling)
-        
-        # Queenside castling
-        move = Move.from_algebraic("O-O-O", self.board, "white")
-        self.assertEqual(move.start_pos, (7, 4))
-        self.assertEqual(move.end_pos, (7, 2))
-        self.assertTrue(move.is_castling)
-
-    def test_pawn_promotion_notation(self):
-        """Test parsing of pawn promotion notation."""
-        # Set up a promotion scenario
-        self.board = Board(empty=True)
-        self.board.squares[1][4] = Pawn("white")  # White pawn about to promote
-        self.board.squares[0][4] = None           # Empty square for promotion
-        self.board.squares[7][4] = King("white")
-        self.board.squares[0][0] = King("black")
-        
-        # Promotion to queen
-        move = Move.from_algebraic("e8=Q", self.board, "white")
-        self.assertEqual(move.start_pos, (1, 4))
-        self.assertEqual(move.end_pos, (0, 4))
-        self.assertEqual(move.promotion_piece, "Queen")
-        
-        # Promotion to knight
-        move = Move.from_algebraic("e8=N", self.board, "white")
-        self.assertEqual(move.start_pos, (1, 4))
-        self.assertEqual(move.end_pos, (0, 4))
-        self.assertEqual(move.promotion_piece, "Knight")
-
-    def test_check_notation(self):
-        """Test parsing of check and checkmate notation."""
-        # Set up a check scenario
-        self.board = Board(empty=True)
-        self.board.squares[7][4] = King("white")
-        self.board.squares[0][4] = King("black")
-        self.board.squares[1][4] = Queen("white")  # White queen giving check
-        
-        # Move with check
-        move = Move.from_algebraic("Qe7+", self.board, "white")
-        self.assertEqual(move.start_pos, (1, 4))
-        self.assertEqual(move.end_pos, (1, 4))  # Same position, just adding check
-        self.assertTrue(move.is_check)
-        
-        # Move with checkmate
-        move = Move.from_algebraic("Qe7#", self.board, "white")
-        self.assertEqual(move.start_pos, (1, 4))
-        self.assertEqual(move.end_pos, (1, 4))
-        self.assertTrue(move.is_checkmate)
-
-    def test_en_passant_notation(self):
-        """Test parsing of en passant notation."""
-        # Set up an en passant scenario
-        self.board = Board(empty=True)
-        self.board.squares[3][4] = Pawn("white")  # White pawn at e5
-        self.board.squares[3][5] = Pawn("black")  # Black pawn at f5 (just moved from f7)
-        self.board.squares[7][4] = King("white")
-        self.board.squares[0][4] = King("black")
-        self.board.last_move = Move((1, 5), (3, 5))  # f7-f5
-        
-        # En passant capture
-        move = Move.from_algebraic("exf6", self.board, "white")
-        self.assertEqual(move.start_pos, (3, 4))
-        self.assertEqual(move.end_pos, (2, 5))
-        self.assertTrue(move.is_en_passant)
-        self.assertTrue(move.is_capture)
-
-    def test_pgn_move_parsing(self):
-        """Test parsing moves from PGN notation."""
-        pgn_moves = ["e4", "e5", "Nf3", "Nc6", "Bb5", "a6", "Ba4", "Nf6", "O-O"]
-        
-        # Reset board to initial position
-        self.board = Board()
-        
-        # Parse and apply each move
-        for i, pgn in enumerate(pgn_moves):
-            color = "white" if i % 2 == 0 else "black"
-            move = Move.from_algebraic(pgn, self.board, color)
-            self.assertIsNotNone(move)
-            self.board.make_move(move)
-        
-        # Verify final position (after O-O)
-        self.assertIsInstance(self.board.squares[7][6], King)  # White king at g1
-        self.assertIsInstance(self.board.squares[7][5], Rook)  # White rook at f1
-
-    def test_move_validation(self):
-        """Test validation of legal and illegal moves."""
-        # Legal move: e2-e4
-        move = Move((6, 4), (4, 4))
-        self.assertTrue(self.board.is_valid_move(move))
-        
-        # Illegal move: e2-e5 (pawn can't move 3 squares)
-        move = Move((6, 4), (3, 4))
-        self.assertFalse(self.board.is_valid_move(move))
-        
-        # Illegal move: e2-d3 (pawn can't move diagonally without capture)
-        move = Move((6, 4), (5, 3))
-        self.assertFalse(self.board.is_valid_move(move))
-
-    def test_move_that_exposes_check(self):
-        """Test that moves exposing the king to check are invalid."""
-        # Set up a scenario where moving a piece would expose check
-        self.board = Board(empty=True)
-        self.board.squares[7][4] = King("white")
-        self.board.squares[7][5] = Bishop("white")  # Bishop protecting the king
-        self.board.squares[7][7] = Rook("black")    # Black rook threatening the king
-        
-        # Moving the bishop would expose the king to check
-        move = Move((7, 5), (6, 6))
-        self.assertFalse(self.board.is_valid_move(move))
-
-    def test_move_history(self):
-        """Test recording and retrieving move history."""
-        # Make a series of moves
-        moves = [
-            Move((6, 4), (4, 4)),  # e2-e4
-            Move((1, 4), (3, 4)),  # e7-e5
-            Move((7, 6), (5, 5)),  # Nf3
-        ]
-        
-        for move in moves:
-            self.board.make_move(move)
-        
-        # Check that move history is correct
-        self.assertEqual(len(self.board.move_history), 3)
-        self.assertEqual(self.board.move_history[0], moves[0])
-        self.assertEqual(self.board.move_history[1], moves[1])
-        self.assertEqual(self.board.move_history[2], moves[2])
-
-    def test_undo_move(self):
-        """Test undoing a move restores the previous board state."""
-        # Initial state
-        initial_e2_piece = self.board.squares[6][4]
-        
-        # Make a move
-        move = Move((6, 4), (4, 4))  # e2-e4
-        self.board.make_move(move)
-        
-        # Verify the move was made
-        self.assertIsNone(self.board.squares[6][4])
-        self.assertEqual(self.board.squares[4][4], initial_e2_piece)
-        
-        # Undo the move
-        self.board.undo_move()
-        
-        # Verify the board is back to initial state
-        self.assertEqual(self.board.squares[6][4], initial_e2_piece)
-        self.assertIsNone(self.board.squares[4][4])
-        self.assertEqual(len(self.board.move_history), 0)
-
-
-if __name__ == "__main__":
-    unittest.main()
+@pytest.fixture(scope="module")
+def board_factory():
+    """Build the starting position once and hand out independent copies."""
+    pristine = Board()
+
+    def make_board():
+        return copy.deepcopy(pristine)
+
+    return make_board
+
+
+@pytest.fixture
+def board(board_factory):
+    """Provide a fresh board for each test."""
+    return board_factory()
+
+
+def test_move_creation():
+    """Test basic move creation and properties."""
+    move = Move((6, 4), (4, 4))  # e2-e4
+    assert move.start_pos == (6, 4)
+    assert move.end_pos == (4, 4)
+    assert not move.is_capture
+    assert not move.is_castling
+    assert not move.is_en_passant
+    assert move.promotion_piece is None
+
+
+def test_move_equality():
+    """Test move equality comparison."""
+    move1 = Move((6, 4), (4, 4))
+    move2 = Move((6, 4), (4, 4))
+    move3 = Move((6, 3), (4, 3))
+
+    assert move1 == move2
+    assert move1 != move3
+
+
+def test_move_string_representation():
+    """Test string representation of moves."""
+    move = Move((6, 4), (4, 4))  # e2-e4
+    assert str(move) == "e2-e4"
+
+    # Test with capture
+    move = Move((6, 4), (5, 5), is_capture=True)  # e2xe3
+    assert str(move) == "e2xe3"
+
+
+@pytest.mark.parametrize("coord, algebraic", [
+    ((7, 0), "a1"),
+    ((0, 7), "h8"),
+    ((4, 3), "d4"),
+])
+def test_algebraic_notation_conversion(coord, algebraic):
+    """Test conversion between coordinates and algebraic notation."""
+    # Test coordinate to algebraic
+    assert Move.coord_to_algebraic(coord) == algebraic
+
+    # Test algebraic to coordinate
+    assert Move.algebraic_to_coord(algebraic) == coord
+
+
+def test_parse_algebraic_notation(board):
+    """Test parsing of algebraic notation into moves."""
+    # Simple pawn move
+    move = Move.from_algebraic("e4", board, "white")
+    assert move.start_pos == (6, 4)
+    assert move.end_pos == (4, 4)
+
+    # Knight move
+    move = Move.from_algebraic("Nf3", board, "white")
+    assert move.start_pos == (7, 1)  # Knight at b1
+    assert move.end_pos == (5, 5)    # to f3
+
+    # Capture
+    # Set up a capture scenario
+    board.squares[5][5] = Pawn("black")
+    move = Move.from_algebraic("Nxf3", board, "white")
+    assert move.start_pos == (7, 1)
+    assert move.end_pos == (5, 5)
+    assert move.is_capture
+
+
+def test_ambiguous_move_resolution():
+    """Test resolution of ambiguous moves in algebraic notation."""
+    # Set up a scenario with two knights that can move to the same square
+    board = Board(empty=True)
+    board.squares[7][4] = King("white")
+    board.squares[0][4] = King("black")
+    board.squares[3][1] = Knight("white")  # Knight at b5
+    board.squares[3][5] = Knight("white")  # Knight at f5
+
+    # Specify which knight by file
+    move = Move.from_algebraic("Nbd3", board, "white")
+    assert move.start_pos == (3, 1)  # Knight at b5
+    assert move.end_pos == (5, 3)    # to d3
+
+    # Specify which knight by rank
+    move = Move.from_algebraic("N5d3", board, "white")
+    assert move.start_pos == (3, 1)  # Knight at b5 (5th rank)
+    assert move.end_pos == (5, 3)    # to d3
+
+
+def test_castling_notation():
+    """Test parsing of castling notation."""
+    # Set up a castling scenario
+    board = Board(empty=True)
+    board.squares[7][4] = King("white")
+    board.squares[7][7] = Rook("white")
+    board.squares[7][0] = Rook("white")
+    board.squares[0][4] = King("black")
+
+    # Kingside castling
+    move = Move.from_algebraic("O-O", board, "white")
+    assert move.start_pos == (7, 4)
+    assert move.end_pos == (7, 6)
+    assert move.is_castling
+
+    # Queenside castling
+    move = Move.from_algebraic("O-O-O", board, "white")
+    assert move.start_pos == (7, 4)
+    assert move.end_pos == (7, 2)
+    assert move.is_castling
+
+
+def test_pawn_promotion_notation():
+    """Test parsing of pawn promotion notation."""
+    # Set up a promotion scenario
+    board = Board(empty=True)
+    board.squares[1][4] = Pawn("white")  # White pawn about to promote
+    board.squares[0][4] = None           # Empty square for promotion
+    board.squares[7][4] = King("white")
+    board.squares[0][0] = King("black")
+
+    # Promotion to queen
+    move = Move.from_algebraic("e8=Q", board, "white")
+    assert move.start_pos == (1, 4)
+    assert move.end_pos == (0, 4)
+    assert move.promotion_piece == "Queen"
+
+    # Promotion to knight
+    move = Move.from_algebraic("e8=N", board, "white")
+    assert move.start_pos == (1, 4)
+    assert move.end_pos == (0, 4)
+    assert move.promotion_piece == "Knight"
+
+
+def test_check_notation():
+    """Test parsing of check and checkmate notation."""
+    # Set up a check scenario
+    board = Board(empty=True)
+    board.squares[7][4] = King("white")
+    board.squares[0][4] = King("black")
+    board.squares[1][4] = Queen("white")  # White queen giving check
+
+    # Move with check
+    move = Move.from_algebraic("Qe7+", board, "white")
+    assert move.start_pos == (1, 4)
+    assert move.end_pos == (1, 4)  # Same position, just adding check
+    assert move.is_check
+
+    # Move with checkmate
+    move = Move.from_algebraic("Qe7#", board, "white")
+    assert move.start_pos == (1, 4)
+    assert move.end_pos == (1, 4)
+    assert move.is_checkmate
+
+
+def test_en_passant_notation():
+    """Test parsing of en passant notation."""
+    # Set up an en passant scenario
+    board = Board(empty=True)
+    board.squares[3][4] = Pawn("white")  # White pawn at e5
+    board.squares[3][5] = Pawn("black")  # Black pawn at f5 (just moved from f7)
+    board.squares[7][4] = King("white")
+    board.squares[0][4] = King("black")
+    board.last_move = Move((1, 5), (3, 5))  # f7-f5
+
+    # En passant capture
+    move = Move.from_algebraic("exf6", board, "white")
+    assert move.start_pos == (3, 4)
+    assert move.end_pos == (2, 5)
+    assert move.is_en_passant
+    assert move.is_capture
+
+
+@pytest.mark.parametrize("pgn_moves, expected_final", [
+    (
+        ["e4", "e5", "Nf3", "Nc6", "Bb5", "a6", "Ba4", "Nf6", "O-O"],
+        {(7, 6): King, (7, 5): Rook},  # White king at g1, rook at f1
+    ),
+])
+def test_pgn_move_parsing(board, pgn_moves, expected_final):
+    """Test parsing moves from PGN notation."""
+    # Start from the initial position
+
+    # Parse and apply each move
+    for i, pgn in enumerate(pgn_moves):
+        color = "white" if i % 2 == 0 else "black"
+        move = Move.from_algebraic(pgn, board, color)
+        assert move is not None, pgn
+        board.make_move(move)
+
+    # Verify final position
+    for (row, col), piece_class in expected_final.items():
+        assert isinstance(board.squares[row][col], piece_class)
+
+
+def test_move_validation_after_direct_square_write(board):
+    """Test that setting a square directly invalidates cached move checks."""
+    move = Move((6, 4), (4, 4), board)  # e2-e4
+    assert board.is_valid_move(move)
+
+    # Block e3; the cached answer for the starting position must not be reused
+    board.squares[5][4] = Pawn("b")
+    assert not board.is_valid_move(move)
+    assert board.zobrist_hash == board.compute_zobrist_hash()
+
+    board.squares[5][4] = None
+    assert board.is_valid_move(move)
+
+    # Negative indices address the same squares as their positive forms
+    board.squares[-3][-4] = Pawn("b")  # e3 again
+    assert board.zobrist_hash == board.compute_zobrist_hash()
+    assert not board.is_valid_move(move)
+    board.squares[0][-1] = None  # h8
+    assert board.zobrist_hash == board.compute_zobrist_hash()
+    assert board.piece_codes[7] == 0
+
+    # The grid keeps its 8x8 shape
+    with pytest.raises(TypeError):
+        board.squares[0].append(None)
+    with pytest.raises(TypeError):
+        del board.squares[0]
+    with pytest.raises(IndexError):
+        board.squares[0][8] = None
+    assert board.zobrist_hash == board.compute_zobrist_hash()
+
+
+def test_move_validation(board):
+    """Test validation of legal and illegal moves."""
+    # Legal move: e2-e4
+    move = Move((6, 4), (4, 4))
+    assert board.is_valid_move(move)
+
+    # Illegal move: e2-e5 (pawn can't move 3 squares)
+    move = Move((6, 4), (3, 4))
+    assert not board.is_valid_move(move)
+
+    # Illegal move: e2-d3 (pawn can't move diagonally without capture)
+    move = Move((6, 4), (5, 3))
+    assert not board.is_valid_move(move)
+
+
+def test_move_that_exposes_check():
+    """Test that moves exposing the king to check are invalid."""
+    # Set up a scenario where moving a piece would expose check
+    board = Board(empty=True)
+    board.squares[7][4] = King("white")
+    board.squares[7][5] = Bishop("white")  # Bishop protecting the king
+    board.squares[7][7] = Rook("black")    # Black rook threatening the king
+
+    # Moving the bishop would expose the king to check
+    move = Move((7, 5), (6, 6))
+    assert not board.is_valid_move(move)
+
+
+def test_move_history(board):
+    """Test recording and retrieving move history."""
+    # Make a series of moves
+    moves = [
+        Move((6, 4), (4, 4)),  # e2-e4
+        Move((1, 4), (3, 4)),  # e7-e5
+        Move((7, 6), (5, 5)),  # Nf3
+    ]
+
+    for move in moves:
+        board.make_move(move)
+
+    # Check that move history is correct
+    assert len(board.move_history) == 3
+    assert board.move_history[0] == moves[0]
+    assert board.move_history[1] == moves[1]
+    assert board.move_history[2] == moves[2]
+
+
+def test_undo_move(board):
+    """Test undoing a move restores the previous board state."""
+    # Initial state
+    initial_e2_piece = board.squares[6][4]
+
+    # Make a move
+    move = Move((6, 4), (4, 4))  # e2-e4
+    board.make_move(move)
+
+    # Verify the move was made
+    assert board.squares[6][4] is None
+    assert board.squares[4][4] == initial_e2_piece
+
+    # Undo the move
+    board.undo_move()
+
+    # Verify the board is back to initial state
+    assert board.squares[6][4] == initial_e2_piece
+    assert board.squares[4][4] is None
+    assert len(board.move_history) == 0
@@ -6,7 +6,7 @@ Handles the rendering of the chess board, pieces, and board-related UI elements.
 
 import os
 import pygame
-from typing import Tuple, List, Dict, Optional
+from typing import Tuple, List, Dict, Optional, Iterable
 
 class BoardView:
     """
@@ -23,6 +23,18 @@ class BoardView:
     NOTATION_LIGHT = (100, 100, 100)      # Dark gray for notation on light squares
     NOTATION_DARK = (200, 200, 200)       # Light gray for notation on dark squares
     
+    # Piece codes (color + piece type) and the directory their images live in
+    PIECE_CODES = [color + piece_type for color in ('w', 'b') for piece_type in ('P', 'N', 'B', 'R', 'Q', 'K')]
+    PIECES_DIR = os.path.join("assets", "pieces")
+    
+    # Sprite sheet holding every piece: columns P N B R Q K, rows white then black
+    SPRITE_SHEET = os.path.join(PIECES_DIR, "sheet.png")
+    SHEET_COLUMNS = ('P', 'N', 'B', 'R', 'Q', 'K')
+    SHEET_ROWS = ('w', 'b')
+    
+    # Set once the piece image files have been checked/generated for this process
+    _assets_checked = False
+    
     def __init__(self, board_size: int, offset_x: int, offset_y: int):
         """
         Initialize the board view.
@@ -38,8 +50,16 @@ class BoardView:
         self.offset_y = offset_y
         self.flipped = False
         
-        # Load piece images
-        self.piece_images = self._load_piece_images()
+        # Precomputed board <-> screen coordinate conversions
+        self._build_screen_pos_table()
+        
+        # Placeholder piece surfaces keyed by (color, piece_type, square_size)
+        self._placeholder_cache = {}
+        
+        # Generate any missing piece image files, then load piece images
+        self._ensure_assets_exist()
+        self._original_piece_images = self._load_piece_images()
+        self._rescale_piece_images()
         
         # Create transparent surfaces for highlights
         self.highlight_surface = pygame.Surface((self.square_size, self.square_size), pygame.SRCALPHA)
@@ -54,58 +74,224 @@ class BoardView:
         self.check_highlight_surface = pygame.Surface((self.square_size, self.square_size), pygame.SRCALPHA)
         self.check_highlight_surface.fill(self.CHECK_HIGHLIGHT)
         
+        # Pre-rendered move and capture indicators
+        self._build_indicator_surfaces()
+        
         # Font for board notation
         self.notation_font = pygame.font.Font(None, max(14, self.square_size // 5))
+        
+        # Static board background (squares and notation), rebuilt on resize/flip
+        self._glyph_cache: Dict[Tuple[str, Tuple[int, int, int]], pygame.Surface] = {}
+        self._background = None
+        self._build_background()
+        
+        # Cached (image, position) pairs for the pieces, keyed on the board's move counter
+        self._piece_draw_list: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._piece_list_board = None
+        self._piece_list_version = -1
+        
+        # Screen areas touched by the last draw; the whole board until the first full redraw
+        self._dirty_rects: List[pygame.Rect] = []
+        self._needs_full_redraw = True
+    
+    def _build_background(self) -> None:
+        """Pre-render the board squares and notation into a single surface."""
+        background = pygame.Surface((self.board_size, self.board_size))
+        if pygame.display.get_surface() is not None:
+            background = background.convert()
+        
+        for row in range(8):
+            for col in range(8):
+                # Determine square color
+                is_light = (row + col) % 2 == 0
+                color = self.LIGHT_SQUARE if is_light else self.DARK_SQUARE
+                
+                # Fill square
+                background.fill(
+                    color,
+                    (col * self.square_size, row * self.square_size, self.square_size, self.square_size)
+                )
+        
+        # Draw board notation (ranks and files)
+        self._draw_notation(background)
+        
+        self._background = background
+    
+    def _build_screen_pos_table(self) -> None:
+        """Precompute screen positions of every square for both orientations."""
+        self._screen_pos_table = tuple(
+            tuple(
+                tuple(
+                    (self.offset_x + (7 - col if flipped else col) * self.square_size,
+                     self.offset_y + (7 - row if flipped else row) * self.square_size)
+                    for col in range(8)
+                )
+                for row in range(8)
+            )
+            for flipped in (False, True)
+        )
+        
+        # (base, sign) used to map a screen square index back to a board index
+        self._board_pos_transform = (7, -1) if self.flipped else (0, 1)
+        
+        # Screen-space board bounds for hit testing
+        self._x_min = self.offset_x
+        self._x_max = self.offset_x + self.board_size
+        self._y_min = self.offset_y
+        self._y_max = self.offset_y + self.board_size
+    
+    def _build_indicator_surfaces(self) -> None:
+        """Pre-render the move and capture indicators for one square."""
+        size = (self.square_size, self.square_size)
+        
+        # Circle in the center of the square
+        move_surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.circle(
+            move_surface,
+            (0, 0, 0, 128),  # Semi-transparent black
+            (self.square_size // 2, self.square_size // 2),
+            self.square_size // 6
+        )
+        self._move_indicator_surface = self._to_display_format(move_surface)
+        
+        # Outline around the square
+        capture_surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(
+            capture_surface,
+            (255, 0, 0, 128),  # Semi-transparent red
+            capture_surface.get_rect(),
+            width=3
+        )
+        self._capture_indicator_surface = self._to_display_format(capture_surface)
+    
+    def _render_glyph(self, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render a notation glyph, reusing previously rendered surfaces.
+        
+        Args:
+            text: Glyph text
+            color: Text color
+            
+        Returns:
+            Rendered text surface
+        """
+        key = (text, color)
+        glyph = self._glyph_cache.get(key)
+        if glyph is None:
+            glyph = self._to_display_format(self.notation_font.render(text, True, color))
+            self._glyph_cache[key] = glyph
+        return glyph
     
-    def _load_piece_images(self) -> Dict[str, pygame.Surface]:
+    def _load_piece_images(self) -> Dict[str, Optional[pygame.Surface]]:
         """
-        Load chess piece images.
+        Load chess piece images at their source resolution.
         
         Returns:
-            Dictionary mapping piece codes to images
+            Dictionary mapping piece codes to images (None if unavailable)
         """
+        pieces = self._load_sprite_sheet()
+        if pieces is not None:
+            return pieces
+        
         pieces = {}
-        piece_types = ['P', 'N', 'B', 'R', 'Q', 'K']
-        colors = ['w', 'b']
         
-        # Create a directory for piece images if it doesn't exist
-        os.makedirs(os.path.join("assets", "pieces"), exist_ok=True)
+        # Fall back to loading one image file per piece
+        for piece_code in self.PIECE_CODES:
+            image_path = os.path.join(self.PIECES_DIR, f"{piece_code}.png")
+            pieces[piece_code] = None
+            
+            # Check if the image file exists
+            if os.path.exists(image_path):
+                try:
+                    pieces[piece_code] = self._to_display_format(pygame.image.load(image_path))
+                except pygame.error:
+                    # Fall back to a placeholder when rescaling
+                    pass
         
-        # Try to load piece images
-        for color in colors:
-            for piece_type in piece_types:
-                piece_code = color + piece_type
-                image_path = os.path.join("assets", "pieces", f"{piece_code}.png")
-                
-                # Check if the image file exists
-                if os.path.exists(image_path):
-                    try:
-                        # Load and scale the image
-                        image = pygame.image.load(image_path)
-                        pieces[piece_code] = pygame.transform.scale(
-                            image, (self.square_size, self.square_size)
-                        )
-                    except pygame.error:
-                        # If loading fails, create a placeholder
-                        pieces[piece_code] = self._create_placeholder_piece(color, piece_type)
-                else:
-                    # Create a placeholder if the image doesn't exist
-                    pieces[piece_code] = self._create_placeholder_piece(color, piece_type)
-                    
-                    # Also create the image file for future use
-                    self._create_piece_image(color, piece_type, image_path)
+        return pieces
+    
+    def _load_sprite_sheet(self) -> Optional[Dict[str, pygame.Surface]]:
+        """
+        Slice every piece image out of the sprite sheet with one file load.
+        
+        Returns:
+            Dictionary mapping piece codes to subsurfaces, or None if the sheet is unavailable
+        """
+        if not os.path.exists(self.SPRITE_SHEET):
+            return None
+        
+        try:
+            sheet = self._to_display_format(pygame.image.load(self.SPRITE_SHEET))
+        except pygame.error:
+            return None
+        
+        cell_width = sheet.get_width() // len(self.SHEET_COLUMNS)
+        cell_height = sheet.get_height() // len(self.SHEET_ROWS)
+        
+        pieces = {}
+        for row, color in enumerate(self.SHEET_ROWS):
+            for col, piece_type in enumerate(self.SHEET_COLUMNS):
+                rect = pygame.Rect(col * cell_width, row * cell_height, cell_width, cell_height)
+                pieces[color + piece_type] = sheet.subsurface(rect)
         
         return pieces
+    
+    def _rescale_piece_images(self) -> None:
+        """Scale the loaded piece images to the current square size."""
+        size = (self.square_size, self.square_size)
+        pieces = {}
         
-    def _create_piece_image(self, color: str, piece_type: str, image_path: str) -> None:
+        for piece_code, original in self._original_piece_images.items():
+            if original is None:
+                # Create a placeholder if the image couldn't be loaded
+                color, piece_type = piece_code
+                pieces[piece_code] = self._create_placeholder_piece(color, piece_type)
+                continue
+            
+            try:
+                image = pygame.transform.smoothscale(original, size)
+            except ValueError:
+                # smoothscale only handles 24/32-bit surfaces
+                image = pygame.transform.scale(original, size)
+            pieces[piece_code] = self._to_display_format(image)
+        
+        self.piece_images = pieces
+    
+    def _ensure_assets_exist(self) -> None:
+        """Create image files for any missing pieces, once per process."""
+        if BoardView._assets_checked:
+            return
+        BoardView._assets_checked = True
+        
+        # The sprite sheet supplies every piece, so no per-piece files are needed
+        if os.path.exists(self.SPRITE_SHEET):
+            return
+        
+        # Create a directory for piece images if it doesn't exist
+        os.makedirs(self.PIECES_DIR, exist_ok=True)
+        
+        for piece_code in self.PIECE_CODES:
+            image_path = os.path.join(self.PIECES_DIR, f"{piece_code}.png")
+            if not os.path.exists(image_path):
+                color, piece_type = piece_code
+                self._create_piece_image(color, piece_type, image_path)
+        
+    def _render_placeholder_surface(self, color: str, piece_type: str) -> pygame.Surface:
         """
-        Create a piece image file.
+        Draw a placeholder piece: a shaded circle with the piece letter.
         
         Args:
             color: Piece color ('w' or 'b')
             piece_type: Piece type ('P', 'N', 'B', 'R', 'Q', 'K')
-            image_path: Path to save the image
+            
+        Returns:
+            Placeholder surface at the current square size
         """
+        key = (color, piece_type, self.square_size)
+        surface = self._placeholder_cache.get(key)
+        if surface is not None:
+            return surface
+        
         # Create a surface for the piece
         surface = pygame.Surface((self.square_size, self.square_size), pygame.SRCALPHA)
         
@@ -128,9 +314,20 @@ class BoardView:
         text_rect = text.get_rect(center=(self.square_size // 2, self.square_size // 2))
         surface.blit(text, text_rect)
         
-        # Save the image
+        self._placeholder_cache[key] = surface
+        return surface
+    
+    def _create_piece_image(self, color: str, piece_type: str, image_path: str) -> None:
+        """
+        Create a piece image file.
+        
+        Args:
+            color: Piece color ('w' or 'b')
+            piece_type: Piece type ('P', 'N', 'B', 'R', 'Q', 'K')
+            image_path: Path to save the image
+        """
         try:
-            pygame.image.save(surface, image_path)
+            pygame.image.save(self._render_placeholder_surface(color, piece_type), image_path)
         except:
             pass  # Ignore errors if we can't save the image
     
@@ -145,33 +342,30 @@ class BoardView:
         Returns:
             Placeholder image surface
         """
-        # Create a surface for the piece
-        surface = pygame.Surface((self.square_size, self.square_size), pygame.SRCALPHA)
-        
-        # Set colors
-        bg_color = (200, 200, 200) if color == 'w' else (50, 50, 50)
-        text_color = (50, 50, 50) if color == 'w' else (200, 200, 200)
-        
-        # Draw a circle for the piece
-        radius = self.square_size // 2 - 4
-        pygame.draw.circle(
-            surface,
-            bg_color,
-            (self.square_size // 2, self.square_size // 2),
-            radius
-        )
-        
-        # Add piece type text
-        font = pygame.font.Font(None, self.square_size // 2)
-        text = font.render(piece_type, True, text_color)
-        text_rect = text.get_rect(center=(self.square_size // 2, self.square_size // 2))
-        surface.blit(text, text_rect)
+        return self._to_display_format(self._render_placeholder_surface(color, piece_type))
+    
+    @staticmethod
+    def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+        """
+        Convert a surface to the display's pixel format for faster blits.
         
-        return surface
+        Args:
+            surface: Surface with per-pixel alpha
+            
+        Returns:
+            Converted surface, or the original if no display mode is set
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha()
     
     def flip_board(self) -> None:
         """Toggle board orientation (flipped or normal)."""
         self.flipped = not self.flipped
+        self._board_pos_transform = (7, -1) if self.flipped else (0, 1)
+        self._build_background()
+        self._piece_list_version = -1
+        self._needs_full_redraw = True
     
     def is_within_board(self, pos: Tuple[int, int]) -> bool:
         """
@@ -184,8 +378,7 @@ class BoardView:
             True if position is within the board, False otherwise
         """
         x, y = pos
-        return (self.offset_x <= x < self.offset_x + self.board_size and
-                self.offset_y <= y < self.offset_y + self.board_size)
+        return self._x_min <= x < self._x_max and self._y_min <= y < self._y_max
     
     def get_board_position(self, pos: Tuple[int, int]) -> Tuple[int, int]:
         """
@@ -198,12 +391,9 @@ class BoardView:
             Board position (row, col)
         """
         x, y = pos
-        col = (x - self.offset_x) // self.square_size
-        row = (y - self.offset_y) // self.square_size
-        
-        if self.flipped:
-            row = 7 - row
-            col = 7 - col
+        base, sign = self._board_pos_transform
+        col = base + sign * ((x - self.offset_x) // self.square_size)
+        row = base + sign * ((y - self.offset_y) // self.square_size)
         
         return (row, col)
     
@@ -218,63 +408,80 @@ class BoardView:
             Screen position (x, y)
         """
         row, col = board_pos
-        
-        if self.flipped:
-            row = 7 - row
-            col = 7 - col
-        
-        x = self.offset_x + col * self.square_size
-        y = self.offset_y + row * self.square_size
-        
-        return (x, y)
+        return self._screen_pos_table[self.flipped][row][col]
     
-    def draw(self, screen: pygame.Surface, board) -> None:
+    def draw(self, screen: pygame.Surface, board,
+             changed_squares: Optional[Iterable[Tuple[int, int]]] = None) -> List[pygame.Rect]:
         """
         Draw the chess board and pieces.
         
         Args:
             screen: Pygame surface to draw on
             board: Chess board object containing piece positions
+            changed_squares: Board positions to redraw; None redraws the whole board
+            
+        Returns:
+            Screen rectangles that were redrawn, suitable for pygame.display.update
+        """
+        if changed_squares is None or self._needs_full_redraw:
+            # Draw board squares and notation
+            self._draw_board(screen)
+            
+            # Draw pieces
+            self._draw_pieces(screen, board)
+            
+            self._needs_full_redraw = False
+            self._dirty_rects = [pygame.Rect(self.offset_x, self.offset_y, self.board_size, self.board_size)]
+        else:
+            self._dirty_rects = [self._draw_square(screen, board, pos) for pos in changed_squares]
+        
+        return self._dirty_rects
+    
+    @property
+    def dirty_rects(self) -> List[pygame.Rect]:
+        """Screen rectangles touched by the most recent draw."""
+        return self._dirty_rects
+    
+    def _draw_square(self, screen: pygame.Surface, board, pos: Tuple[int, int]) -> pygame.Rect:
         """
-        # Draw board squares
-        self._draw_board(screen)
+        Redraw a single square from the pre-rendered background plus its piece.
         
-        # Draw board notation (ranks and files)
-        self._draw_notation(screen)
+        Args:
+            screen: Pygame surface to draw on
+            board: Chess board object containing piece positions
+            pos: Board position (row, col)
+            
+        Returns:
+            Screen rectangle covered by the square
+        """
+        x, y = self.get_screen_position(pos)
+        area = pygame.Rect(x - self.offset_x, y - self.offset_y, self.square_size, self.square_size)
+        screen.blit(self._background, (x, y), area)
         
-        # Draw pieces
-        self._draw_pieces(screen, board)
+        row, col = pos
+        piece = board.board[row][col]
+        if piece:
+            image = self.piece_images.get(piece.color + piece.piece_type)
+            if image is not None:
+                screen.blit(image, (x, y))
         
+        return pygame.Rect(x, y, self.square_size, self.square_size)
+    
     def _draw_board(self, screen: pygame.Surface) -> None:
         """
-        Draw the chess board squares.
+        Draw the pre-rendered board squares and notation.
         
         Args:
             screen: Pygame surface to draw on
         """
-        for row in range(8):
-            for col in range(8):
-                # Determine square color
-                is_light = (row + col) % 2 == 0
-                color = self.LIGHT_SQUARE if is_light else self.DARK_SQUARE
-                
-                # Calculate position
-                x = self.offset_x + col * self.square_size
-                y = self.offset_y + row * self.square_size
-                
-                # Draw square
-                pygame.draw.rect(
-                    screen,
-                    color,
-                    (x, y, self.square_size, self.square_size)
-                )
+        screen.blit(self._background, (self.offset_x, self.offset_y))
     
-    def _draw_notation(self, screen: pygame.Surface) -> None:
+    def _draw_notation(self, surface: pygame.Surface) -> None:
         """
         Draw board notation (ranks and files).
         
         Args:
-            screen: Pygame surface to draw on
+            surface: Board-sized surface to draw on
         """
         # Draw file notation (a-h)
         for col in range(8):
@@ -287,11 +494,10 @@ class BoardView:
             color = self.NOTATION_DARK if is_light_square else self.NOTATION_LIGHT
             
             # Draw at bottom of board
-            x = self.offset_x + col * self.square_size + self.square_size - 12
-            y = self.offset_y + self.board_size - 12
+            x = col * self.square_size + self.square_size - 12
+            y = self.board_size - 12
             
-            text = self.notation_font.render(file_char, True, color)
-            screen.blit(text, (x, y))
+            surface.blit(self._render_glyph(file_char, color), (x, y))
         
         # Draw rank notation (1-8)
         for row in range(8):
@@ -304,11 +510,10 @@ class BoardView:
             color = self.NOTATION_DARK if is_light_square else self.NOTATION_LIGHT
             
             # Draw at left of board
-            x = self.offset_x + 4
-            y = self.offset_y + row * self.square_size + 4
+            x = 4
+            y = row * self.square_size + 4
             
-            text = self.notation_font.render(rank_num, True, color)
-            screen.blit(text, (x, y))
+            surface.blit(self._render_glyph(rank_num, color), (x, y))
     
     def _draw_pieces(self, screen: pygame.Surface, board) -> None:
         """
@@ -318,22 +523,40 @@ class BoardView:
             screen: Pygame surface to draw on
             board: Chess board object containing piece positions
         """
-        for row in range(8):
-            for col in range(8):
-                piece = board.get_piece_at(row, col)
+        # Rebuild the draw list only when the board has changed
+        version = getattr(board, "move_counter", None)
+        if version is None or board is not self._piece_list_board or version != self._piece_list_version:
+            self._piece_draw_list = self._build_piece_draw_list(board)
+            self._piece_list_board = board
+            self._piece_list_version = -1 if version is None else version
+        
+        # Draw all pieces in a single batched call
+        screen.blits(self._piece_draw_list, doreturn=False)
+    
+    def _build_piece_draw_list(self, board) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """
+        Resolve the image and screen position of every piece on the board.
+        
+        Args:
+            board: Chess board object containing piece positions
+            
+        Returns:
+            List of (image, screen position) pairs
+        """
+        draw_list = []
+        for row, board_row in enumerate(board.board):
+            for col, piece in enumerate(board_row):
                 if piece:
                     # Create piece code (e.g., 'wP' for white pawn)
-                    piece_code = ('w' if piece.color == 'w' else 'b') + piece.piece_type
+                    image = self.piece_images.get(piece.color + piece.piece_type)
                     
                     # Skip if image not found
-                    if piece_code not in self.piece_images:
+                    if image is None:
                         continue
                     
-                    # Get screen position
-                    screen_pos = self.get_screen_position((row, col))
-                    
-                    # Draw piece
-                    screen.blit(self.piece_images[piece_code], screen_pos)
+                    draw_list.append((image, self.get_screen_position((row, col))))
+        
+        return draw_list
     
     def draw_highlight(self, screen: pygame.Surface, pos: Tuple[int, int], color: Tuple) -> None:
         """
@@ -372,20 +595,7 @@ class BoardView:
             screen: Pygame surface to draw on
             pos: Board position (row, col)
         """
-        # Get screen position
-        x, y = self.get_screen_position(pos)
-        
-        # Draw a circle in the center of the square
-        center_x = x + self.square_size // 2
-        center_y = y + self.square_size // 2
-        radius = self.square_size // 6
-        
-        pygame.draw.circle(
-            screen,
-            (0, 0, 0, 128),  # Semi-transparent black
-            (center_x, center_y),
-            radius
-        )
+        screen.blit(self._move_indicator_surface, self.get_screen_position(pos))
     
     def draw_capture_indicator(self, screen: pygame.Surface, pos: Tuple[int, int]) -> None:
         """
@@ -395,17 +605,7 @@ class BoardView:
             screen: Pygame surface to draw on
             pos: Board position (row, col)
         """
-        # Get screen position
-        x, y = self.get_screen_position(pos)
-        
-        # Draw a circle around the square
-        rect = pygame.Rect(x, y, self.square_size, self.square_size)
-        pygame.draw.rect(
-            screen,
-            (255, 0, 0, 128),  # Semi-transparent red
-            rect,
-            width=3
-        )
+        screen.blit(self._capture_indicator_surface, self.get_screen_position(pos))
     
     def resize(self, board_size: int, offset_x: int, offset_y: int) -> None:
         """
@@ -420,9 +620,10 @@ class BoardView:
         self.square_size = board_size // 8
         self.offset_x = offset_x
         self.offset_y = offset_y
+        self._build_screen_pos_table()
         
-        # Reload piece images at new size
-        self.piece_images = self._load_piece_images()
+        # Rescale the already loaded piece images to the new size
+        self._rescale_piece_images()
         
         # Recreate highlight surfaces
         self.highlight_surface = pygame.Surface((self.square_size, self.square_size), pygame.SRCALPHA)
@@ -437,5 +638,14 @@ class BoardView:
         self.check_highlight_surface = pygame.Surface((self.square_size, self.square_size), pygame.SRCALPHA)
         self.check_highlight_surface.fill(self.CHECK_HIGHLIGHT)
         
+        # Recreate indicator surfaces
+        self._build_indicator_surfaces()
+        
         # Update font size
         self.notation_font = pygame.font.Font(None, max(14, self.square_size // 5))
+        self._glyph_cache.clear()
+        
+        # Rebuild the board background at the new size
+        self._build_background()
+        self._piece_list_version = -1
+        self._needs_full_redraw = True
@@ -5,14 +5,238 @@ Provides reusable UI components like buttons, labels, timers, and message boxes.
 """
 
 import time
+import functools
 import pygame
+import numpy as np
 from typing import Tuple, List, Dict, Optional, Callable, Any
 
+# Monotonic high-resolution clock used for timers and message timeouts
+_now = time.perf_counter
+
+# Pre-formatted "MM:SS" strings for the first hour
+_MMSS = [f"{seconds // 60:02d}:{seconds % 60:02d}" for seconds in range(3600)]
+
+
+def format_time(whole_seconds: int) -> str:
+    """
+    Format a whole number of seconds as "MM:SS".
+    
+    Args:
+        whole_seconds: Non-negative time in whole seconds
+        
+    Returns:
+        Formatted time string
+    """
+    if whole_seconds < 3600:
+        return _MMSS[whole_seconds]
+    minutes, seconds = divmod(whole_seconds, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+# Surface.fblits (pygame-ce) skips building the list of dirty rects that blits() returns
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+
+def blit_batch(surface: pygame.Surface, blits: List[Tuple[pygame.Surface, Any]]) -> None:
+    """
+    Blit a sequence of (surface, destination) pairs in one call.
+    
+    Args:
+        surface: Surface to draw on
+        blits: Pairs to draw, back to front
+    """
+    if _HAS_FBLITS:
+        surface.fblits(blits)
+    else:
+        surface.blits(blits, doreturn=False)
+
+
+def draw_all(surface: pygame.Surface, components: List[Any]) -> None:
+    """
+    Draw several components, batching their blits into as few calls as possible.
+    
+    Components that expose blit_pairs() are collected into one batched blit;
+    any other component is drawn with its own draw() in its original order.
+    
+    Args:
+        surface: Surface to draw on
+        components: Components to draw, back to front
+    """
+    batch = []
+    for component in components:
+        blit_pairs = getattr(component, "blit_pairs", None)
+        if blit_pairs is None:
+            if batch:
+                blit_batch(surface, batch)
+                batch = []
+            component.draw(surface)
+        else:
+            batch.extend(blit_pairs())
+    
+    if batch:
+        blit_batch(surface, batch)
+
+
+@functools.lru_cache(maxsize=32)
+def get_font(name: Optional[str], size: int) -> pygame.font.Font:
+    """
+    Get a font, sharing one instance per (name, size) across all widgets.
+    
+    Args:
+        name: Font file name (None for the default font)
+        size: Font size
+        
+    Returns:
+        Shared font object
+    """
+    return pygame.font.Font(name, size)
+
+
+@functools.lru_cache(maxsize=256)
+def render_text(text: str, font: pygame.font.Font,
+                color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Render antialiased text, reusing the surface for repeated strings.
+    
+    The returned surface is shared between callers and must not be drawn on.
+    
+    Args:
+        text: Text to render
+        font: Font to render with
+        color: Text color
+        
+    Returns:
+        Rendered text surface
+    """
+    return font.render(text, True, color)
+
+
+def _slider_value(x: int, rect_x: int, rect_width: int,
+                  min_value: float, max_value: float) -> float:
+    """
+    Map a screen x coordinate onto a slider's value range.
+    
+    Args:
+        x: X position
+        rect_x: Slider left edge
+        rect_width: Slider width
+        min_value: Minimum value
+        max_value: Maximum value
+        
+    Returns:
+        Slider value, clamped to the range
+    """
+    position = max(0, min(1, (x - rect_x) / rect_width))
+    return min_value + position * (max_value - min_value)
+
+
+def _slider_handle_x(value: float, min_value: float, max_value: float,
+                     rect_x: int, rect_width: int, handle_width: int) -> int:
+    """
+    Compute the screen x coordinate of a slider handle for a value.
+    
+    Args:
+        value: Slider value
+        min_value: Minimum value
+        max_value: Maximum value
+        rect_x: Slider left edge
+        rect_width: Slider width
+        handle_width: Handle width
+        
+    Returns:
+        Handle left edge
+    """
+    value_range = max_value - min_value
+    position = 0 if value_range == 0 else (value - min_value) / value_range
+    return rect_x + int(position * (rect_width - handle_width))
+
+
+def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Convert a surface to the display's pixel format so blits take SDL's fast path.
+    
+    Args:
+        surface: Surface to convert
+        
+    Returns:
+        Converted surface, or the original if no display has been created yet
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def _slider_value_int(x: int, rect_x: int, rect_width: int,
+                      min_value: int, max_value: int) -> int:
+    """
+    Map a screen x coordinate onto an integer slider's range using integer math.
+    
+    Args:
+        x: X position
+        rect_x: Slider left edge
+        rect_width: Slider width
+        min_value: Minimum value
+        max_value: Maximum value
+        
+    Returns:
+        Slider value, clamped to the range
+    """
+    offset = max(0, min(rect_width, x - rect_x))
+    return min_value + offset * (max_value - min_value) // rect_width
+
+
+def _slider_handle_x_int(value: int, min_value: int, max_value: int,
+                         rect_x: int, rect_width: int, handle_width: int) -> int:
+    """
+    Compute the screen x coordinate of an integer slider's handle using integer math.
+    
+    Args:
+        value: Slider value
+        min_value: Minimum value
+        max_value: Maximum value
+        rect_x: Slider left edge
+        rect_width: Slider width
+        handle_width: Handle width
+        
+    Returns:
+        Handle left edge
+    """
+    value_range = max_value - min_value
+    if value_range == 0:
+        return rect_x
+    return rect_x + (value - min_value) * (rect_width - handle_width) // value_range
+
+
+def _render_box(size: Tuple[int, int], color: Tuple[int, int, int],
+                border_color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Pre-render a filled box with a 2px border.
+    
+    Args:
+        size: Box size (width, height)
+        color: Fill color
+        border_color: Border color
+        
+    Returns:
+        Rendered box surface
+    """
+    box = pygame.Surface(size)
+    box.fill(color)
+    pygame.draw.rect(box, border_color, box.get_rect(), 2)
+    return _to_display_format(box)
+
 class Button:
     """
     Interactive button component.
     """
     
+    # Instance attributes (no per-instance __dict__)
+    __slots__ = (
+        'rect', '_text', 'on_click_handler', 'font', '_enabled', '_hovered', '_active', '_text_cache',
+        '_l', '_t', '_r', '_b', '_dirty', '_cached_surface', '_cached_blits'
+    )
+    
     # Colors
     NORMAL_BG = (70, 70, 70)
     HOVER_BG = (100, 100, 100)
@@ -22,6 +246,17 @@ class Button:
     DISABLED_BG = (50, 50, 50)
     DISABLED_TEXT = (150, 150, 150)
     
+    # (background, text) colors indexed by (not enabled) << 2 | active << 1 | hovered
+    _STATE_COLORS = (
+        (NORMAL_BG, TEXT_COLOR),
+        (HOVER_BG, TEXT_COLOR),
+        (ACTIVE_BG, TEXT_COLOR),
+        (ACTIVE_BG, TEXT_COLOR),
+    ) + ((DISABLED_BG, DISABLED_TEXT),) * 4
+    
+    # Pre-rendered backgrounds keyed by (size, fill color), shared by all buttons
+    _bg_variants: Dict[Tuple[Tuple[int, int], Tuple[int, int, int]], pygame.Surface] = {}
+    
     def __init__(self, x: int, y: int, width: int, height: int, 
                  text: str, on_click: Callable = None, 
                  font_size: int = 24, enabled: bool = True):
@@ -39,12 +274,65 @@ class Button:
             enabled: Whether the button is enabled
         """
         self.rect = pygame.Rect(x, y, width, height)
-        self.text = text
+        self._update_bounds()
+        self._text = text
         self.on_click_handler = on_click
-        self.font = pygame.font.Font(None, font_size)
-        self.enabled = enabled
-        self.hovered = False
-        self.active = False
+        self.font = get_font(None, font_size)
+        self._enabled = enabled
+        self._hovered = False
+        self._active = False
+        
+        # Rendered text surfaces and their centered rects, keyed by (text, enabled)
+        self._text_cache: Dict[Tuple[str, bool], Tuple[pygame.Surface, pygame.Rect]] = {}
+        
+        # Last rendered appearance, reused until a state change marks the button dirty
+        self._dirty = True
+        self._cached_surface: Optional[pygame.Surface] = None
+        self._cached_blits: List[Tuple[pygame.Surface, pygame.Rect]] = []
+    
+    @property
+    def text(self) -> str:
+        """Button text."""
+        return self._text
+    
+    @text.setter
+    def text(self, text: str) -> None:
+        if text != self._text:
+            self._text = text
+            self._dirty = True
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether the button is enabled."""
+        return self._enabled
+    
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        if enabled != self._enabled:
+            self._enabled = enabled
+            self._dirty = True
+    
+    @property
+    def hovered(self) -> bool:
+        """Whether the mouse is over the button."""
+        return self._hovered
+    
+    @hovered.setter
+    def hovered(self, hovered: bool) -> None:
+        if hovered != self._hovered:
+            self._hovered = hovered
+            self._dirty = True
+    
+    @property
+    def active(self) -> bool:
+        """Whether the button is shown as active."""
+        return self._active
+    
+    @active.setter
+    def active(self, active: bool) -> None:
+        if active != self._active:
+            self._active = active
+            self._dirty = True
     
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -53,27 +341,55 @@ class Button:
         Args:
             surface: Surface to draw on
         """
-        # Determine button color
-        if not self.enabled:
-            color = self.DISABLED_BG
-        elif self.active:
-            color = self.ACTIVE_BG
-        elif self.hovered:
-            color = self.HOVER_BG
-        else:
-            color = self.NORMAL_BG
+        blit_batch(surface, self.blit_pairs())
+    
+    def blit_pairs(self) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Get the (surface, rect) pairs that make up the button's current appearance.
         
-        # Draw button background
-        pygame.draw.rect(surface, color, self.rect)
+        Returns:
+            Blits in drawing order: one composite when the text fits the button,
+            otherwise background then text
+        """
+        if self._dirty:
+            self._cached_blits = self._render()
+            self._dirty = False
+        return self._cached_blits
+    
+    def _render(self) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Compose the button's appearance for its current state.
         
-        # Draw border
-        pygame.draw.rect(surface, self.BORDER_COLOR, self.rect, 2)
+        Returns:
+            Blits in drawing order
+        """
+        # Determine button colors
+        color, text_color = self._STATE_COLORS[(not self.enabled) << 2 | bool(self.active) << 1 | bool(self.hovered)]
+        
+        # Button background with border
+        bg_key = (self.rect.size, color)
+        background = Button._bg_variants.get(bg_key)
+        if background is None:
+            background = _render_box(self.rect.size, color, self.BORDER_COLOR)
+            Button._bg_variants[bg_key] = background
+        
+        # Button text
+        key = (self.text, self.enabled)
+        cached = self._text_cache.get(key)
+        if cached is None:
+            text_surface = self.font.render(self.text, True, text_color)
+            cached = (text_surface, text_surface.get_rect(center=self.rect.center))
+            self._text_cache[key] = cached
+        
+        # Flatten background and text into one surface unless the text overflows the button
+        text_surface, text_rect = cached
+        if not self.rect.contains(text_rect):
+            self._cached_surface = None
+            return [(background, self.rect), cached]
         
-        # Draw text
-        text_color = self.DISABLED_TEXT if not self.enabled else self.TEXT_COLOR
-        text_surface = self.font.render(self.text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        self._cached_surface = background.copy()
+        self._cached_surface.blit(text_surface, text_rect.move(-self.rect.x, -self.rect.y))
+        return [(self._cached_surface, self.rect)]
     
     def update(self, mouse_pos: Tuple[int, int]) -> None:
         """
@@ -83,7 +399,8 @@ class Button:
             mouse_pos: Current mouse position
         """
         if self.enabled:
-            self.hovered = self.rect.collidepoint(mouse_pos)
+            mx, my = mouse_pos
+            self.hovered = self._l <= mx < self._r and self._t <= my < self._b
     
     def is_clicked(self, mouse_pos: Tuple[int, int]) -> bool:
         """
@@ -95,9 +412,8 @@ class Button:
         Returns:
             True if button is clicked, False otherwise
         """
-        if self.enabled and self.rect.collidepoint(mouse_pos):
-            return True
-        return False
+        mx, my = mouse_pos
+        return self.enabled and self._l <= mx < self._r and self._t <= my < self._b
     
     def on_click(self) -> None:
         """Handle button click."""
@@ -111,6 +427,8 @@ class Button:
         Args:
             text: New button text
         """
+        if text != self._text:
+            self._text_cache.clear()
         self.text = text
     
     def set_enabled(self, enabled: bool) -> None:
@@ -121,6 +439,26 @@ class Button:
             enabled: Whether the button should be enabled
         """
         self.enabled = enabled
+    
+    def set_position(self, x: int, y: int) -> None:
+        """
+        Move the button.
+        
+        Args:
+            x: New X position
+            y: New Y position
+        """
+        self.rect.topleft = (x, y)
+        self._update_bounds()
+        self._text_cache.clear()
+        self._dirty = True
+    
+    def _update_bounds(self) -> None:
+        """Cache the button edges for hit-testing."""
+        self._l = self.rect.x
+        self._t = self.rect.y
+        self._r = self._l + self.rect.width
+        self._b = self._t + self.rect.height
 
 
 class Label:
@@ -128,9 +466,18 @@ class Label:
     Text label component.
     """
     
+    # Instance attributes (no per-instance __dict__)
+    __slots__ = (
+        'x', 'y', 'text', 'font', 'color', 'align', 'text_surface', 'rect', '_anchor',
+        '_dirty'
+    )
+    
     # Default colors
     DEFAULT_COLOR = (255, 255, 255)
     
+    # Rect attribute that (x, y) is assigned to for each alignment
+    _ANCHORS = {"left": "topleft", "center": "midtop", "right": "topright"}
+    
     def __init__(self, x: int, y: int, text: str, font: pygame.font.Font, 
                  color: Tuple[int, int, int] = None, align: str = "left"):
         """
@@ -150,22 +497,22 @@ class Label:
         self.font = font
         self.color = color or self.DEFAULT_COLOR
         self.align = align
+        self._anchor = self._ANCHORS.get(align)
         
         # Create initial text surface
-        self.text_surface = self.font.render(self.text, True, self.color)
+        self._render()
+    
+    def _render(self) -> None:
+        """Re-render the text surface and reposition it."""
+        self.text_surface = render_text(self.text, self.font, self.color)
         self.rect = self.text_surface.get_rect()
-        
-        # Set position based on alignment
         self._update_position()
+        self._dirty = False
     
     def _update_position(self) -> None:
         """Update text position based on alignment."""
-        if self.align == "left":
-            self.rect.topleft = (self.x, self.y)
-        elif self.align == "center":
-            self.rect.midtop = (self.x, self.y)
-        elif self.align == "right":
-            self.rect.topright = (self.x, self.y)
+        if self._anchor is not None:
+            setattr(self.rect, self._anchor, (self.x, self.y))
     
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -174,8 +521,21 @@ class Label:
         Args:
             surface: Surface to draw on
         """
+        if self._dirty:
+            self._render()
         surface.blit(self.text_surface, self.rect)
     
+    def blit_pairs(self) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Get the (surface, rect) pairs that make up the label.
+        
+        Returns:
+            Text blit
+        """
+        if self._dirty:
+            self._render()
+        return [(self.text_surface, self.rect)]
+    
     def set_text(self, text: str) -> None:
         """
         Set label text.
@@ -183,10 +543,10 @@ class Label:
         Args:
             text: New label text
         """
-        self.text = text
-        self.text_surface = self.font.render(self.text, True, self.color)
-        self.rect = self.text_surface.get_rect()
-        self._update_position()
+        # Rendering waits until the next draw, so repeated updates cost one render
+        if text != self.text:
+            self.text = text
+            self._dirty = True
     
     def set_color(self, color: Tuple[int, int, int]) -> None:
         """
@@ -195,8 +555,9 @@ class Label:
         Args:
             color: New text color
         """
-        self.color = color
-        self.text_surface = self.font.render(self.text, True, self.color)
+        if color != self.color:
+            self.color = color
+            self._dirty = True
     
     def set_position(self, x: int, y: int) -> None:
         """
@@ -216,6 +577,11 @@ class Timer:
     Chess clock timer.
     """
     
+    # Instance attributes (no per-instance __dict__)
+    __slots__ = (
+        'time_remaining', 'running', 'start_time', '_last_sec', '_last_str'
+    )
+    
     def __init__(self, initial_time: float):
         """
         Initialize a timer.
@@ -226,17 +592,21 @@ class Timer:
         self.time_remaining = initial_time
         self.running = False
         self.start_time = 0
+        
+        # Last formatted value, reused until the displayed second changes
+        self._last_sec = None
+        self._last_str = ""
     
     def start(self) -> None:
         """Start the timer."""
         if not self.running:
             self.running = True
-            self.start_time = time.time()
+            self.start_time = _now()
     
     def stop(self) -> None:
         """Stop the timer."""
         if self.running:
-            self.time_remaining -= (time.time() - self.start_time)
+            self.time_remaining -= (_now() - self.start_time)
             self.running = False
     
     def reset(self, new_time: float = None) -> None:
@@ -258,7 +628,7 @@ class Timer:
             Time remaining in seconds
         """
         if self.running:
-            return max(0, self.time_remaining - (time.time() - self.start_time))
+            return max(0, self.time_remaining - (_now() - self.start_time))
         return max(0, self.time_remaining)
     
     def get_formatted_time(self) -> str:
@@ -268,10 +638,11 @@ class Timer:
         Returns:
             Formatted time string
         """
-        time_seconds = self.get_time()
-        minutes = int(time_seconds // 60)
-        seconds = int(time_seconds % 60)
-        return f"{minutes:02d}:{seconds:02d}"
+        whole_seconds = int(self.get_time())
+        if whole_seconds != self._last_sec:
+            self._last_sec = whole_seconds
+            self._last_str = format_time(whole_seconds)
+        return self._last_str
     
     def add_time(self, seconds: float) -> None:
         """
@@ -288,6 +659,11 @@ class MessageBox:
     Message box for displaying notifications.
     """
     
+    # Instance attributes (no per-instance __dict__)
+    __slots__ = (
+        'rect', 'font', 'message', 'visible', 'timeout', 'start_time', '_composite', 'bg_surface'
+    )
+    
     # Colors
     BG_COLOR = (50, 50, 50, 220)  # Semi-transparent dark gray
     BORDER_COLOR = (200, 200, 200)
@@ -312,9 +688,13 @@ class MessageBox:
         self.timeout = 0
         self.start_time = 0
         
+        # Background, border and message text pre-rendered by show()
+        self._composite: Optional[pygame.Surface] = None
+        
         # Create background surface
         self.bg_surface = pygame.Surface((width, height), pygame.SRCALPHA)
         self.bg_surface.fill(self.BG_COLOR)
+        self.bg_surface = _to_display_format(self.bg_surface)
     
     def show(self, message: str, timeout: float = 0) -> None:
         """
@@ -327,16 +707,18 @@ class MessageBox:
         self.message = message
         self.visible = True
         self.timeout = timeout
-        self.start_time = time.time() if timeout > 0 else 0
+        self.start_time = _now() if timeout > 0 else 0
+        self._composite = self._render_composite()
     
     def hide(self) -> None:
         """Hide the message box."""
         self.visible = False
+        self._composite = None
     
     def update(self) -> None:
         """Update message box state."""
         if self.visible and self.timeout > 0:
-            if time.time() - self.start_time >= self.timeout:
+            if _now() - self.start_time >= self.timeout:
                 self.visible = False
     
     def draw(self, surface: pygame.Surface) -> None:
@@ -349,35 +731,59 @@ class MessageBox:
         if not self.visible:
             return
         
-        # Draw background
-        surface.blit(self.bg_surface, self.rect)
+        if self._composite is None:
+            self._composite = self._render_composite()
+        
+        surface.blit(self._composite, self.rect)
+    
+    def _render_composite(self) -> pygame.Surface:
+        """
+        Render the background, border and every message line into one surface.
+        
+        Returns:
+            Box-sized surface ready to blit at self.rect
+        """
+        composite = self.bg_surface.copy()
         
         # Draw border
-        pygame.draw.rect(surface, self.BORDER_COLOR, self.rect, 2)
+        pygame.draw.rect(composite, self.BORDER_COLOR, composite.get_rect(), 2)
         
-        # Draw message text
+        # Draw message text, centered on the box
         lines = self.message.split('\n')
         line_height = self.font.get_height()
         total_height = line_height * len(lines)
-        start_y = self.rect.centery - total_height // 2
+        start_y = self.rect.height // 2 - total_height // 2
+        center_x = self.rect.width // 2
         
         for i, line in enumerate(lines):
             text_surface = self.font.render(line, True, self.TEXT_COLOR)
-            text_rect = text_surface.get_rect(center=(self.rect.centerx, start_y + i * line_height))
-            surface.blit(text_surface, text_rect)
-
+            text_rect = text_surface.get_rect(center=(center_x, start_y + i * line_height))
+            composite.blit(text_surface, text_rect)
+        
+        return _to_display_format(composite)
 
 class Dropdown:
     """
     Dropdown menu component.
     """
     
+    # Instance attributes (no per-instance __dict__)
+    __slots__ = (
+        'rect', '_header_bounds', 'options', 'on_select_handler', 'font', 'selected_index',
+        'expanded', 'hovered_index', '_bg_surface', '_hover_bg_surface', '_option_backgrounds',
+        '_header', '_rects', '_opt_bounds', '_rect_rows', '_option_layout', '_option_surfaces',
+        '_header_text_blits'
+    )
+    
     # Colors
     BG_COLOR = (70, 70, 70)
     HOVER_BG = (100, 100, 100)
     TEXT_COLOR = (255, 255, 255)
     BORDER_COLOR = (40, 40, 40)
     
+    # Option count from which hit-testing switches to NumPy
+    VECTORIZE_MIN_OPTIONS = 8
+    
     def __init__(self, x: int, y: int, width: int, height: int, 
                  options: List[str], on_select: Callable = None, 
                  font_size: int = 24):
@@ -394,19 +800,103 @@ class Dropdown:
             font_size: Font size for options
         """
         self.rect = pygame.Rect(x, y, width, height)
+        self._header_bounds = (x, y, x + width, y + height)
         self.options = options
         self.on_select_handler = on_select
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(None, font_size)
         self.selected_index = 0
         self.expanded = False
         self.hovered_index = -1
         
-        # Create option rects
-        self.option_rects = []
-        for i in range(len(options)):
-            self.option_rects.append(
-                pygame.Rect(x, y + height * (i + 1), width, height)
-            )
+        # Pre-rendered normal and hovered backgrounds (header and options share a size)
+        self._bg_surface = _render_box(self.rect.size, self.BG_COLOR, self.BORDER_COLOR)
+        self._hover_bg_surface = _render_box(self.rect.size, self.HOVER_BG, self.BORDER_COLOR)
+        self._option_backgrounds = (self._bg_surface, self._hover_bg_surface)
+        
+        # Collapsed header: background, border and arrow in one surface
+        self._header = self._bg_surface.copy()
+        arrow_points = [
+            (width - 20, height // 2 - 5),
+            (width - 10, height // 2 + 5),
+            (width - 30, height // 2 + 5)
+        ]
+        pygame.draw.polygon(self._header, self.TEXT_COLOR, arrow_points)
+        
+        # Option geometry and rendered labels
+        self._build_options()
+    
+    def _build_options(self) -> None:
+        """Lay out and render every option; called whenever the options change."""
+        x, y, width, height = self.rect
+        count = len(self.options)
+        
+        # Option rects as (x, y, width, height) rows, stacked below the header
+        self._rects = np.empty((count, 4), dtype=np.int32)
+        self._rects[:, 0] = x
+        self._rects[:, 1] = y + height * np.arange(1, count + 1)
+        self._rects[:, 2] = width
+        self._rects[:, 3] = height
+        
+        # Derived views of the option rects, built on first use
+        self._opt_bounds: Optional[np.ndarray] = None
+        self._rect_rows: Optional[List[List[int]]] = None
+        
+        # Option (position, text blit) pairs for the expanded list, built on first draw
+        self._option_layout: Optional[List[Tuple[Tuple[int, int], Tuple[pygame.Surface, pygame.Rect]]]] = None
+        
+        # Rendered option labels, one per option
+        self._option_surfaces = [self.font.render(option, True, self.TEXT_COLOR) for option in self.options]
+        
+        # Option labels centered on the header, one per option
+        self._header_text_blits = [
+            (text_surface, text_surface.get_rect(center=self.rect.center))
+            for text_surface in self._option_surfaces
+        ]
+    
+    def set_options(self, options: List[str]) -> None:
+        """
+        Replace the list of options.
+        
+        The current selection is kept if it is still among the new options.
+        
+        Args:
+            options: New list of options
+        """
+        selected = self.get_selected() if self.options else None
+        self.options = options
+        self.selected_index = options.index(selected) if selected in options else 0
+        self.hovered_index = -1
+        self._build_options()
+    
+    @property
+    def option_rects(self) -> List[pygame.Rect]:
+        """Option rects as pygame Rects."""
+        return [pygame.Rect(row) for row in self._get_rect_rows()]
+    
+    def _get_rect_rows(self) -> List[List[int]]:
+        """
+        Get the option rects as plain (x, y, width, height) lists for Python loops.
+        
+        Returns:
+            One [x, y, width, height] list per option
+        """
+        if self._rect_rows is None:
+            self._rect_rows = self._rects.tolist()
+        return self._rect_rows
+    
+    def _get_opt_bounds(self) -> np.ndarray:
+        """
+        Get the option bounds as (left, top, right, bottom) rows for vectorized hit-testing.
+        
+        Returns:
+            int32 array of shape (N, 4)
+        """
+        if self._opt_bounds is None:
+            rects = self._rects
+            self._opt_bounds = np.column_stack(
+                (rects[:, 0], rects[:, 1], rects[:, 0] + rects[:, 2], rects[:, 1] + rects[:, 3])
+            ).astype(np.int32)
+        return self._opt_bounds
     
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -415,32 +905,34 @@ class Dropdown:
         Args:
             surface: Surface to draw on
         """
-        # Draw selected option
-        pygame.draw.rect(surface, self.BG_COLOR, self.rect)
-        pygame.draw.rect(surface, self.BORDER_COLOR, self.rect, 2)
-        
-        text_surface = self.font.render(self.options[self.selected_index], True, self.TEXT_COLOR)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
-        
-        # Draw dropdown arrow
-        arrow_points = [
-            (self.rect.right - 20, self.rect.centery - 5),
-            (self.rect.right - 10, self.rect.centery + 5),
-            (self.rect.right - 30, self.rect.centery + 5)
-        ]
-        pygame.draw.polygon(surface, self.TEXT_COLOR, arrow_points)
+        # Draw header with the selected option
+        surface.blits(((self._header, self.rect), self._header_text_blits[self.selected_index]), doreturn=False)
         
         # Draw options if expanded
         if self.expanded:
-            for i, rect in enumerate(self.option_rects):
-                color = self.HOVER_BG if i == self.hovered_index else self.BG_COLOR
-                pygame.draw.rect(surface, color, rect)
-                pygame.draw.rect(surface, self.BORDER_COLOR, rect, 2)
-                
-                text_surface = self.font.render(self.options[i], True, self.TEXT_COLOR)
-                text_rect = text_surface.get_rect(center=rect.center)
-                surface.blit(text_surface, text_rect)
+            if self._option_layout is None:
+                self._option_layout = self._build_option_layout()
+            
+            option_blits = []
+            backgrounds = self._option_backgrounds
+            hovered_index = self.hovered_index
+            for i, (position, text_blit) in enumerate(self._option_layout):
+                option_blits.append((backgrounds[i == hovered_index], position))
+                option_blits.append(text_blit)
+            surface.blits(option_blits, doreturn=False)
+    
+    def _build_option_layout(self) -> List[Tuple[Tuple[int, int], Tuple[pygame.Surface, pygame.Rect]]]:
+        """
+        Position every option's background and centered label once.
+        
+        Returns:
+            One (background position, (text surface, text rect)) pair per option
+        """
+        layout = []
+        for (x, y, width, height), text_surface in zip(self._get_rect_rows(), self._option_surfaces):
+            text_rect = text_surface.get_rect(center=(x + width // 2, y + height // 2))
+            layout.append(((x, y), (text_surface, text_rect)))
+        return layout
     
     def update(self, mouse_pos: Tuple[int, int]) -> None:
         """
@@ -450,11 +942,30 @@ class Dropdown:
             mouse_pos: Current mouse position
         """
         if self.expanded:
-            self.hovered_index = -1
-            for i, rect in enumerate(self.option_rects):
-                if rect.collidepoint(mouse_pos):
-                    self.hovered_index = i
-                    break
+            self.hovered_index = self._option_index_at(mouse_pos)
+    
+    def _option_index_at(self, mouse_pos: Tuple[int, int]) -> int:
+        """
+        Find the option under the mouse.
+        
+        Args:
+            mouse_pos: Mouse position
+            
+        Returns:
+            Index of the option under the mouse, or -1 if none
+        """
+        mx, my = mouse_pos
+        
+        # A plain loop is cheaper than NumPy dispatch for short lists
+        if len(self._rects) < self.VECTORIZE_MIN_OPTIONS:
+            for i, (x, y, width, height) in enumerate(self._get_rect_rows()):
+                if x <= mx < x + width and y <= my < y + height:
+                    return i
+            return -1
+        
+        bounds = self._get_opt_bounds()
+        mask = (bounds[:, 0] <= mx) & (mx < bounds[:, 2]) & (bounds[:, 1] <= my) & (my < bounds[:, 3])
+        return int(np.argmax(mask)) if mask.any() else -1
     
     def handle_click(self, mouse_pos: Tuple[int, int]) -> bool:
         """
@@ -466,18 +977,20 @@ class Dropdown:
         Returns:
             True if click was handled, False otherwise
         """
-        if self.rect.collidepoint(mouse_pos):
+        mx, my = mouse_pos
+        left, top, right, bottom = self._header_bounds
+        if left <= mx < right and top <= my < bottom:
             self.expanded = not self.expanded
             return True
         
         if self.expanded:
-            for i, rect in enumerate(self.option_rects):
-                if rect.collidepoint(mouse_pos):
-                    self.selected_index = i
-                    self.expanded = False
-                    if self.on_select_handler:
-                        self.on_select_handler(self.options[i])
-                    return True
+            i = self._option_index_at(mouse_pos)
+            if i != -1:
+                self.selected_index = i
+                self.expanded = False
+                if self.on_select_handler:
+                    self.on_select_handler(self.options[i])
+                return True
             
             # Click outside dropdown should close it
             self.expanded = False
@@ -510,6 +1023,14 @@ class Slider:
     Slider control component.
     """
     
+    # Instance attributes (no per-instance __dict__)
+    __slots__ = (
+        'rect', '_track_bounds', 'min_value', 'max_value', 'value', 'on_change_handler', 'label',
+        'font', 'active', 'handle_width', 'handle_rect', '_handle_bounds', '_dirty', '_cached_surface',
+        '_cached_pos', '_track_surface', '_track_pos', '_label_blit', '_value_text', '_value_blit',
+        '_int_mode'
+    )
+    
     # Colors
     BG_COLOR = (70, 70, 70)
     HANDLE_COLOR = (200, 200, 200)
@@ -517,6 +1038,9 @@ class Slider:
     TRACK_COLOR = (100, 100, 100)
     TEXT_COLOR = (255, 255, 255)
     
+    # Handle colors indexed by active state
+    _HANDLE_COLORS = (HANDLE_COLOR, ACTIVE_HANDLE_COLOR)
+    
     def __init__(self, x: int, y: int, width: int, height: int, 
                  min_value: float, max_value: float, initial_value: float = None,
                  on_change: Callable = None, label: str = ""):
@@ -535,14 +1059,39 @@ class Slider:
             label: Slider label
         """
         self.rect = pygame.Rect(x, y, width, height)
+        self._track_bounds = (x, y, x + width, y + height)
         self.min_value = min_value
         self.max_value = max_value
         self.value = initial_value if initial_value is not None else min_value
         self.on_change_handler = on_change
+        
+        # Integer bounds and start value keep the slider on whole numbers with integer math
+        self._int_mode = all(
+            isinstance(v, int) and not isinstance(v, bool)
+            for v in (min_value, max_value, self.value)
+        )
         self.label = label
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(None, 24)
         self.active = False
         
+        # Last rendered appearance, reused until the value or active state changes
+        self._dirty = True
+        self._cached_surface: Optional[pygame.Surface] = None
+        self._cached_pos = (x, y)
+        
+        # Static track and label, rendered once
+        self._track_surface = _to_display_format(pygame.Surface((width, 4)))
+        self._track_surface.fill(self.TRACK_COLOR)
+        self._track_pos = (x, self.rect.centery - 2)
+        self._label_blit = None
+        if label:
+            label_surface = self.font.render(label, True, self.TEXT_COLOR)
+            self._label_blit = (label_surface, label_surface.get_rect(bottomleft=(x, y - 5)))
+        
+        # Value text, re-rendered only when the displayed value changes
+        self._value_text = None
+        self._value_blit = None
+        
         # Calculate handle position
         self.handle_width = max(height, 16)
         self.handle_rect = pygame.Rect(0, 0, self.handle_width, height + 4)
@@ -550,15 +1099,19 @@ class Slider:
     
     def _update_handle_position(self) -> None:
         """Update handle position based on current value."""
-        value_range = self.max_value - self.min_value
-        if value_range == 0:
-            position = 0
-        else:
-            position = (self.value - self.min_value) / value_range
-        
-        handle_x = self.rect.x + int(position * (self.rect.width - self.handle_width))
-        self.handle_rect.x = handle_x
+        handle_x = _slider_handle_x_int if self._int_mode else _slider_handle_x
+        self.handle_rect.x = handle_x(
+            self.value, self.min_value, self.max_value,
+            self.rect.x, self.rect.width, self.handle_width
+        )
         self.handle_rect.centery = self.rect.centery
+        
+        # Cache the handle edges for hit-testing
+        self._handle_bounds = (
+            self.handle_rect.x, self.handle_rect.y,
+            self.handle_rect.right, self.handle_rect.bottom
+        )
+        self._dirty = True
     
     def _update_value_from_position(self, x: int) -> None:
         """
@@ -567,9 +1120,9 @@ class Slider:
         Args:
             x: X position
         """
-        position = max(0, min(1, (x - self.rect.x) / self.rect.width))
         old_value = self.value
-        self.value = self.min_value + position * (self.max_value - self.min_value)
+        slider_value = _slider_value_int if self._int_mode else _slider_value
+        self.value = slider_value(x, self.rect.x, self.rect.width, self.min_value, self.max_value)
         
         # Call on_change handler if value changed
         if self.on_change_handler and self.value != old_value:
@@ -582,27 +1135,50 @@ class Slider:
         Args:
             surface: Surface to draw on
         """
+        if self._dirty:
+            self._cached_surface, self._cached_pos = self._render()
+            self._dirty = False
+        
+        surface.blit(self._cached_surface, self._cached_pos)
+    
+    def _render(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """
+        Render the track, handle, label and value into one transparent surface.
+        
+        Returns:
+            Rendered surface and the screen position to blit it at
+        """
+        track_rect = self._track_surface.get_rect(topleft=self._track_pos)
+        
+        # Render value, reusing the label
+        text_blits = []
+        if self._label_blit is not None:
+            text_blits.append(self._label_blit)
+        
+        value_text = f"{self.value:.1f}" if isinstance(self.value, float) else str(self.value)
+        if value_text != self._value_text:
+            value_surface = self.font.render(value_text, True, self.TEXT_COLOR)
+            self._value_blit = (value_surface, value_surface.get_rect(bottomright=(self.rect.right, self.rect.y - 5)))
+            self._value_text = value_text
+        text_blits.append(self._value_blit)
+        
+        # Size the surface to cover everything the slider draws
+        area = track_rect.unionall([self.handle_rect] + [rect for _, rect in text_blits])
+        composite = pygame.Surface(area.size, pygame.SRCALPHA)
+        offset = (-area.x, -area.y)
+        
         # Draw track
-        track_rect = pygame.Rect(
-            self.rect.x, self.rect.centery - 2,
-            self.rect.width, 4
-        )
-        pygame.draw.rect(surface, self.TRACK_COLOR, track_rect)
+        composite.blit(self._track_surface, track_rect.move(offset))
         
         # Draw handle
-        handle_color = self.ACTIVE_HANDLE_COLOR if self.active else self.HANDLE_COLOR
-        pygame.draw.rect(surface, handle_color, self.handle_rect, 0, 3)
+        handle_color = self._HANDLE_COLORS[self.active]
+        pygame.draw.rect(composite, handle_color, self.handle_rect.move(offset), 0, 3)
         
         # Draw label and value
-        if self.label:
-            label_surface = self.font.render(self.label, True, self.TEXT_COLOR)
-            label_rect = label_surface.get_rect(bottomleft=(self.rect.x, self.rect.y - 5))
-            surface.blit(label_surface, label_rect)
+        for text_surface, text_rect in text_blits:
+            composite.blit(text_surface, text_rect.move(offset))
         
-        value_text = f"{self.value:.1f}" if isinstance(self.value, float) else str(self.value)
-        value_surface = self.font.render(value_text, True, self.TEXT_COLOR)
-        value_rect = value_surface.get_rect(bottomright=(self.rect.right, self.rect.y - 5))
-        surface.blit(value_surface, value_rect)
+        return _to_display_format(composite), area.topleft
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
@@ -615,10 +1191,15 @@ class Slider:
             True if event was handled, False otherwise
         """
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.handle_rect.collidepoint(event.pos):
+            mx, my = event.pos
+            left, top, right, bottom = self._handle_bounds
+            if left <= mx < right and top <= my < bottom:
                 self.active = True
+                self._dirty = True
                 return True
-            elif self.rect.collidepoint(event.pos):
+            
+            left, top, right, bottom = self._track_bounds
+            if left <= mx < right and top <= my < bottom:
                 self._update_value_from_position(event.pos[0])
                 self._update_handle_position()
                 self.active = True
@@ -627,6 +1208,7 @@ class Slider:
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             if self.active:
                 self.active = False
+                self._dirty = True
                 return True
         
         elif event.type == pygame.MOUSEMOTION and self.active:
@@ -643,6 +1225,8 @@ class Slider:
         Args:
             value: New value
         """
+        if self._int_mode:
+            value = int(round(value))
         self.value = max(self.min_value, min(self.max_value, value))
         self._update_handle_position()
         
@@ -657,3 +1241,76 @@ class Slider:
             Current slider value
         """
         return self.value
+
+
+class UIManager:
+    """
+    Polls input once per frame and dispatches it to a set of widgets.
+    """
+    
+    # Instance attributes (no per-instance __dict__)
+    __slots__ = ('widgets', '_updaters', '_event_handlers')
+    
+    def __init__(self, widgets: Optional[List[Any]] = None):
+        """
+        Initialize the UI manager.
+        
+        Args:
+            widgets: Widgets to manage, in dispatch order
+        """
+        self.widgets = []
+        self._updaters = []
+        self._event_handlers = []
+        
+        for widget in widgets or ():
+            self.add(widget)
+    
+    def add(self, widget: Any) -> None:
+        """
+        Start dispatching input to a widget.
+        
+        Args:
+            widget: Widget with an update(mouse_pos) and/or handle_event(event) method
+        """
+        self.widgets.append(widget)
+        
+        # Resolve the bound methods once instead of on every frame
+        update = getattr(widget, "update", None)
+        if update is not None:
+            self._updaters.append(update)
+        handle_event = getattr(widget, "handle_event", None)
+        if handle_event is not None:
+            self._event_handlers.append(handle_event)
+    
+    def tick(self, event_types: Optional[List[int]] = None) -> List[pygame.event.Event]:
+        """
+        Poll the mouse and event queue once and dispatch to every widget.
+        
+        Widgets get update() with the mouse position, then each event is offered
+        to the widgets' handle_event() in order until one consumes it.
+        
+        Args:
+            event_types: Event types to pull from the queue; any others are
+                discarded (None pulls every event)
+            
+        Returns:
+            Events pulled from the queue, for the caller's own handling
+        """
+        pygame.event.pump()
+        mouse_pos = pygame.mouse.get_pos()
+        if event_types is None:
+            events = pygame.event.get(pump=False)
+        else:
+            events = pygame.event.get(event_types, pump=False)
+            pygame.event.clear(pump=False)
+        
+        for update in self._updaters:
+            update(mouse_pos)
+        
+        if self._event_handlers:
+            for event in events:
+                for handle_event in self._event_handlers:
+                    if handle_event(event):
+                        break
+        
+        return events
@@ -7,27 +7,124 @@ Handles the main game UI, rendering, and user interaction.
 from typing import Tuple, List, Dict, Optional, Any, Callable
 import sys
 import os
+import bisect
+import copy
+import math
 import time
 import random
 import pygame
+import numpy as np
 import logging
+from array import array
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from chess_engine.board import Board
-from chess_engine.move import Move
+from chess_engine.move import Move, MovePool
 from chess_engine.ai_minimax import ChessAI
+from chess_engine.ai_numba import PIECE_ORDER, encode_board
 from ui.board_view import BoardView
-from ui.components import Button, Label, Timer, MessageBox, Dropdown, Slider
+from ui.components import Button, Label, Timer, MessageBox, Dropdown, Slider, UIManager, blit_batch, format_time, render_text
 from iq.progress_tracker import ProgressTracker
+from iq.move_quality import encode_moves, score_moves
 from utils.config import load_config
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Square-name characters, indexed by column and by row (row 0 is rank 8)
+_FILES = tuple('abcdefgh')
+_RANKS = tuple('87654321')
+
+# Square names indexed by packed square (row * 8 + col)
+_SQUARE_NAMES = tuple(file + rank for rank in _RANKS for file in _FILES)
+
+# Side names ("white"/"black") to the piece color code and to the other side
+_PIECE_COLORS = {"white": 'w', "black": 'b'}
+_OTHER_SIDE = {"white": "black", "black": "white"}
+
+# Rank a pawn of each piece color promotes on
+_PROMOTION_ROWS = {'w': 0, 'b': 7}
+
+# Material values for the IQ scores (the king doesn't count for material advantage)
+_MATERIAL_VALUES = {'P': 1, 'N': 3, 'B': 3, 'R': 5, 'Q': 9, 'K': 0}
+
+# Material gained when a pawn promotes (the board always promotes to a queen)
+_PROMOTION_GAIN = _MATERIAL_VALUES['Q'] - _MATERIAL_VALUES['P']
+
+# Material values indexed by absolute piece code (see chess_engine.ai_numba)
+_MATERIAL_LUT = np.array([0] + [_MATERIAL_VALUES[piece_type] for piece_type in PIECE_ORDER], dtype=np.int16)
+
+
+# IQ adjustment for a finished game's result, as a function of AI difficulty
+_RESULT_ADJUSTMENTS = {
+    "win": lambda difficulty: 10 + difficulty * 2,
+    "loss": lambda difficulty: -15 - difficulty,
+    "draw": lambda difficulty: 5,
+}
+
+# IQ adjustment for the provisional game state
+_PROVISIONAL_ADJUSTMENTS = {"provisional_win": 5, "provisional_loss": -3}
+
+# Range IQ scores are clamped to
+_IQ_MIN, _IQ_MAX = 70, 150
+
+
+def _move_text(packed: int) -> str:
+    """
+    Format a packed move as "from → to" square names.
+    
+    Args:
+        packed: Move packed into a 16-bit integer (see Move.packed)
+        
+    Returns:
+        Move text, e.g. "e2 → e4"
+    """
+    return f"{_SQUARE_NAMES[packed & 0x3F]} → {_SQUARE_NAMES[(packed >> 6) & 0x3F]}"
+
+# Full circle in radians, for pie chart segments
+_TWO_PI = 2 * math.pi
+
+# IQ classification: _IQ_LABELS[i] applies from _IQ_THRESHOLDS[i - 1] up to _IQ_THRESHOLDS[i]
+_IQ_THRESHOLDS = (80, 90, 100, 110, 120, 130, 140)
+_IQ_LABELS = ("Needs Practice", "Beginner", "Novice", "Casual",
+              "Average", "Intermediate", "Advanced", "Genius")
+
 class GameUI:
     """
     Main game UI class that handles rendering and user interaction.
     """
     
+    # Posted when the AI search finishes or its minimum thinking time runs out
+    AI_MOVE_EVENT = pygame.event.custom_type()
+    
+    # Fixed step for game-state updates (clocks, message box timeout), independent of rendering
+    UPDATE_STEP = 1.0 / 30
+    
+    # Longest idle sleep between frames, so hover highlights still follow the mouse
+    IDLE_WAIT_MS = 100
+    
+    # Event types the game reacts to, and high-frequency ones it never needs
+    HANDLED_EVENTS = [
+        pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.WINDOWEXPOSED,
+        pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN,
+        AI_MOVE_EVENT
+    ]
+    BLOCKED_EVENTS = [
+        pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+        pygame.KEYUP, pygame.TEXTINPUT, pygame.TEXTEDITING,
+        pygame.ACTIVEEVENT, pygame.WINDOWENTER, pygame.WINDOWLEAVE,
+        pygame.WINDOWMOVED, pygame.WINDOWFOCUSGAINED, pygame.WINDOWFOCUSLOST,
+        pygame.AUDIODEVICEADDED, pygame.AUDIODEVICEREMOVED,
+        pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED
+    ]
+    
+    # Sounds chained on the move channel; the rest play on the event channel
+    MOVE_SOUNDS = frozenset(("move", "capture", "castle"))
+    
+    # Piece types shown in the stats screen's capture chart
+    STATS_PIECE_NAMES = {'P': 'Pawns', 'N': 'Knights', 'B': 'Bishops', 'R': 'Rooks', 'Q': 'Queen'}
+    
     def __init__(self, screen_size=(1200, 800)):
         """
         Initialize the game UI and pygame components.
@@ -35,7 +132,8 @@ class GameUI:
         Args:
             screen_size: Tuple of (width, height) for the screen
         """
-        # Initialize pygame
+        # Initialize pygame with a fixed 44.1 kHz 16-bit stereo mixer format
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
         pygame.init()
         pygame.display.set_caption("Chess IQ Analyzer")
         
@@ -49,6 +147,26 @@ class GameUI:
         self.SIDEBAR_X = self.BOARD_OFFSET_X + self.BOARD_SIZE + 20
         self.SIDEBAR_WIDTH = self.SCREEN_WIDTH - self.SIDEBAR_X - 20
         
+        # Screen areas around the board; the board itself is drawn opaque each frame
+        board_bottom = self.BOARD_OFFSET_Y + self.BOARD_SIZE
+        board_right = self.BOARD_OFFSET_X + self.BOARD_SIZE
+        self._background_rects = [
+            pygame.Rect(0, 0, self.SCREEN_WIDTH, self.BOARD_OFFSET_Y),
+            pygame.Rect(0, board_bottom, self.SCREEN_WIDTH, self.SCREEN_HEIGHT - board_bottom),
+            pygame.Rect(0, self.BOARD_OFFSET_Y, self.BOARD_OFFSET_X, self.BOARD_SIZE),
+            pygame.Rect(board_right, self.BOARD_OFFSET_Y, self.SCREEN_WIDTH - board_right, self.BOARD_SIZE)
+        ]
+        self._board_rect = pygame.Rect(self.BOARD_OFFSET_X, self.BOARD_OFFSET_Y, self.BOARD_SIZE, self.BOARD_SIZE)
+        
+        # What the last frame showed, so render() can redraw only the regions that changed
+        self._full_redraw = True
+        self._drawn_board_key = None
+        self._drawn_button_blits = None
+        self._drawn_label_blits = None
+        
+        # False while the window is minimized or hidden; rendering is skipped then
+        self._window_visible = True
+        
         # Load configuration
         self.config = load_config()
         
@@ -56,6 +174,16 @@ class GameUI:
         self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         self.clock = pygame.time.Clock()
         
+        # Keep high-frequency events we never handle out of the queue
+        pygame.event.set_blocked(self.BLOCKED_EVENTS)
+        
+        # Poll the event queue at most once per display refresh
+        self._event_interval = 1.0 / self._get_display_hz()
+        self._next_event_pump = time.monotonic()
+        
+        # Game state updates run on a fixed step
+        self._next_update = time.monotonic()
+        
         # Initialize board view
         self.board_view = BoardView(self.BOARD_SIZE, self.BOARD_OFFSET_X, self.BOARD_OFFSET_Y)
         
@@ -70,6 +198,19 @@ class GameUI:
         self.winner = None
         self.move_history = []
         
+        # The player's own moves from move_history, in order
+        self.player_move_history = []
+        
+        # Packed 16-bit form of each move in move_history, kept in step with it
+        self._packed_history = array('H')
+        
+        # Material per color, kept up to date by make_move/undo_move for _material_board
+        self._material = {'w': 0, 'b': 0}
+        self._material_board = None
+        
+        # Recycled Move objects for clicked and undone moves
+        self._move_pool = MovePool()
+        
         # AI - default to enabled
         self.ai_enabled = True
         self.ai_difficulty = 3
@@ -77,13 +218,25 @@ class GameUI:
         self.player_color = "white"
         self.ai = ChessAI(self.ai_difficulty)
         
+        # AI searches run on a worker thread so the UI keeps drawing and polling input
+        self._ai_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chess-ai")
+        self._ai_future: Optional[Future] = None
+        self._ai_search_key = None
+        self._ai_ready_at = 0.0
+        
         # Timers
         self.white_time = 10 * 60  # 10 minutes in seconds
         self.black_time = 10 * 60
         self.white_timer = Timer(self.white_time)
         self.black_timer = Timer(self.black_time)
         self.timer_active = True
-        self.last_time_update = time.time()
+        
+        # Each side's remaining time as of the start of the current turn
+        self._white_reserve = self._black_reserve = 600.0
+        self._turn_started_at = time.monotonic()
+        
+        # Whole seconds last shown on each clock label (-1 forces an update)
+        self._last_white_sec = self._last_black_sec = -1
         
         # Progress tracking
         self.progress_tracker = ProgressTracker()
@@ -95,6 +248,9 @@ class GameUI:
         self.message_box = None
         self._init_ui_elements()
         
+        # Stats screen static layout, built on first use
+        self._stats_static_cache = None
+        
         # Colors
         self.BG_COLOR = (40, 44, 52)
         self.HIGHLIGHT_COLOR = (124, 252, 0, 150)  # Semi-transparent light green
@@ -106,6 +262,28 @@ class GameUI:
         self.sounds = {}
         self._load_sounds()
     
+    @property
+    def ai(self) -> ChessAI:
+        """AI opponent."""
+        return self._ai
+    
+    @ai.setter
+    def ai(self, ai: ChessAI) -> None:
+        self._ai = ai
+        # Resolve the search entry point once rather than on every AI turn
+        self._ai_get_best_move = getattr(ai, 'get_best_move', None)
+    
+    def _get_display_hz(self) -> int:
+        """
+        Get the display refresh rate used to pace event polling.
+        
+        Returns:
+            Refresh rate in Hz, or 60 if it cannot be determined
+        """
+        get_refresh_rate = getattr(pygame.display, "get_current_refresh_rate", None)
+        hz = get_refresh_rate() if get_refresh_rate else 0
+        return hz if hz > 0 else 60
+    
     def _init_ui_elements(self):
         """Initialize UI elements like buttons and labels."""
         # Create buttons
@@ -183,6 +361,9 @@ class GameUI:
         font_medium = pygame.font.Font(None, 28)
         font_small = pygame.font.Font(None, 24)
         
+        # Stats screen title, header, text and scale fonts, built once
+        self._stats_fonts = (font_large, font_medium, font_small, pygame.font.Font(None, 18))
+        
         label_x = self.SIDEBAR_X + 20
         label_y = self.SCREEN_HEIGHT - 200
         
@@ -227,6 +408,18 @@ class GameUI:
             400, 200, 
             font_medium
         )
+        
+        # Poll input once per frame for all buttons
+        self.ui_manager = UIManager(list(self.buttons.values()))
+        
+        # Click hit-testing: reject clicks outside the sidebar, then test the button rects together
+        self._sidebar_rect = pygame.Rect(self.SIDEBAR_X, 0, self.SIDEBAR_WIDTH, self.SCREEN_HEIGHT)
+        self._button_list = list(self.buttons.values())
+        self._button_rects = [button.rect for button in self._button_list]
+        
+        # Buttons change only on hover or state changes, labels with every clock tick,
+        # so render() redraws each group on its own
+        self._label_list = list(self.labels.values())
     
     def _load_sounds(self):
         """Load sound effects."""
@@ -250,6 +443,13 @@ class GameUI:
             except pygame.error:
                 pass
         
+        # Reserve one channel for move sounds and one for game events
+        self._move_channel = self._event_channel = None
+        if self.sounds and pygame.mixer.get_init():
+            pygame.mixer.set_reserved(2)
+            self._move_channel = pygame.mixer.Channel(0)
+            self._event_channel = pygame.mixer.Channel(1)
+        
         if not self.sounds:
             logger.warning("Sound files not found. Continuing without sound.")
     
@@ -260,11 +460,22 @@ class GameUI:
         Args:
             sound_name: Name of the sound to play
         """
-        if sound_name in self.sounds:
-            self.sounds[sound_name].play()
+        sound = self.sounds.get(sound_name)
+        if sound is None:
+            return
+        
+        channel = self._move_channel if sound_name in self.MOVE_SOUNDS else self._event_channel
+        if channel is None:
+            sound.play()
+        elif channel.get_busy():
+            # Chain behind the sound still playing instead of cutting it off
+            channel.queue(sound)
+        else:
+            channel.play(sound)
     
     def new_game(self) -> None:
         """Start a new chess game."""
+        self._cancel_ai_search()
         self.board = Board()
         self.selected_piece = None
         self.selected_pos = None
@@ -274,11 +485,15 @@ class GameUI:
         self.winner = None
         self.current_turn = "white"
         self.move_history = []
+        self.player_move_history = []
+        self._packed_history = array('H')
         
         # Reset timers
         self.white_time = 10 * 60
         self.black_time = 10 * 60
-        self.last_time_update = time.time()
+        self._white_reserve = self._black_reserve = 600.0
+        self._turn_started_at = time.monotonic()
+        self._last_white_sec = self._last_black_sec = -1
         self.timer_active = True
         
         # Update labels
@@ -326,14 +541,23 @@ class GameUI:
         
         # Undo the move on the board
         if self.board.undo_move():
-            # Remove from move history
-            self.move_history.pop()
+            # Any pending search was for the position just undone
+            self._cancel_ai_search()
+            
+            # Remove from move history and recycle the move
+            move = self.move_history.pop()
+            if self.player_move_history and self.player_move_history[-1] is move:
+                self.player_move_history.pop()
+            self._update_material(move, -1)
+            self._move_pool.release(move)
+            self._packed_history.pop()
             
             # Update last move
             self.last_move = self.move_history[-1] if self.move_history else None
             
-            # Switch turns
-            self.current_turn = "black" if self.current_turn == "white" else "white"
+            # Charge the side to move for its time so far, then switch turns
+            self._end_turn_clock()
+            self.current_turn = _OTHER_SIDE[self.current_turn]
             self.labels["turn"].set_text(f"Turn: {self.current_turn.capitalize()}")
             
             # Clear selection
@@ -345,10 +569,8 @@ class GameUI:
             self.labels["status"].set_text(f"{self.current_turn.capitalize()}'s turn. Select a piece to move.")
             
             # Update last move label
-            if self.last_move:
-                move_text = f"{chr(97 + self.last_move.start_col)}{8 - self.last_move.start_row} → "
-                move_text += f"{chr(97 + self.last_move.end_col)}{8 - self.last_move.end_row}"
-                self.labels["last_move"].set_text(f"Last move: {move_text}")
+            if self._packed_history:
+                self.labels["last_move"].set_text(f"Last move: {_move_text(self._packed_history[-1])}")
             else:
                 self.labels["last_move"].set_text("Last move: ")
             
@@ -364,8 +586,9 @@ class GameUI:
             self.message_box.show("Game already over", 2)
             return
         
+        self._cancel_ai_search()
         self.game_over = True
-        self.winner = "black" if self.current_turn == "white" else "white"
+        self.winner = _OTHER_SIDE[self.current_turn]
         self.labels["status"].set_text(f"Game over. {self.winner.capitalize()} wins by resignation")
         self.timer_active = False
         
@@ -392,59 +615,29 @@ class GameUI:
         Args:
             stats: Player statistics dictionary
         """
-        # Create a surface for the stats screen
-        stats_surface = pygame.Surface((self.SCREEN_WIDTH - 100, self.SCREEN_HEIGHT - 100))
-        stats_surface.fill((50, 50, 60))
+        # Start from the cached static layout (background, headers, scales, bar tracks)
+        if self._stats_static_cache is None:
+            self._stats_static_cache = self._build_stats_static()
+        stats_surface = self._stats_static_cache.copy()
+        title_font, header_font, text_font, scale_font = self._stats_fonts
         
-        # Create fonts
-        title_font = pygame.font.Font(None, 36)
-        header_font = pygame.font.Font(None, 28)
-        text_font = pygame.font.Font(None, 24)
-        
-        # Title
-        title = title_font.render("CHESS IQ ANALYZER - PLAYER STATISTICS", True, (255, 255, 255))
-        stats_surface.blit(title, (stats_surface.get_width() // 2 - title.get_width() // 2, 20))
-        
-        # Draw horizontal separator
-        pygame.draw.line(stats_surface, (200, 200, 200), (50, 60), (stats_surface.get_width() - 50, 60), 2)
+        # Text blits are collected and drawn in one batch after the shapes
+        text_blits = []
         
         # IQ Section
         iq = stats.get("iq", {}).get("current", 110)
-        iq_text = header_font.render(f"Chess IQ: {iq}", True, (255, 255, 100))
-        stats_surface.blit(iq_text, (50, 80))
+        text_blits.append((render_text(f"Chess IQ: {iq}", header_font, (255, 255, 100)), (50, 80)))
         
         # IQ Classification
-        iq_class = "Beginner"
-        if iq >= 140:
-            iq_class = "Genius"
-        elif iq >= 130:
-            iq_class = "Advanced"
-        elif iq >= 120:
-            iq_class = "Intermediate"
-        elif iq >= 110:
-            iq_class = "Average"
-        elif iq >= 100:
-            iq_class = "Casual"
-        elif iq >= 90:
-            iq_class = "Novice"
-        elif iq >= 80:
-            iq_class = "Beginner"
-        else:
-            iq_class = "Needs Practice"
+        iq_class = _IQ_LABELS[bisect.bisect_right(_IQ_THRESHOLDS, iq)]
             
-        class_text = text_font.render(f"Classification: {iq_class}", True, (200, 200, 200))
-        stats_surface.blit(class_text, (50, 110))
+        text_blits.append((render_text(f"Classification: {iq_class}", text_font, (200, 200, 200)), (50, 110)))
         
-        # Draw IQ bar
+        # IQ progress bar
         bar_width = 300
         bar_height = 20
         bar_x = stats_surface.get_width() - bar_width - 50
         bar_y = 90
-        
-        # Background bar
-        pygame.draw.rect(stats_surface, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
-        
-        # IQ progress bar
         iq_ratio = (iq - 70) / (150 - 70)  # Scale to 0-1 range
         iq_width = int(bar_width * iq_ratio)
         
@@ -460,13 +653,6 @@ class GameUI:
             
         pygame.draw.rect(stats_surface, bar_color, (bar_x, bar_y, iq_width, bar_height))
         
-        # IQ scale labels
-        scale_font = pygame.font.Font(None, 18)
-        scale_70 = scale_font.render("70", True, (200, 200, 200))
-        scale_150 = scale_font.render("150", True, (200, 200, 200))
-        stats_surface.blit(scale_70, (bar_x - 20, bar_y + 2))
-        stats_surface.blit(scale_150, (bar_x + bar_width + 5, bar_y + 2))
-        
         # Game Stats Section
         games = stats.get("games", {})
         total = games.get("total", 0)
@@ -476,10 +662,6 @@ class GameUI:
         
         win_rate = (wins / total * 100) if total > 0 else 0
         
-        # Game stats header
-        game_header = header_font.render("Game Statistics", True, (255, 255, 255))
-        stats_surface.blit(game_header, (50, 150))
-        
         # Game stats text
         game_stats = [
             f"Games Played: {total}",
@@ -489,9 +671,8 @@ class GameUI:
             f"Win Rate: {win_rate:.1f}%"
         ]
         
-        for i, stat in enumerate(game_stats):
-            stat_text = text_font.render(stat, True, (200, 200, 200))
-            stats_surface.blit(stat_text, (70, 180 + i * 25))
+        text_blits.extend((render_text(stat, text_font, (200, 200, 200)), (70, 180 + i * 25))
+                          for i, stat in enumerate(game_stats))
         
         # Draw win/loss pie chart
         if total > 0:
@@ -499,21 +680,19 @@ class GameUI:
             center_y = 200
             radius = 60
             
-            # Calculate angles
-            win_angle = wins / total * 360
-            loss_angle = losses / total * 360
-            draw_angle = draws / total * 360
+            # Pie segments as (color, start, stop) in radians
+            pie_rect = (center_x - radius, center_y - radius, radius * 2, radius * 2)
+            segments = []
+            start = 0.0
+            for color, count in (((50, 200, 50), wins), ((200, 50, 50), losses), ((200, 200, 50), draws)):
+                span = count / total * _TWO_PI
+                if count > 0:
+                    segments.append((color, start, start + span))
+                start += span
             
             # Draw pie segments
-            if wins > 0:
-                pygame.draw.arc(stats_surface, (50, 200, 50), (center_x - radius, center_y - radius, radius * 2, radius * 2), 
-                               0, win_angle * 3.14159 / 180, radius)
-            if losses > 0:
-                pygame.draw.arc(stats_surface, (200, 50, 50), (center_x - radius, center_y - radius, radius * 2, radius * 2), 
-                               win_angle * 3.14159 / 180, (win_angle + loss_angle) * 3.14159 / 180, radius)
-            if draws > 0:
-                pygame.draw.arc(stats_surface, (200, 200, 50), (center_x - radius, center_y - radius, radius * 2, radius * 2), 
-                               (win_angle + loss_angle) * 3.14159 / 180, 2 * 3.14159, radius)
+            for color, start, stop in segments:
+                pygame.draw.arc(stats_surface, color, pie_rect, start, stop, radius)
             
             # Legend
             legend_items = [
@@ -524,75 +703,105 @@ class GameUI:
             
             for i, (label, color) in enumerate(legend_items):
                 pygame.draw.rect(stats_surface, color, (center_x - 50, center_y + 70 + i * 20, 15, 15))
-                legend_text = text_font.render(label, True, (200, 200, 200))
-                stats_surface.blit(legend_text, (center_x - 30, center_y + 70 + i * 20))
-        
-        # Piece Performance Section
-        piece_header = header_font.render("Piece Performance", True, (255, 255, 255))
-        stats_surface.blit(piece_header, (50, 320))
+                text_blits.append((render_text(label, text_font, (200, 200, 200)), (center_x - 30, center_y + 70 + i * 20)))
         
         # Count captures by piece type
-        piece_captures = {
-            'P': 0, 'N': 0, 'B': 0, 'R': 0, 'Q': 0
-        }
-        
-        for move in self.move_history:
-            if move.piece_captured:
-                piece_type = move.piece_moved.piece_type if move.piece_moved else 'P'
-                if piece_type in piece_captures:
-                    piece_captures[piece_type] += 1
+        counts = Counter(move.piece_moved.piece_type if move.piece_moved else 'P'
+                         for move in self.move_history if move.piece_captured)
+        piece_captures = {piece: counts[piece] for piece in self.STATS_PIECE_NAMES}
         
         # Display piece performance as bar chart
-        piece_names = {'P': 'Pawns', 'N': 'Knights', 'B': 'Bishops', 'R': 'Rooks', 'Q': 'Queen'}
         max_captures = max(piece_captures.values()) if piece_captures.values() else 1
         
-        for i, (piece, name) in enumerate(piece_names.items()):
-            # Piece name
-            piece_text = text_font.render(name, True, (200, 200, 200))
-            stats_surface.blit(piece_text, (70, 350 + i * 30))
-            
-            # Bar background
-            pygame.draw.rect(stats_surface, (100, 100, 100), (170, 350 + i * 30, 200, 20))
-            
+        for i, piece in enumerate(self.STATS_PIECE_NAMES):
             # Bar fill
             capture_width = int(200 * (piece_captures[piece] / max_captures)) if max_captures > 0 else 0
             pygame.draw.rect(stats_surface, (100, 150, 200), (170, 350 + i * 30, capture_width, 20))
             
             # Capture count
-            count_text = text_font.render(str(piece_captures[piece]), True, (255, 255, 255))
-            stats_surface.blit(count_text, (380, 350 + i * 30))
-        
-        # Improvement Tips Section
-        tips_header = header_font.render("Improvement Tips", True, (255, 255, 255))
-        stats_surface.blit(tips_header, (50, 500))
+            text_blits.append((render_text(str(piece_captures[piece]), text_font, (255, 255, 255)), (380, 350 + i * 30)))
         
         # Add improvement suggestions
         suggestions = self.progress_tracker.get_improvement_suggestions()
         if suggestions:
             for i, suggestion in enumerate(suggestions[:3], 1):
-                tip_text = text_font.render(f"{i}. {suggestion}", True, (200, 200, 200))
-                stats_surface.blit(tip_text, (70, 530 + i * 25))
+                text_blits.append((render_text(f"{i}. {suggestion}", text_font, (200, 200, 200)), (70, 530 + i * 25)))
         else:
-            no_tips = text_font.render("Play more games to get personalized tips!", True, (200, 200, 200))
-            stats_surface.blit(no_tips, (70, 530))
+            text_blits.append((render_text("Play more games to get personalized tips!", text_font, (200, 200, 200)), (70, 530)))
+        
+        blit_batch(stats_surface, text_blits)
         
         # Display the stats screen
         self.screen.blit(stats_surface, (50, 50))
         pygame.display.flip()
         
-        # Wait for user to close the stats screen
+        # Wait for user to close the stats screen, sleeping until an event arrives
+        deferred_events = []
         waiting = True
         while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    waiting = False
-                elif event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
-                    waiting = False
+            event = pygame.event.wait()
+            if event.type == pygame.QUIT:
+                self.running = False
+                waiting = False
+            elif event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
+                waiting = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                # Repaint only when the window contents were lost, not on a timer
+                self.screen.blit(stats_surface, (50, 50))
+                pygame.display.flip()
+            elif event.type == self.AI_MOVE_EVENT:
+                # Keep the AI's wake-up for the main loop
+                deferred_events.append(event)
+        
+        for event in deferred_events:
+            pygame.event.post(event)
         
         # Redraw the game screen
+        self._full_redraw = True
         self.render()
     
+    def _build_stats_static(self) -> pygame.Surface:
+        """
+        Draw the parts of the stats screen that never change.
+        
+        Returns:
+            Stats screen surface with background, title, section headers,
+            IQ scale and bar tracks drawn
+        """
+        title_font, header_font, text_font, scale_font = self._stats_fonts
+        
+        # Create a surface for the stats screen
+        stats_surface = pygame.Surface((self.SCREEN_WIDTH - 100, self.SCREEN_HEIGHT - 100)).convert()
+        stats_surface.fill((50, 50, 60))
+        
+        # Title
+        title = title_font.render("CHESS IQ ANALYZER - PLAYER STATISTICS", True, (255, 255, 255))
+        stats_surface.blit(title, (stats_surface.get_width() // 2 - title.get_width() // 2, 20))
+        
+        # Draw horizontal separator
+        pygame.draw.line(stats_surface, (200, 200, 200), (50, 60), (stats_surface.get_width() - 50, 60), 2)
+        
+        # IQ bar background and scale labels
+        bar_width = 300
+        bar_height = 20
+        bar_x = stats_surface.get_width() - bar_width - 50
+        bar_y = 90
+        pygame.draw.rect(stats_surface, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height))
+        stats_surface.blit(scale_font.render("70", True, (200, 200, 200)), (bar_x - 20, bar_y + 2))
+        stats_surface.blit(scale_font.render("150", True, (200, 200, 200)), (bar_x + bar_width + 5, bar_y + 2))
+        
+        # Section headers
+        stats_surface.blit(header_font.render("Game Statistics", True, (255, 255, 255)), (50, 150))
+        stats_surface.blit(header_font.render("Piece Performance", True, (255, 255, 255)), (50, 320))
+        stats_surface.blit(header_font.render("Improvement Tips", True, (255, 255, 255)), (50, 500))
+        
+        # Piece names and capture bar backgrounds
+        for i, name in enumerate(self.STATS_PIECE_NAMES.values()):
+            stats_surface.blit(text_font.render(name, True, (200, 200, 200)), (70, 350 + i * 30))
+            pygame.draw.rect(stats_surface, (100, 100, 100), (170, 350 + i * 30, 200, 20))
+        
+        return stats_surface
+    
     def exit_game(self) -> None:
         """Exit the game."""
         self.running = False
@@ -601,7 +810,7 @@ class GameUI:
     
     def handle_events(self) -> None:
         """Handle pygame events."""
-        for event in pygame.event.get():
+        for event in self.ui_manager.tick(self.HANDLED_EVENTS):
             # Quit event
             if event.type == pygame.QUIT:
                 self.running = False
@@ -613,16 +822,31 @@ class GameUI:
                 
                 # Check if a button was clicked
                 button_clicked = False
-                for button in self.buttons.values():
-                    if button.is_clicked(mouse_pos):
-                        button.on_click()
+                if self._sidebar_rect.collidepoint(mouse_pos):
+                    index = pygame.Rect(mouse_pos, (1, 1)).collidelist(self._button_rects)
+                    if index != -1 and self._button_list[index].enabled:
+                        self._button_list[index].on_click()
                         button_clicked = True
-                        break
                 
                 # If no button was clicked, check if the board was clicked
-                if not button_clicked and not self.game_over:
+                if not button_clicked and not self.game_over and not self.ai_thinking:
                     self.handle_board_click(mouse_pos)
             
+            # Window contents were lost; repaint everything
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._full_redraw = True
+            
+            # Stop drawing while nothing is visible; repaint everything when shown again
+            elif event.type == pygame.WINDOWMINIMIZED or event.type == pygame.WINDOWHIDDEN:
+                self._window_visible = False
+            elif event.type == pygame.WINDOWRESTORED or event.type == pygame.WINDOWSHOWN:
+                self._window_visible = True
+                self._full_redraw = True
+            
+            # AI search finished or thinking time ran out
+            elif event.type == self.AI_MOVE_EVENT:
+                self.process_ai_move()
+            
             # Key down
             elif event.type == pygame.KEYDOWN:
                 # Escape key exits
@@ -651,7 +875,7 @@ class GameUI:
         # If a piece is already selected
         if self.selected_piece:
             # Create a move object
-            move = Move(self.selected_pos, board_pos)
+            move = self._move_pool.acquire(self.selected_pos, board_pos)
             
             # Check if the move is legal
             if self.board.is_valid_move(move):
@@ -664,12 +888,15 @@ class GameUI:
                 # If AI is enabled and it's AI's turn, trigger AI move
                 if self.ai_enabled and self.current_turn != self.player_color and not self.game_over:
                     self.ai_thinking = True
-                    # Process AI move immediately
+                    # Start the AI search immediately
                     self.process_ai_move()
             else:
+                # The rejected move is not referenced anywhere
+                self._move_pool.release(move)
+                
                 # Check if another piece of the same color was clicked
                 piece = self.board.get_piece_at(board_pos[0], board_pos[1])
-                if piece and piece.color == ('w' if self.current_turn == "white" else 'b'):
+                if piece and piece.color == _PIECE_COLORS[self.current_turn]:
                     self.selected_piece = piece
                     self.selected_pos = board_pos
                     self.legal_moves = self.board.get_valid_moves(board_pos)
@@ -683,7 +910,7 @@ class GameUI:
         else:
             # Select a piece if it's of the current turn's color
             piece = self.board.get_piece_at(board_pos[0], board_pos[1])
-            if piece and piece.color == ('w' if self.current_turn == "white" else 'b'):
+            if piece and piece.color == _PIECE_COLORS[self.current_turn]:
                 self.selected_piece = piece
                 self.selected_pos = board_pos
                 self.legal_moves = self.board.get_valid_moves(board_pos)
@@ -709,6 +936,8 @@ class GameUI:
         
         # Store move in history
         self.move_history.append(move)
+        if self.current_turn == self.player_color:
+            self.player_move_history.append(move)
         
         # Check for special moves to play appropriate sounds
         is_capture = move.piece_captured is not None
@@ -717,14 +946,19 @@ class GameUI:
             abs(move.start_col - move.end_col) > 1
         )
         
+        # Note whether the destination is defended by the opponent, for IQ scoring
+        move.end_attacked = self.board.square_under_attack(move.end_row, move.end_col)
+        
         # Execute the move
         self.board.make_move(move)
+        move.gave_check = self.board.in_check
+        self._update_material(move, 1)
         self.last_move = move
+        packed = move.packed
+        self._packed_history.append(packed)
         
         # Update last move label
-        move_text = f"{chr(97 + move.start_col)}{8 - move.start_row} → "
-        move_text += f"{chr(97 + move.end_col)}{8 - move.end_row}"
-        self.labels["last_move"].set_text(f"Last move: {move_text}")
+        self.labels["last_move"].set_text(f"Last move: {_move_text(packed)}")
         
         # Play appropriate sound
         if is_castle:
@@ -734,8 +968,9 @@ class GameUI:
         else:
             self.play_sound("move")
         
-        # Switch turns
-        self.current_turn = "black" if self.current_turn == "white" else "white"
+        # Charge the mover for this turn, then switch turns
+        self._end_turn_clock()
+        self.current_turn = _OTHER_SIDE[self.current_turn]
         self.labels["turn"].set_text(f"Turn: {self.current_turn.capitalize()}")
         
         # Calculate and update IQ after each move
@@ -758,7 +993,7 @@ class GameUI:
         # Check for checkmate or stalemate
         if hasattr(self.board, 'checkmate') and self.board.checkmate:
             self.game_over = True
-            self.winner = "white" if self.current_turn == "black" else "black"
+            self.winner = _OTHER_SIDE[self.current_turn]
             self.labels["status"].set_text(f"Checkmate! {self.winner.capitalize()} wins")
             self.timer_active = False
             self.play_sound("game_end")
@@ -798,58 +1033,78 @@ class GameUI:
             self.labels["status"].set_text(f"{self.current_turn.capitalize()}'s turn. Select a piece to move.")
     
     def process_ai_move(self) -> None:
-        """Process AI move if it's AI's turn."""
+        """
+        Advance the AI's move.
+        
+        The first call starts a search on the worker thread. Later calls come from
+        AI_MOVE_EVENT, posted when the search finishes and again by a timer once
+        the minimum thinking time is up; the move is made when both are done.
+        """
         if not self.ai_thinking:
             return
+        
+        if self._ai_future is None:
+            # Show thinking indicator
+            self.labels["status"].set_text("AI is thinking...")
             
-        # Show thinking indicator
-        self.labels["status"].set_text("AI is thinking...")
-        
-        # Add a delay to simulate AI thinking (2-5 seconds)
-        thinking_time = random.uniform(2, 5)
-        start_time = time.time()
-        
-        # Update the display while "thinking"
-        while time.time() - start_time < thinking_time:
-            # Handle events to keep the UI responsive
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    return
+            # Add a delay to simulate AI thinking (2-5 seconds)
+            self._ai_ready_at = time.monotonic() + random.uniform(2, 5)
             
-            # Update AI's timer while thinking
-            if self.timer_active and not self.game_over:
-                current_time = time.time()
-                elapsed = current_time - self.last_time_update
-                self.last_time_update = current_time
-                
-                if self.current_turn == "black":
-                    self.black_time -= elapsed
-                    minutes = int(self.black_time // 60)
-                    seconds = int(self.black_time % 60)
-                    self.labels["black_time"].set_text(f"Black: {minutes:02d}:{seconds:02d}")
-                else:
-                    self.white_time -= elapsed
-                    minutes = int(self.white_time // 60)
-                    seconds = int(self.white_time % 60)
-                    self.labels["white_time"].set_text(f"White: {minutes:02d}:{seconds:02d}")
-            
-            # Render the game to show the thinking status
-            self.render()
-            pygame.display.flip()
-            self.clock.tick(30)
+            # Search a private copy so rendering never sees the AI's trial moves
+            # (the memo entry gives the copy an empty valid-move cache)
+            board_copy = copy.deepcopy(self.board, {id(self.board._valid_move_cache): {}})
+            self._ai_search_key = (self.board, self.board.move_counter)
+            self._ai_future = self._ai_executor.submit(self._search_ai_move, self._ai_get_best_move, board_copy, self.current_turn)
+            self._ai_future.add_done_callback(self._post_ai_move_event)
+            return
+        
+        if not self._ai_future.done():
+            return
+        
+        # Search finished early: wake up again when the thinking time is over
+        remaining = self._ai_ready_at - time.monotonic()
+        if remaining > 0:
+            pygame.time.set_timer(self.AI_MOVE_EVENT, max(1, math.ceil(remaining * 1000)), 1)
+            return
         
-        # Get AI move
+        future = self._ai_future
+        self._ai_future = None
+        self.ai_thinking = False
+        
+        # Drop results for a position that has changed since the search started
+        if self._ai_search_key != (self.board, self.board.move_counter) or self.game_over:
+            return
+        
+        ai_move = future.result()
+        if ai_move:
+            # Rebind the move to the live board and make it
+            self.make_move(Move.from_packed(ai_move.packed, self.board))
+        else:
+            # If no move could be made, end AI thinking
+            self.labels["status"].set_text("AI couldn't find a move!")
+    
+    def _search_ai_move(self, get_best_move: Optional[Callable], board: Board, color: str) -> Optional[Move]:
+        """
+        Pick the AI's move; runs on the worker thread.
+        
+        Args:
+            get_best_move: The AI's search method when the search started, or None
+            board: Private copy of the current board
+            color: Color the AI is playing
+            
+        Returns:
+            Chosen move on the copied board, or None if there is none
+        """
         ai_move = None
         try:
             # Create a simple move for testing if AI is not properly implemented
-            if hasattr(self.ai, 'get_best_move'):
-                ai_move = self.ai.get_best_move(self.board, self.current_turn)
+            if get_best_move is not None:
+                ai_move = get_best_move(board, color)
             
             # If AI didn't return a move, make a simple one
             if not ai_move:
                 # Find a valid move for the AI
-                valid_moves = self.board.get_valid_moves()
+                valid_moves = board.get_valid_moves()
                 if valid_moves:
                     # Prioritize capturing moves
                     capturing_moves = [move for move in valid_moves if move.piece_captured]
@@ -860,37 +1115,61 @@ class GameUI:
         except Exception as e:
             print(f"Error getting AI move: {e}")
             # Find a valid move for the AI
-            valid_moves = self.board.get_valid_moves()
+            valid_moves = board.get_valid_moves()
             if valid_moves:
                 ai_move = random.choice(valid_moves)
         
-        if ai_move:
-            # Make the move
-            self.make_move(ai_move)
-        else:
-            # If no move could be made, end AI thinking
-            self.labels["status"].set_text("AI couldn't find a move!")
+        return ai_move
+    
+    def _post_ai_move_event(self, future: Future) -> None:
+        """
+        Wake the main loop when an AI search is done; runs on the worker thread.
         
+        Args:
+            future: The finished search
+        """
+        try:
+            pygame.event.post(pygame.event.Event(self.AI_MOVE_EVENT))
+        except pygame.error:
+            # Display already shut down
+            pass
+    
+    def _cancel_ai_search(self) -> None:
+        """Stop waiting on any pending AI search so its result is discarded."""
         self.ai_thinking = False
+        pygame.time.set_timer(self.AI_MOVE_EVENT, 0)
+        if self._ai_future is not None:
+            self._ai_future.cancel()
+            self._ai_future = None
 
+    def _end_turn_clock(self) -> None:
+        """Deduct the current turn's elapsed time from the side to move and restart the turn clock."""
+        now = time.monotonic()
+        elapsed = now - self._turn_started_at
+        self._turn_started_at = now
+        
+        if self.timer_active and not self.game_over:
+            if self.current_turn == "white":
+                self._white_reserve = max(0.0, self._white_reserve - elapsed)
+            else:
+                self._black_reserve = max(0.0, self._black_reserve - elapsed)
+    
     def update_timers(self) -> None:
         """Update game timers."""
         if not self.timer_active or self.game_over:
             return
         
-        # Calculate elapsed time since last update
-        current_time = time.time()
-        elapsed = current_time - self.last_time_update
-        self.last_time_update = current_time
+        # Time spent on the current turn, measured from its monotonic start
+        elapsed = time.monotonic() - self._turn_started_at
             
         # Update the active timer
         if self.current_turn == "white":
             # Decrease white's time
-            self.white_time -= elapsed
+            self.white_time = self._white_reserve - elapsed
             
             # Check for time out
             if self.white_time <= 0:
-                self.white_time = 0
+                self.white_time = self._white_reserve = 0
                 self.game_over = True
                 self.winner = "black"
                 self.labels["status"].set_text("White out of time! Black wins")
@@ -901,17 +1180,18 @@ class GameUI:
                 result = "loss" if self.player_color == "white" else "win"
                 self.progress_tracker.update_game_result(result)
             
-            # Update display
-            minutes = int(self.white_time // 60)
-            seconds = int(self.white_time % 60)
-            self.labels["white_time"].set_text(f"White: {minutes:02d}:{seconds:02d}")
+            # Update display when the shown second changes
+            new_sec = int(self.white_time)
+            if new_sec != self._last_white_sec:
+                self._last_white_sec = new_sec
+                self.labels["white_time"].set_text(f"White: {format_time(new_sec)}")
         else:
             # Decrease black's time
-            self.black_time -= elapsed
+            self.black_time = self._black_reserve - elapsed
             
             # Check for time out
             if self.black_time <= 0:
-                self.black_time = 0
+                self.black_time = self._black_reserve = 0
                 self.game_over = True
                 self.winner = "white"
                 self.labels["status"].set_text("Black out of time! White wins")
@@ -922,17 +1202,91 @@ class GameUI:
                 result = "win" if self.player_color == "white" else "loss"
                 self.progress_tracker.update_game_result(result)
             
-            # Update display
-            minutes = int(self.black_time // 60)
-            seconds = int(self.black_time % 60)
-            self.labels["black_time"].set_text(f"Black: {minutes:02d}:{seconds:02d}")
+            # Update display when the shown second changes
+            new_sec = int(self.black_time)
+            if new_sec != self._last_black_sec:
+                self._last_black_sec = new_sec
+                self.labels["black_time"].set_text(f"Black: {format_time(new_sec)}")
     
     def render(self) -> None:
-        """Render the game UI."""
-        # Fill background
-        self.screen.fill(self.BG_COLOR)
+        """
+        Render the game UI, updating only the screen regions that changed.
         
-        # Draw board
+        The board is redrawn when the position, selection, highlights or orientation
+        change. Buttons and labels are redrawn as two separate groups, each only when
+        one of its widgets looks different. While a message box is showing, and on the
+        frame after it closes, everything is redrawn.
+        """
+        board_key = (
+            self.board, self.board.move_counter, self.current_turn, self.selected_pos,
+            len(self.legal_moves), self.last_move, getattr(self.board, 'in_check', False),
+            self.board_view.flipped
+        )
+        button_blits = [pair for button in self._button_list for pair in button.blit_pairs()]
+        label_blits = [pair for label in self._label_list for pair in label.blit_pairs()]
+        
+        full_redraw = self._full_redraw or self.message_box.visible
+        board_dirty = full_redraw or board_key != self._drawn_board_key
+        buttons_dirty = button_blits != self._drawn_button_blits
+        labels_dirty = label_blits != self._drawn_label_blits
+        if not (full_redraw or board_dirty or buttons_dirty or labels_dirty):
+            return
+        
+        dirty_rects = []
+        
+        if full_redraw:
+            # Fill the background around the board (sidebar and margins)
+            for rect in self._background_rects:
+                self.screen.fill(self.BG_COLOR, rect)
+            
+            # Draw buttons and labels in one batch
+            blit_batch(self.screen, button_blits + label_blits)
+            dirty_rects.extend(self._background_rects)
+        else:
+            if buttons_dirty:
+                dirty_rects.extend(self._redraw_widgets(button_blits, self._drawn_button_blits))
+            if labels_dirty:
+                dirty_rects.extend(self._redraw_widgets(label_blits, self._drawn_label_blits))
+        self._drawn_button_blits = button_blits
+        self._drawn_label_blits = label_blits
+        
+        if board_dirty:
+            self._draw_board()
+            dirty_rects.append(self._board_rect)
+            self._drawn_board_key = board_key
+        
+        # Draw message box
+        self.message_box.draw(self.screen)
+        
+        # Update display
+        if full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+        
+        # Repaint once more after a message box closes
+        self._full_redraw = self.message_box.visible
+    
+    def _redraw_widgets(self, blits: List[Tuple[pygame.Surface, pygame.Rect]],
+                        drawn_blits: List[Tuple[pygame.Surface, pygame.Rect]]) -> List[pygame.Rect]:
+        """
+        Erase one widget group where it was last drawn and draw its current blits.
+        
+        Args:
+            blits: The group's current (surface, rect) pairs
+            drawn_blits: The pairs drawn for the group last time
+            
+        Returns:
+            Screen rects that changed
+        """
+        old_rects = [rect for _, rect in drawn_blits]
+        for rect in old_rects:
+            self.screen.fill(self.BG_COLOR, rect)
+        blit_batch(self.screen, blits)
+        return old_rects + [rect for _, rect in blits]
+    
+    def _draw_board(self) -> None:
+        """Draw the board, pieces and square highlights."""
         self.board_view.draw(self.screen, self.board)
         
         # Draw selected piece highlight
@@ -952,20 +1306,6 @@ class GameUI:
         if hasattr(self.board, 'in_check') and self.board.in_check:
             king_pos = self.board.white_king_location if self.current_turn == "white" else self.board.black_king_location
             self.board_view.draw_highlight(self.screen, king_pos, self.CHECK_HIGHLIGHT)
-        
-        # Draw buttons
-        for button in self.buttons.values():
-            button.draw(self.screen)
-        
-        # Draw labels
-        for label in self.labels.values():
-            label.draw(self.screen)
-        
-        # Draw message box
-        self.message_box.draw(self.screen)
-        
-        # Update display
-        pygame.display.flip()
     
     def get_player_move(self, board, player_color: str, time_remaining: float) -> Optional[Move]:
         """
@@ -985,11 +1325,12 @@ class GameUI:
         
         # Update timers
         if player_color == "white":
-            self.white_time = time_remaining
+            self.white_time = self._white_reserve = time_remaining
             self.white_timer = Timer(time_remaining)
         else:
-            self.black_time = time_remaining
+            self.black_time = self._black_reserve = time_remaining
             self.black_timer = Timer(time_remaining)
+        self._turn_started_at = time.monotonic()
         
         # Handle events
         self.handle_events()
@@ -1005,28 +1346,95 @@ class GameUI:
         self.new_game()  # Start a new game
         
         while self.running:
-            # Handle events
-            self.handle_events()
+            # Handle events, no more often than the display refreshes
+            now = time.monotonic()
+            if now >= self._next_event_pump:
+                self.handle_events()
+                self._next_event_pump = now + self._event_interval
             
-            # Process AI move if needed
-            if self.ai_thinking:
+            # Start the AI search if it's the AI's turn; AI_MOVE_EVENT finishes it
+            if self.ai_thinking and self._ai_future is None:
                 self.process_ai_move()
             
-            # Update timers
-            self.update_timers()
-            
-            # Update message box
-            self.message_box.update()
+            # Update timers and message box on the fixed update step
+            if now >= self._next_update:
+                self.update_timers()
+                self.message_box.update()
+                
+                # Steps missed in a stall are dropped: the clocks are anchored to monotonic time
+                self._next_update += self.UPDATE_STEP
+                if self._next_update < now:
+                    self._next_update = now + self.UPDATE_STEP
             
-            # Render the game
-            self.render()
+            # Render the game (skipped when nothing changed or the window can't be seen)
+            if self._window_visible:
+                self.render()
             
-            # Cap the frame rate
-            self.clock.tick(60)
+            # Cap the frame rate; with nothing animating, sleep until input arrives
+            if self.message_box.visible:
+                self.clock.tick(60)
+            else:
+                self._wait_for_input()
         
-        # Clean up pygame
+        # Stop the AI worker and clean up pygame
+        self._ai_executor.shutdown(wait=False, cancel_futures=True)
         pygame.quit()
         sys.exit()
+    
+    def _wait_for_input(self) -> None:
+        """Block until an event arrives or the next update can change the running clock's display."""
+        timeout = self.IDLE_WAIT_MS
+        if self.timer_active and not self.game_over:
+            remaining = self.white_time if self.current_turn == "white" else self.black_time
+            # Wake just after the displayed second ticks over
+            timeout = min(timeout, int(remaining % 1.0 * 1000) + 1)
+        
+        # No point waking before the next update step is due
+        timeout = max(timeout, math.ceil((self._next_update - time.monotonic()) * 1000))
+        
+        event = pygame.event.wait(timeout)
+        if event.type != pygame.NOEVENT:
+            # Put the event back for handle_events and handle it without delay
+            pygame.event.post(event)
+            self._next_event_pump = 0.0
+    
+    def _material_totals(self) -> Tuple[int, int]:
+        """
+        Get the material on the board for each side.
+        
+        The board is scanned only when it has been replaced; otherwise the totals
+        kept up to date by make_move and undo_move are returned.
+        
+        Returns:
+            White and black material
+        """
+        if self._material_board is not self.board:
+            codes = encode_board(self.board)
+            values = _MATERIAL_LUT[np.abs(codes)]
+            self._material = {'w': int(values[codes > 0].sum()), 'b': int(values[codes < 0].sum())}
+            self._material_board = self.board
+        return self._material['w'], self._material['b']
+    
+    def _update_material(self, move: Move, sign: int) -> None:
+        """
+        Apply a move's material change to the running totals.
+        
+        Args:
+            move: Move just made or undone
+            sign: 1 when the move was made, -1 when it was undone
+        """
+        if self._material_board is not self.board:
+            # Totals belong to another board; they are rebuilt on next use
+            return
+        
+        if move.piece_captured:
+            captured = move.piece_captured
+            self._material[captured.color] -= sign * _MATERIAL_VALUES.get(captured.piece_type, 0)
+        
+        moved = move.piece_moved
+        if moved and moved.piece_type == 'P' and move.end_row == _PROMOTION_ROWS[moved.color]:
+            self._material[moved.color] += sign * _PROMOTION_GAIN
+    
     def _calculate_iq_score(self, result: str) -> int:
         """
         Calculate Chess IQ score based on game performance.
@@ -1047,30 +1455,8 @@ class GameUI:
         # Get previous IQ if available
         previous_iq = self.progress_tracker.get_stats().get("iq", {}).get("current", 110)
         
-        # Piece values for material evaluation
-        piece_values = {
-            'P': 1,
-            'N': 3,
-            'B': 3,
-            'R': 5,
-            'Q': 9,
-            'K': 0  # King doesn't count for material advantage
-        }
-        
-        # Count material for both sides
-        white_material = 0
-        black_material = 0
-        
-        # Count material on the board
-        for row in range(8):
-            for col in range(8):
-                piece = self.board.get_piece_at(row, col)
-                if piece:
-                    value = piece_values.get(piece.piece_type, 0)
-                    if piece.color == 'w':
-                        white_material += value
-                    else:
-                        black_material += value
+        # Material for both sides
+        white_material, black_material = self._material_totals()
         
         # Calculate material advantage
         if self.player_color == "white":
@@ -1082,59 +1468,12 @@ class GameUI:
         material_adjustment = material_advantage * 3
         
         # Adjust based on result
-        if result == "win":
-            result_adjustment = 10 + (self.ai_difficulty * 2)
-        elif result == "loss":
-            result_adjustment = -15 - (self.ai_difficulty * 1)
-        else:  # draw
-            result_adjustment = 5
-        
-        # Adjust based on move quality
-        good_moves = 0
-        bad_moves = 0
-        captures = 0
-        checks = 0
-        risks_taken = 0
-        promotions = 0
-        
-        for i, move in enumerate(self.move_history):
-            # Only count player moves
-            if i % 2 == (0 if self.player_color == "white" else 1):
-                continue
-                
-            # Count captures
-            if move.piece_captured:
-                captures += 1
-                # Bonus for capturing higher value pieces
-                if move.piece_captured.piece_type in ['Q', 'R']:
-                    good_moves += 2
-                elif move.piece_captured.piece_type in ['B', 'N']:
-                    good_moves += 1
-            
-            # Check if move put opponent in check
-            self.board.make_move(move)
-            if self.board.in_check:
-                checks += 1
-                good_moves += 1
-            
-            # Check for pawn promotion
-            if move.piece_moved and move.piece_moved.piece_type == 'P':
-                if (move.piece_moved.color == 'w' and move.end_row == 0) or \
-                   (move.piece_moved.color == 'b' and move.end_row == 7):
-                    promotions += 1
-                    good_moves += 3  # Big bonus for promotion
-            
-            self.board.undo_move()
-            
-            # Check if a piece was moved to a threatened square (risk taking)
-            if self.board.square_under_attack(move.end_row, move.end_col):
-                risks_taken += 1
-                
-                # If the risk resulted in a capture, it's a good risk
-                if move.piece_captured:
-                    good_moves += 1
-                else:
-                    bad_moves += 1
+        result_adjustment = _RESULT_ADJUSTMENTS.get(result, _RESULT_ADJUSTMENTS["draw"])(self.ai_difficulty)
+        
+        # Adjust based on move quality (only player moves are counted)
+        good_moves, bad_moves, captures, checks, promotions, risks_taken = score_moves(
+            *encode_moves(self.player_move_history)
+        )
         
         # Adjust IQ based on move quality
         move_quality_adjustment = (good_moves * 2) - (bad_moves * 3) + (captures * 3) + (checks * 2) + (promotions * 5)
@@ -1160,18 +1499,24 @@ class GameUI:
         final_iq = previous_iq + result_adjustment + move_quality_adjustment + game_length_adjustment + ai_difficulty_adjustment + risk_adjustment + material_adjustment
         
         # Ensure IQ is within the specified range (70-150)
-        final_iq = max(min(final_iq, 150), 70)
-        
-        # Log the IQ calculation
-        print(f"IQ Calculation:")
-        print(f"  Previous IQ: {previous_iq}")
-        print(f"  Material advantage: {material_adjustment} (player: {white_material if self.player_color == 'white' else black_material}, opponent: {black_material if self.player_color == 'white' else white_material})")
-        print(f"  Result adjustment: {result_adjustment}")
-        print(f"  Move quality: {move_quality_adjustment} (good: {good_moves}, bad: {bad_moves}, captures: {captures}, checks: {checks}, promotions: {promotions})")
-        print(f"  Risk taking: {risk_adjustment} (risks: {risks_taken})")
-        print(f"  Game length: {game_length_adjustment} (moves: {game_length})")
-        print(f"  AI difficulty: {ai_difficulty_adjustment} (level: {self.ai_difficulty})")
-        print(f"  Final IQ: {final_iq}")
+        final_iq = _IQ_MIN if final_iq < _IQ_MIN else _IQ_MAX if final_iq > _IQ_MAX else final_iq
+        
+        # Log the IQ calculation in one write
+        if self.player_color == "white":
+            player_material, opponent_material = white_material, black_material
+        else:
+            player_material, opponent_material = black_material, white_material
+        print("\n".join((
+            "IQ Calculation:",
+            f"  Previous IQ: {previous_iq}",
+            f"  Material advantage: {material_adjustment} (player: {player_material}, opponent: {opponent_material})",
+            f"  Result adjustment: {result_adjustment}",
+            f"  Move quality: {move_quality_adjustment} (good: {good_moves}, bad: {bad_moves}, captures: {captures}, checks: {checks}, promotions: {promotions})",
+            f"  Risk taking: {risk_adjustment} (risks: {risks_taken})",
+            f"  Game length: {game_length_adjustment} (moves: {game_length})",
+            f"  AI difficulty: {ai_difficulty_adjustment} (level: {self.ai_difficulty})",
+            f"  Final IQ: {final_iq}",
+        )))
         
         return int(final_iq)
     def _calculate_provisional_iq(self, result: str) -> int:
@@ -1187,30 +1532,8 @@ class GameUI:
         # Get previous IQ if available
         previous_iq = self.progress_tracker.get_stats().get("iq", {}).get("current", 110)
         
-        # Count material for both sides
-        white_material = 0
-        black_material = 0
-        
-        # Piece values
-        piece_values = {
-            'P': 1,
-            'N': 3,
-            'B': 3,
-            'R': 5,
-            'Q': 9,
-            'K': 0  # King doesn't count for material advantage
-        }
-        
-        # Count material on the board
-        for row in range(8):
-            for col in range(8):
-                piece = self.board.get_piece_at(row, col)
-                if piece:
-                    value = piece_values.get(piece.piece_type, 0)
-                    if piece.color == 'w':
-                        white_material += value
-                    else:
-                        black_material += value
+        # Material for both sides
+        white_material, black_material = self._material_totals()
         
         # Calculate material advantage
         if self.player_color == "white":
@@ -1221,18 +1544,11 @@ class GameUI:
         # Adjust IQ based on material advantage
         material_adjustment = material_advantage * 2
         
-        # Count captures by player
-        player_captures = 0
-        opponent_captures = 0
-        
-        for i, move in enumerate(self.move_history):
-            is_player_move = (i % 2 == 0 and self.player_color == "white") or (i % 2 == 1 and self.player_color == "black")
-            
-            if move.piece_captured:
-                if is_player_move:
-                    player_captures += piece_values.get(move.piece_captured.piece_type, 0)
-                else:
-                    opponent_captures += piece_values.get(move.piece_captured.piece_type, 0)
+        # Count captures by player; the opponent made every other capture
+        player_captures = sum(_MATERIAL_VALUES.get(move.piece_captured.piece_type, 0)
+                              for move in self.player_move_history if move.piece_captured)
+        opponent_captures = sum(_MATERIAL_VALUES.get(move.piece_captured.piece_type, 0)
+                                for move in self.move_history if move.piece_captured) - player_captures
         
         # Calculate capture advantage
         capture_advantage = player_captures - opponent_captures
@@ -1242,12 +1558,9 @@ class GameUI:
         provisional_iq = previous_iq + material_adjustment + capture_adjustment
         
         # Adjust based on current game state
-        if result == "provisional_win":
-            provisional_iq += 5
-        elif result == "provisional_loss":
-            provisional_iq -= 3
+        provisional_iq += _PROVISIONAL_ADJUSTMENTS.get(result, 0)
         
         # Ensure IQ is within the specified range (70-150)
-        provisional_iq = max(min(provisional_iq, 150), 70)
+        provisional_iq = _IQ_MIN if provisional_iq < _IQ_MIN else _IQ_MAX if provisional_iq > _IQ_MAX else provisional_iq
         
         return int(provisional_iq)
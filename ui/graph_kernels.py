@@ -0,0 +1,65 @@
+"""
+Graph Kernels Module
+
+Maps stats series to pixel coordinates for the stats view's line graphs,
+with a Numba-compiled loop when numba is installed and NumPy otherwise.
+"""
+
+import numpy as np
+from typing import List, Sequence
+
+from chess_engine.ai_numba import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def map_points(values, y_min, y_range, left, bottom, graph_width, graph_height):
+    """
+    Map a series to pixel coordinates, spread evenly across the graph.
+
+    Args:
+        values: float64 array of at least two values
+        y_min: Value at the bottom of the graph
+        y_range: Value span of the graph (non-zero)
+        left: Graph area left edge
+        bottom: Graph area bottom edge
+        graph_width: Graph area width
+        graph_height: Graph area height
+
+    Returns:
+        int32 array of shape (len(values), 2) with the (x, y) of each value
+    """
+    count = values.shape[0]
+    points = np.empty((count, 2), dtype=np.int32)
+    step = graph_width / (count - 1)
+    for i in range(count):
+        points[i, 0] = int(left + i * step)
+        points[i, 1] = int(bottom - (values[i] - y_min) / y_range * graph_height)
+    return points
+
+
+def graph_points(values: Sequence[float], y_min: float, y_range: float,
+                 left: int, bottom: int, graph_width: int, graph_height: int) -> List[List[int]]:
+    """
+    Get the pixel coordinates of a line graph's data points.
+
+    Args:
+        values: Y values, at least two
+        y_min: Value at the bottom of the graph
+        y_range: Value span of the graph (0 draws a flat line)
+        left: Graph area left edge
+        bottom: Graph area bottom edge
+        graph_width: Graph area width
+        graph_height: Graph area height
+
+    Returns:
+        [x, y] pixel coordinates of each value
+    """
+    values = np.asarray(values, dtype=np.float64)
+    y_range = y_range or 1
+
+    if NUMBA_AVAILABLE:
+        return map_points(values, float(y_min), float(y_range), left, bottom, graph_width, graph_height).tolist()
+
+    xs = left + np.linspace(0, graph_width, len(values))
+    ys = bottom - (values - y_min) / y_range * graph_height
+    return np.column_stack((xs, ys)).astype(np.int32).tolist()
@@ -5,18 +5,127 @@ Displays post-game stats such as accuracy, IQ graph, mistakes, and win/loss hist
 using Pygame overlay.
 """
 
-import os
+import functools
 import pygame
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 
-from ui.components import Button, Label
+from ui.components import Button, Label, blit_batch, get_font, render_text
+from ui.graph_kernels import graph_points
 from iq.progress_tracker import ProgressTracker
 from utils.logger import get_logger
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Largest arc, in degrees, between consecutive vertices of a pie slice outline
+_PIE_STEP_DEGREES = 5
+
+# Unit circle at every _PIE_STEP_DEGREES from 0 to 360, for pie slice outlines
+_PIE_ANGLES = np.arange(0, 360 + _PIE_STEP_DEGREES, _PIE_STEP_DEGREES)
+_PIE_COS = np.cos(np.radians(_PIE_ANGLES))
+_PIE_SIN = np.sin(np.radians(_PIE_ANGLES))
+
+# Space between a graph's edges and its plot area
+_GRAPH_MARGIN = 50
+
+# Line graph data point radius, and pre-drawn point markers by color
+_MARKER_RADIUS = 4
+_MARKERS: Dict[Tuple[int, int, int], pygame.Surface] = {}
+
+
+def _get_marker(color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Get a filled circle marker for line graph data points.
+    
+    Args:
+        color: Marker color
+        
+    Returns:
+        Shared marker surface, centered on its midpoint
+    """
+    marker = _MARKERS.get(color)
+    if marker is None:
+        size = _MARKER_RADIUS * 2 + 1
+        marker = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(marker, color, (_MARKER_RADIUS, _MARKER_RADIUS), _MARKER_RADIUS)
+        _MARKERS[color] = marker
+    return marker
+
+
+@functools.lru_cache(maxsize=32)
+def _line_graph_chrome(title: str, width: int, height: int, y_min: float, y_max: float,
+                       text_color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Draw the parts of a line graph that don't depend on the data points.
+    
+    The returned surface is shared between callers; copy it before drawing on it.
+    
+    Args:
+        title: Graph title
+        width: Graph width
+        height: Graph height
+        y_min: Value at the bottom of the graph
+        y_max: Value at the top of the graph
+        text_color: Title and axis label color
+        
+    Returns:
+        Surface with the background, title, plot area, grid lines and Y-axis labels
+    """
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    surface.fill((50, 50, 50))
+    
+    # Draw title
+    title_surf = render_text(title, get_font(None, 32), text_color)
+    title_rect = title_surf.get_rect(midtop=(width // 2, 10))
+    surface.blit(title_surf, title_rect)
+    
+    # Draw graph background
+    graph_rect = pygame.Rect(_GRAPH_MARGIN, _GRAPH_MARGIN, width - _GRAPH_MARGIN * 2, height - _GRAPH_MARGIN * 2)
+    pygame.draw.rect(surface, (30, 30, 30), graph_rect)
+    pygame.draw.rect(surface, (100, 100, 100), graph_rect, 1)
+    
+    # Draw horizontal grid lines and labels
+    label_font = get_font(None, 20)
+    y_range = y_max - y_min
+    num_lines = 5
+    for i in range(num_lines + 1):
+        y = graph_rect.bottom - (i / num_lines) * graph_rect.height
+        # Grid line
+        pygame.draw.line(surface, (70, 70, 70), (graph_rect.left, y), (graph_rect.right, y), 1)
+        # Y-axis label
+        value = y_min + (i / num_lines) * y_range
+        label = render_text(f"{value:.1f}", label_font, text_color)
+        surface.blit(label, (graph_rect.left - label.get_width() - 5, y - label.get_height() // 2))
+    
+    return surface
+
+
+def _wedge_points(center_x: int, center_y: int, radius: int,
+                  start_angle: float, end_angle: float) -> List[List[int]]:
+    """
+    Get the outline of a filled pie slice as a polygon.
+    
+    Args:
+        center_x: Pie center x
+        center_y: Pie center y
+        radius: Pie radius
+        start_angle: Slice start in degrees, counter-clockwise from 3 o'clock
+        end_angle: Slice end in degrees
+        
+    Returns:
+        Polygon points: the center, then points along the arc
+    """
+    # Exact slice ends, with the table's vertices in between
+    first = np.searchsorted(_PIE_ANGLES, start_angle, side='right')
+    last = np.searchsorted(_PIE_ANGLES, end_angle, side='left')
+    ends = np.radians((start_angle, end_angle))
+    cos = np.concatenate(((np.cos(ends[0]),), _PIE_COS[first:last], (np.cos(ends[1]),)))
+    sin = np.concatenate(((np.sin(ends[0]),), _PIE_SIN[first:last], (np.sin(ends[1]),)))
+    xs = center_x + radius * cos
+    ys = center_y - radius * sin
+    return [[center_x, center_y]] + np.column_stack((xs, ys)).round().astype(np.int32).tolist()
+
 
 class StatsView:
     """
@@ -48,10 +157,22 @@ class StatsView:
         # Create semi-transparent overlay surface
         self.overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         
+        # Color of BG_COLOR blended onto the cleared overlay, worked out on one pixel so a
+        # single fill replaces clearing the overlay and blitting a full-screen background
+        background = pygame.Surface((1, 1), pygame.SRCALPHA)
+        background.fill(self.BG_COLOR)
+        swatch = pygame.Surface((1, 1), pygame.SRCALPHA)
+        swatch.blit(background, (0, 0))
+        self._overlay_fill = swatch.get_at((0, 0))
+        
+        # The overlay is only recomposed when the tab, the data or a widget changes
+        self._overlay_dirty = True
+        self._drawn_widget_blits = None
+        
         # Initialize fonts
-        self.title_font = pygame.font.Font(None, 48)
-        self.header_font = pygame.font.Font(None, 36)
-        self.text_font = pygame.font.Font(None, 24)
+        self.title_font = get_font(None, 48)
+        self.header_font = get_font(None, 36)
+        self.text_font = get_font(None, 24)
         
         # Initialize UI components
         self.init_ui_components()
@@ -60,8 +181,17 @@ class StatsView:
         self.stats_data = {}
         self.current_tab = "overview"  # Default tab
         
-        # Graph surfaces
+        # Graph surfaces, and each graph with its centered position on the overlay
         self.graph_surfaces = {}
+        self._graph_blits = {}
+        
+        # Content drawer for each tab
+        self._tab_drawers = {
+            "overview": self.draw_overview_tab,
+            "iq_trend": lambda: self.draw_graph_tab("iq", "Chess IQ Trend"),
+            "accuracy": lambda: self.draw_graph_tab("accuracy", "Move Accuracy Trend"),
+            "mistakes": lambda: self.draw_graph_tab("mistakes", "Mistake Distribution")
+        }
         
     def init_ui_components(self):
         """Initialize UI components like buttons and labels."""
@@ -134,6 +264,7 @@ class StatsView:
             tab_name: Name of the tab to display
         """
         self.current_tab = tab_name
+        self._overlay_dirty = True
         logger.info(f"Switched to {tab_name} tab")
         
     def close(self) -> None:
@@ -152,19 +283,23 @@ class StatsView:
         self.stats_data = progress_tracker.generate_progress_report()
         
         # Get trend data for graphs
-        self.iq_scores, self.iq_dates = progress_tracker.get_iq_trend(limit=20)
-        self.accuracy_values, self.accuracy_dates = progress_tracker.get_accuracy_trend(limit=20)
+        self.iq_scores, self.iq_dates = progress_tracker.get_iq_series(limit=20)
+        self.accuracy_values, self.accuracy_dates = progress_tracker.get_accuracy_series(limit=20)
         self.mistake_distribution = progress_tracker.get_mistake_distribution()
         
         # Pre-render graphs
         self._render_graphs()
+        self._overlay_dirty = True
         
         logger.info("Stats data updated")
         
     def _render_graphs(self) -> None:
         """Pre-render graph surfaces for better performance."""
+        # Overview panel
+        self.graph_surfaces["overview"] = self._build_overview_surface()
+        
         # IQ trend graph
-        if self.iq_scores:
+        if len(self.iq_scores):
             self.graph_surfaces["iq"] = self._create_line_graph(
                 "Chess IQ Trend", 
                 self.iq_scores, 
@@ -174,7 +309,7 @@ class StatsView:
             )
         
         # Accuracy trend graph
-        if self.accuracy_values:
+        if len(self.accuracy_values):
             self.graph_surfaces["accuracy"] = self._create_line_graph(
                 "Move Accuracy Trend (%)", 
                 self.accuracy_values, 
@@ -195,7 +330,8 @@ class StatsView:
                 categories, 
                 values, 
                 self.GRAPH_COLORS[2],
-                600, 300
+                600, 300,
+                value_format="{:.1f}%"
             )
         
         # Win/loss pie chart
@@ -216,7 +352,14 @@ class StatsView:
                     300, 300
                 )
         
-    def _create_line_graph(self, title: str, values: List[float], labels: List[str], 
+        # Graph positions only change with the graphs themselves
+        graph_center = (self.width // 2, self.height // 2 + 50)
+        self._graph_blits = {
+            key: (graph, graph.get_rect(center=graph_center))
+            for key, graph in self.graph_surfaces.items() if key != "overview"
+        }
+        
+    def _create_line_graph(self, title: str, values: np.ndarray, dates: np.ndarray, 
                           color: Tuple[int, int, int], width: int, height: int,
                           y_min: Optional[float] = None, y_max: Optional[float] = None) -> pygame.Surface:
         """
@@ -225,7 +368,7 @@ class StatsView:
         Args:
             title: Graph title
             values: Y values for the graph
-            labels: X labels for the graph
+            dates: datetime64 time of each value, shown as X labels
             color: Line color
             width: Graph width
             height: Graph height
@@ -235,88 +378,64 @@ class StatsView:
         Returns:
             Pygame surface with the rendered graph
         """
-        if not values:
+        if len(values) == 0:
             return pygame.Surface((width, height), pygame.SRCALPHA)
             
-        # Create surface
-        surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        surface.fill((50, 50, 50))
-        
-        # Draw title
-        title_font = pygame.font.Font(None, 32)
-        title_surf = title_font.render(title, True, self.TEXT_COLOR)
-        title_rect = title_surf.get_rect(midtop=(width // 2, 10))
-        surface.blit(title_surf, title_rect)
-        
         # Graph dimensions
-        graph_margin = 50
-        graph_width = width - graph_margin * 2
-        graph_height = height - graph_margin * 2
-        graph_rect = pygame.Rect(graph_margin, graph_margin, graph_width, graph_height)
-        
-        # Draw graph background
-        pygame.draw.rect(surface, (30, 30, 30), graph_rect)
-        pygame.draw.rect(surface, (100, 100, 100), graph_rect, 1)
+        graph_width = width - _GRAPH_MARGIN * 2
+        graph_height = height - _GRAPH_MARGIN * 2
+        graph_rect = pygame.Rect(_GRAPH_MARGIN, _GRAPH_MARGIN, graph_width, graph_height)
         
         # Calculate value range
         if y_min is None:
-            y_min = min(values) if values else 0
+            y_min = float(values.min())
             # Add some padding
-            y_range = max(values) - y_min if values else 1
+            y_range = float(values.max()) - y_min
             y_min = max(0, y_min - y_range * 0.1)
             
         if y_max is None:
-            y_max = max(values) if values else 1
+            y_max = float(values.max())
             # Add some padding
             y_range = y_max - y_min
             y_max = y_max + y_range * 0.1
             
         y_range = y_max - y_min
         
-        # Draw horizontal grid lines and labels
-        label_font = pygame.font.Font(None, 20)
-        num_lines = 5
-        for i in range(num_lines + 1):
-            y = graph_rect.bottom - (i / num_lines) * graph_height
-            # Grid line
-            pygame.draw.line(surface, (70, 70, 70), (graph_rect.left, y), (graph_rect.right, y), 1)
-            # Y-axis label
-            value = y_min + (i / num_lines) * y_range
-            label = label_font.render(f"{value:.1f}", True, self.TEXT_COLOR)
-            surface.blit(label, (graph_rect.left - label.get_width() - 5, y - label.get_height() // 2))
+        # Start from the cached title, plot area, grid lines and Y-axis labels
+        surface = _line_graph_chrome(title, width, height, y_min, y_max, self.TEXT_COLOR).copy()
+        label_font = get_font(None, 20)
         
         # Draw data points and lines
         if len(values) > 1:
-            points = []
-            for i, value in enumerate(values):
-                x = graph_rect.left + (i / (len(values) - 1)) * graph_width
-                y = graph_rect.bottom - ((value - y_min) / y_range) * graph_height
-                points.append((x, y))
-                
-                # Draw point
-                pygame.draw.circle(surface, color, (int(x), int(y)), 4)
+            # Map all values to pixel coordinates at once (a flat series gets a flat line)
+            points = graph_points(values, y_min, y_range, graph_rect.left, graph_rect.bottom,
+                                  graph_width, graph_height)
+            
+            # Stamp a pre-drawn marker on every point in one batched blit
+            marker = _get_marker(color)
+            blit_batch(surface, [(marker, (x - _MARKER_RADIUS, y - _MARKER_RADIUS)) for x, y in points])
             
             # Draw lines connecting points
-            if len(points) > 1:
-                pygame.draw.lines(surface, color, False, points, 2)
+            pygame.draw.lines(surface, color, False, points, 2)
         
         # Draw X-axis labels (dates)
-        if labels:
-            # Only show a subset of labels to avoid overcrowding
-            num_labels = min(5, len(labels))
-            indices = [i * (len(labels) - 1) // (num_labels - 1) for i in range(num_labels)] if num_labels > 1 else [0]
+        if len(dates):
+            # Only show a subset of labels to avoid overcrowding; only those are formatted
+            num_labels = min(5, len(dates))
+            indices = [i * (len(dates) - 1) // (num_labels - 1) for i in range(num_labels)] if num_labels > 1 else [0]
+            label_texts = np.datetime_as_string(dates[indices], unit='D')
             
-            for i in indices:
-                if i < len(labels):
-                    x = graph_rect.left + (i / (len(labels) - 1 if len(labels) > 1 else 1)) * graph_width
-                    label = label_font.render(labels[i], True, self.TEXT_COLOR)
-                    label_rect = label.get_rect(midtop=(x, graph_rect.bottom + 5))
-                    surface.blit(label, label_rect)
+            for i, text in zip(indices, label_texts):
+                x = graph_rect.left + (i / (len(dates) - 1 if len(dates) > 1 else 1)) * graph_width
+                label = render_text(str(text), label_font, self.TEXT_COLOR)
+                label_rect = label.get_rect(midtop=(x, graph_rect.bottom + 5))
+                surface.blit(label, label_rect)
         
         return surface
         
     def _create_bar_graph(self, title: str, categories: List[str], values: List[float], 
-                         color: Tuple[int, int, int], width: int, height: int) -> pygame.Surface:
+                         color: Tuple[int, int, int], width: int, height: int,
+                         value_format: str = "{}") -> pygame.Surface:
         """
         Create a bar graph surface.
         
@@ -327,6 +446,7 @@ class StatsView:
             color: Bar color
             width: Graph width
             height: Graph height
+            value_format: Format string for the value drawn above each bar
             
         Returns:
             Pygame surface with the rendered graph
@@ -339,8 +459,8 @@ class StatsView:
         surface.fill((50, 50, 50))
         
         # Draw title
-        title_font = pygame.font.Font(None, 32)
-        title_surf = title_font.render(title, True, self.TEXT_COLOR)
+        title_font = get_font(None, 32)
+        title_surf = render_text(title, title_font, self.TEXT_COLOR)
         title_rect = title_surf.get_rect(midtop=(width // 2, 10))
         surface.blit(title_surf, title_rect)
         
@@ -354,21 +474,23 @@ class StatsView:
         pygame.draw.rect(surface, (30, 30, 30), graph_rect)
         pygame.draw.rect(surface, (100, 100, 100), graph_rect, 1)
         
-        # Calculate maximum value for scaling
-        max_value = max(values) if values else 1
-        
-        # Draw bars
+        # Bar sizes and positions for all categories at once, scaled to the largest value
         bar_width = graph_width / len(categories) * 0.8
         bar_spacing = graph_width / len(categories) * 0.2
         
-        label_font = pygame.font.Font(None, 20)
-        value_font = pygame.font.Font(None, 24)
+        counts = np.asarray(values, dtype=np.float64)
+        max_value = counts.max()
+        bar_heights = counts * (graph_height / max_value) if max_value > 0 else np.zeros_like(counts)
+        bar_xs = graph_rect.left + np.arange(len(counts)) * (graph_width / len(categories)) + bar_spacing / 2
+        bar_ys = graph_rect.bottom - bar_heights
+        bar_centers = bar_xs + bar_width / 2
+        
+        # Draw bars
+        label_font = get_font(None, 20)
+        value_font = get_font(None, 24)
         
-        for i, (category, value) in enumerate(zip(categories, values)):
-            # Calculate bar position and size
-            bar_height = (value / max_value) * graph_height if max_value > 0 else 0
-            bar_x = graph_rect.left + (i / len(categories)) * graph_width + bar_spacing / 2
-            bar_y = graph_rect.bottom - bar_height
+        for category, value, bar_x, bar_y, bar_height, bar_center in zip(
+                categories, values, bar_xs, bar_ys, bar_heights, bar_centers):
             bar_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
             
             # Draw bar
@@ -376,13 +498,13 @@ class StatsView:
             pygame.draw.rect(surface, (200, 200, 200), bar_rect, 1)
             
             # Draw category label
-            label = label_font.render(category, True, self.TEXT_COLOR)
-            label_rect = label.get_rect(midtop=(bar_x + bar_width / 2, graph_rect.bottom + 5))
+            label = render_text(category, label_font, self.TEXT_COLOR)
+            label_rect = label.get_rect(midtop=(bar_center, graph_rect.bottom + 5))
             surface.blit(label, label_rect)
             
             # Draw value on top of bar
-            value_label = value_font.render(str(value), True, self.TEXT_COLOR)
-            value_rect = value_label.get_rect(midbottom=(bar_x + bar_width / 2, bar_y - 5))
+            value_label = render_text(value_format.format(value), value_font, self.TEXT_COLOR)
+            value_rect = value_label.get_rect(midbottom=(bar_center, bar_y - 5))
             surface.blit(value_label, value_rect)
         
         return surface
@@ -411,13 +533,14 @@ class StatsView:
         surface.fill((50, 50, 50))
         
         # Draw title
-        title_font = pygame.font.Font(None, 32)
-        title_surf = title_font.render(title, True, self.TEXT_COLOR)
+        title_font = get_font(None, 32)
+        title_surf = render_text(title, title_font, self.TEXT_COLOR)
         title_rect = title_surf.get_rect(midtop=(width // 2, 10))
         surface.blit(title_surf, title_rect)
         
         # Calculate total for percentages
-        total = sum(values) if values else 0
+        values = np.asarray(values, dtype=np.float64)
+        total = float(values.sum())
         if total == 0:
             return surface
             
@@ -426,41 +549,49 @@ class StatsView:
         center_y = height // 2
         radius = min(width, height) // 3
         
+        # Slice angles (degrees), percentages and label positions for all slices at once
+        fractions = values / total
+        end_angles = np.cumsum(fractions * 360.0)
+        start_angles = end_angles - fractions * 360.0
+        percents = fractions * 100.0
+        mid_angles = np.radians(start_angles + fractions * 180.0)
+        label_xs = center_x + (radius * 1.3 * np.cos(mid_angles)).astype(np.int32)
+        label_ys = center_y - (radius * 1.3 * np.sin(mid_angles)).astype(np.int32)
+        
         # Draw pie slices
-        start_angle = 0
-        for i, (label, value, color) in enumerate(zip(labels, values, colors)):
-            # Calculate slice angle
-            slice_angle = 360 * (value / total)
-            end_angle = start_angle + slice_angle
-            
-            # Draw slice
-            pygame.draw.arc(surface, color, 
-                           (center_x - radius, center_y - radius, radius * 2, radius * 2),
-                           math.radians(start_angle), math.radians(end_angle), radius)
-            
-            # Calculate position for label
-            mid_angle = math.radians(start_angle + slice_angle / 2)
-            label_x = center_x + int(radius * 1.3 * math.cos(mid_angle))
-            label_y = center_y - int(radius * 1.3 * math.sin(mid_angle))
+        label_font = get_font(None, 24)
+        for i, (label, color) in enumerate(zip(labels, colors)):
+            # Draw slice as a filled wedge
+            if values[i] > 0:
+                pygame.draw.polygon(surface, color, _wedge_points(center_x, center_y, radius, start_angles[i], end_angles[i]))
             
             # Draw label and percentage
-            label_font = pygame.font.Font(None, 24)
-            percent = value / total * 100
-            label_text = f"{label}: {percent:.1f}%"
-            label_surf = label_font.render(label_text, True, color)
-            label_rect = label_surf.get_rect(center=(label_x, label_y))
+            label_text = f"{label}: {percents[i]:.1f}%"
+            label_surf = render_text(label_text, label_font, color)
+            label_rect = label_surf.get_rect(center=(int(label_xs[i]), int(label_ys[i])))
             surface.blit(label_surf, label_rect)
-            
-            # Update start angle for next slice
-            start_angle = end_angle
         
         return surface
         
     def draw_overview_tab(self) -> None:
         """Draw the overview tab with summary statistics."""
+        # The panel only changes with the stats data, so it is drawn once per update
+        if "overview" not in self.graph_surfaces:
+            self.graph_surfaces["overview"] = self._build_overview_surface()
+        self.overlay.blit(self.graph_surfaces["overview"], (0, 0))
+        
+    def _build_overview_surface(self) -> pygame.Surface:
+        """
+        Render the overview tab's header, stats and lists.
+        
+        Returns:
+            Transparent overlay-sized surface with the overview panel
+        """
+        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        
         # Title
-        header = self.header_font.render("Performance Overview", True, self.TEXT_COLOR)
-        self.overlay.blit(header, (self.width // 2 - header.get_width() // 2, 120))
+        header = render_text("Performance Overview", self.header_font, self.TEXT_COLOR)
+        surface.blit(header, (self.width // 2 - header.get_width() // 2, 120))
         
         # Draw stats in a grid layout
         stats_y = 180
@@ -468,65 +599,69 @@ class StatsView:
         right_col_x = self.width * 3 // 4
         
         # Left column stats
-        self._draw_stat("Current Chess IQ", f"{self.stats_data.get('current_iq', 0):.1f}", left_col_x, stats_y)
-        self._draw_stat("IQ Change", f"{self.stats_data.get('iq_change', 0):+.1f}", left_col_x, stats_y + 60)
-        self._draw_stat("Games Played", str(self.stats_data.get('games_played', 0)), left_col_x, stats_y + 120)
-        self._draw_stat("Win Percentage", f"{self.stats_data.get('win_percentage', 0):.1f}%", left_col_x, stats_y + 180)
+        self._draw_stat(surface, "Current Chess IQ", f"{self.stats_data.get('current_iq', 0):.1f}", left_col_x, stats_y)
+        self._draw_stat(surface, "IQ Change", f"{self.stats_data.get('iq_change', 0):+.1f}", left_col_x, stats_y + 60)
+        self._draw_stat(surface, "Games Played", str(self.stats_data.get('games_played', 0)), left_col_x, stats_y + 120)
+        self._draw_stat(surface, "Win Percentage", f"{self.stats_data.get('win_percentage', 0):.1f}%", left_col_x, stats_y + 180)
         
         # Right column stats
-        self._draw_stat("Average Accuracy", f"{self.stats_data.get('average_accuracy', 0):.1f}%", right_col_x, stats_y)
-        self._draw_stat("Accuracy Change", f"{self.stats_data.get('accuracy_change', 0):+.1f}%", right_col_x, stats_y + 60)
-        self._draw_stat("Total Mistakes", str(self.stats_data.get('total_mistakes', 0)), right_col_x, stats_y + 120)
-        self._draw_stat("Win/Loss Ratio", f"{self.stats_data.get('win_loss_ratio', 0):.2f}", right_col_x, stats_y + 180)
+        self._draw_stat(surface, "Average Accuracy", f"{self.stats_data.get('average_accuracy', 0):.1f}%", right_col_x, stats_y)
+        self._draw_stat(surface, "Accuracy Change", f"{self.stats_data.get('accuracy_change', 0):+.1f}%", right_col_x, stats_y + 60)
+        self._draw_stat(surface, "Total Mistakes", str(self.stats_data.get('total_mistakes', 0)), right_col_x, stats_y + 120)
+        self._draw_stat(surface, "Win/Loss Ratio", f"{self.stats_data.get('win_loss_ratio', 0):.2f}", right_col_x, stats_y + 180)
         
         # Strengths and improvement areas
         strengths_y = stats_y + 260
-        self._draw_list("Strengths", self.stats_data.get('strengths', []), self.width // 4, strengths_y)
-        self._draw_list("Areas to Improve", self.stats_data.get('improvement_areas', []), self.width * 3 // 4, strengths_y)
+        self._draw_list(surface, "Strengths", self.stats_data.get('strengths', []), self.width // 4, strengths_y)
+        self._draw_list(surface, "Areas to Improve", self.stats_data.get('improvement_areas', []), self.width * 3 // 4, strengths_y)
+        
+        return surface
         
-    def _draw_stat(self, label: str, value: str, x: int, y: int) -> None:
+    def _draw_stat(self, surface: pygame.Surface, label: str, value: str, x: int, y: int) -> None:
         """
         Draw a statistic with label and value.
         
         Args:
+            surface: Surface to draw on
             label: Stat label
             value: Stat value
             x: Center x position
             y: Top y position
         """
-        label_surf = self.text_font.render(label, True, self.TEXT_COLOR)
-        value_surf = self.header_font.render(value, True, self.ACCENT_COLOR)
+        label_surf = render_text(label, self.text_font, self.TEXT_COLOR)
+        value_surf = render_text(value, self.header_font, self.ACCENT_COLOR)
         
         label_rect = label_surf.get_rect(midtop=(x, y))
         value_rect = value_surf.get_rect(midtop=(x, y + 30))
         
-        self.overlay.blit(label_surf, label_rect)
-        self.overlay.blit(value_surf, value_rect)
+        surface.blit(label_surf, label_rect)
+        surface.blit(value_surf, value_rect)
         
-    def _draw_list(self, title: str, items: List[str], x: int, y: int) -> None:
+    def _draw_list(self, surface: pygame.Surface, title: str, items: List[str], x: int, y: int) -> None:
         """
         Draw a list of items with a title.
         
         Args:
+            surface: Surface to draw on
             title: List title
             items: List items
             x: Center x position
             y: Top y position
         """
-        title_surf = self.header_font.render(title, True, self.TEXT_COLOR)
+        title_surf = render_text(title, self.header_font, self.TEXT_COLOR)
         title_rect = title_surf.get_rect(midtop=(x, y))
-        self.overlay.blit(title_surf, title_rect)
+        surface.blit(title_surf, title_rect)
         
         if not items:
-            none_surf = self.text_font.render("None", True, self.TEXT_COLOR)
+            none_surf = render_text("None", self.text_font, self.TEXT_COLOR)
             none_rect = none_surf.get_rect(midtop=(x, y + 40))
-            self.overlay.blit(none_surf, none_rect)
+            surface.blit(none_surf, none_rect)
             return
             
         for i, item in enumerate(items[:5]):  # Limit to 5 items
-            item_surf = self.text_font.render(f"• {item}", True, self.TEXT_COLOR)
+            item_surf = render_text(f"• {item}", self.text_font, self.TEXT_COLOR)
             item_rect = item_surf.get_rect(midtop=(x, y + 40 + i * 25))
-            self.overlay.blit(item_surf, item_rect)
+            surface.blit(item_surf, item_rect)
         
     def draw_graph_tab(self, graph_key: str, title: str) -> None:
         """
@@ -537,17 +672,16 @@ class StatsView:
             title: Tab title
         """
         # Title
-        header = self.header_font.render(title, True, self.TEXT_COLOR)
+        header = render_text(title, self.header_font, self.TEXT_COLOR)
         self.overlay.blit(header, (self.width // 2 - header.get_width() // 2, 120))
         
         # Draw graph if available
-        if graph_key in self.graph_surfaces:
-            graph = self.graph_surfaces[graph_key]
-            graph_rect = graph.get_rect(center=(self.width // 2, self.height // 2 + 50))
-            self.overlay.blit(graph, graph_rect)
+        graph_blit = self._graph_blits.get(graph_key)
+        if graph_blit is not None:
+            self.overlay.blit(*graph_blit)
         else:
             # No data message
-            no_data = self.header_font.render("No data available", True, self.TEXT_COLOR)
+            no_data = render_text("No data available", self.header_font, self.TEXT_COLOR)
             self.overlay.blit(no_data, (self.width // 2 - no_data.get_width() // 2, self.height // 2))
         
     def handle_click(self, pos: Tuple[int, int]) -> None:
@@ -565,32 +699,32 @@ class StatsView:
         
     def draw(self) -> None:
         """Draw the stats view on the screen."""
-        # Clear overlay
-        self.overlay.fill((0, 0, 0, 0))
+        widget_blits = [pair for widget in (*self.labels.values(), *self.buttons.values())
+                        for pair in widget.blit_pairs()]
+        if self._overlay_dirty or widget_blits != self._drawn_widget_blits:
+            self._compose_overlay(widget_blits)
         
-        # Draw semi-transparent background
-        bg_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        bg_surface.fill(self.BG_COLOR)
-        self.overlay.blit(bg_surface, (0, 0))
+        # Draw overlay on screen
+        self.screen.blit(self.overlay, (0, 0))
+        
+    def _compose_overlay(self, widget_blits: List[Tuple[pygame.Surface, pygame.Rect]]) -> None:
+        """
+        Redraw the overlay's background, title, buttons and current tab.
+        
+        Args:
+            widget_blits: The title's and buttons' current (surface, rect) pairs
+        """
+        # Clear overlay to the semi-transparent background
+        self.overlay.fill(self._overlay_fill)
         
         # Draw title and buttons
-        self.labels["title"].draw(self.overlay)
-        for button in self.buttons.values():
-            button.draw(self.overlay)
+        blit_batch(self.overlay, widget_blits)
         
         # Draw current tab content
-        if self.current_tab == "overview":
-            self.draw_overview_tab()
-        elif self.current_tab == "iq_trend":
-            self.draw_graph_tab("iq", "Chess IQ Trend")
-        elif self.current_tab == "accuracy":
-            self.draw_graph_tab("accuracy", "Move Accuracy Trend")
-        elif self.current_tab == "mistakes":
-            self.draw_graph_tab("mistakes", "Mistake Distribution")
+        draw_tab = self._tab_drawers.get(self.current_tab)
+        if draw_tab is not None:
+            draw_tab()
         
-        # Draw overlay on screen
-        self.screen.blit(self.overlay, (0, 0))
-
+        self._overlay_dirty = False
+        self._drawn_widget_blits = widget_blits
 
-# Add missing imports
-import math
@@ -6,8 +6,15 @@ Provides default values and configuration overrides.
 """
 
 import os
+import copy
 import json
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, Mapping, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard json module is used instead
+    orjson = None
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -44,44 +51,171 @@ DEFAULT_CONFIG = {
 # Config file path
 CONFIG_FILE = "config.json"
 
+# JSON parser for config file contents (bytes)
+_loads = orjson.loads if orjson is not None else json.loads
+
+def _thaw(value: Any) -> Dict[str, Any]:
+    """
+    Convert a read-only section from get_config_value back to a dict for JSON.
+    
+    Args:
+        value: Value the JSON encoder can't serialize itself
+        
+    Returns:
+        The section as a dict
+        
+    Raises:
+        TypeError: If the value isn't a mapping
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Config value of type {type(value).__name__} is not JSON serializable")
+
+def _dumps(config: Dict[str, Any]) -> bytes:
+    """
+    Serialize a configuration as indented JSON.
+    
+    Args:
+        config: Configuration to serialize
+        
+    Returns:
+        UTF-8 encoded JSON
+        
+    Raises:
+        TypeError: If the configuration holds a value JSON can't represent
+    """
+    if orjson is not None:
+        return orjson.dumps(config, default=_thaw, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2, default=_thaw).encode()
+
+def _freeze(value: Any) -> Any:
+    """
+    Make a read-only copy of a config value.
+    
+    Args:
+        value: Config value (sections are dicts, arrays are lists)
+        
+    Returns:
+        The value with dicts as read-only mappings and lists as tuples, at every level
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# Read-only view of the defaults, used when there is no config file
+_FROZEN_DEFAULT = _freeze(DEFAULT_CONFIG)
+
+# Loaded configs by file path: (file stamp, merged config, read-only values by dotted
+# key path). The stamp is the file's (mtime_ns, size), or None when the file doesn't exist
+_CONFIG_CACHE: Dict[str, Tuple[Optional[Tuple[int, int]], Dict[str, Any], Dict[str, Any]]] = {}
+
+def _file_stamp(config_file: str) -> Optional[Tuple[int, int]]:
+    """
+    Get a stamp that changes whenever the config file is written.
+    
+    Args:
+        config_file: Path to configuration file
+        
+    Returns:
+        (mtime_ns, size) of the file, or None if it doesn't exist
+    """
+    try:
+        stat = os.stat(config_file)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def _flatten(config: Mapping[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """
+    Walk a nested config, yielding every value with its dot-separated path.
+    
+    Args:
+        config: Configuration mapping
+        prefix: Path of config within the whole configuration, with a trailing dot
+        
+    Yields:
+        (key path, value) pairs, sections included
+    """
+    for key, value in config.items():
+        path = prefix + key
+        yield path, value
+        if isinstance(value, Mapping):
+            yield from _flatten(value, path + ".")
+
 def load_config(config_file: str = CONFIG_FILE) -> Dict[str, Any]:
     """
     Load configuration from file, falling back to defaults.
     
+    The file is only re-read when it changed since the last load.
+    
+    Args:
+        config_file: Path to configuration file
+        
+    Returns:
+        Dict containing configuration values (a copy the caller may modify)
+    """
+    return copy.deepcopy(_load_cached(config_file)[1])
+
+def _load_cached(config_file: str) -> Tuple[Optional[Tuple[int, int]], Dict[str, Any], Dict[str, Any]]:
+    """
+    Get the cache entry for a config file, loading it if the file changed.
+    
     Args:
         config_file: Path to configuration file
         
     Returns:
-        Dict containing configuration values
+        (file stamp, merged config, read-only values by dotted key path); not to be modified
     """
-    config = DEFAULT_CONFIG.copy()
+    stamp = _file_stamp(config_file)
+    cached = _CONFIG_CACHE.get(config_file)
+    if cached is not None and cached[0] == stamp:
+        return cached
+    
+    # Without a file the defaults are used as they are; load_config hands out copies
+    if stamp is None:
+        cached = (stamp, DEFAULT_CONFIG, dict(_flatten(_FROZEN_DEFAULT)))
+        _CONFIG_CACHE[config_file] = cached
+        return cached
+    
+    config = copy.deepcopy(DEFAULT_CONFIG)
     
     # Try to load config from file
-    if os.path.exists(config_file):
-        try:
-            with open(config_file, 'r') as f:
-                file_config = json.load(f)
-                
-            # Update default config with file values
-            _update_config_recursive(config, file_config)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading config file: {e}")
+    try:
+        with open(config_file, 'rb') as f:
+            file_config = _loads(f.read())
+            
+        # Update default config with file values
+        _update_config_nested(config, file_config)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Error loading config file: {e}")
     
-    return config
+    cached = (stamp, config, dict(_flatten(_freeze(config))))
+    _CONFIG_CACHE[config_file] = cached
+    return cached
+
+def clear_config_cache() -> None:
+    """Forget all loaded configs so the next load reads from disk."""
+    _CONFIG_CACHE.clear()
 
-def _update_config_recursive(base_config: Dict[str, Any], override_config: Dict[str, Any]) -> None:
+def _update_config_nested(base_config: Dict[str, Any], override_config: Dict[str, Any]) -> None:
     """
-    Recursively update base_config with values from override_config.
+    Update base_config with values from override_config, merging nested sections.
     
     Args:
         base_config: Base configuration to update
         override_config: Configuration with override values
     """
-    for key, value in override_config.items():
-        if key in base_config and isinstance(base_config[key], dict) and isinstance(value, dict):
-            _update_config_recursive(base_config[key], value)
-        else:
-            base_config[key] = value
+    # Sections still to merge, as (base section, override section) pairs
+    pending = [(base_config, override_config)]
+    while pending:
+        base, override = pending.pop()
+        for key, value in override.items():
+            if isinstance(value, dict) and isinstance(base.get(key), dict):
+                pending.append((base[key], value))
+            else:
+                base[key] = value
 
 def save_config(config: Dict[str, Any], config_file: str = CONFIG_FILE) -> bool:
     """
@@ -95,12 +229,16 @@ def save_config(config: Dict[str, Any], config_file: str = CONFIG_FILE) -> bool:
         True if successful, False otherwise
     """
     try:
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        data = _dumps(config)
+        with open(config_file, 'wb') as f:
+            f.write(data)
         return True
-    except IOError as e:
+    except (IOError, TypeError) as e:
         print(f"Error saving config file: {e}")
         return False
+    finally:
+        # The file changed (or may be partly written); reload it on next use
+        _CONFIG_CACHE.pop(config_file, None)
 
 def get_config_value(key_path: str, default: Any = None) -> Any:
     """
@@ -111,20 +249,10 @@ def get_config_value(key_path: str, default: Any = None) -> Any:
         default: Default value if key not found
         
     Returns:
-        Configuration value or default
+        Configuration value or default; sections are read-only mappings and
+        arrays are tuples
     """
-    config = load_config()
-    keys = key_path.split('.')
-    
-    # Navigate through the config dictionary
-    current = config
-    for key in keys:
-        if isinstance(current, dict) and key in current:
-            current = current[key]
-        else:
-            return default
-    
-    return current
+    return _load_cached(CONFIG_FILE)[2].get(key_path, default)
 
 def update_config_value(key_path: str, value: Any) -> bool:
     """
@@ -6,25 +6,337 @@ Provides utility functions for data persistence.
 """
 
 import os
+import copy
 import json
+import mmap
+import atexit
+import shutil
+import hashlib
 import datetime
-from typing import Dict, List, Any, Optional, Union
+import threading
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
 
 from utils.logger import setup_logger
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard json module is used instead
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; player stats are stored as JSON instead
+    msgpack = None
+
 # Initialize logger
 logger = setup_logger(__name__)
 
 # Default file paths
 DATA_DIR = "data"
-GAME_HISTORY_FILE = os.path.join(DATA_DIR, "game_history.json")
-PLAYER_STATS_FILE = os.path.join(DATA_DIR, "player_stats.json")
+GAME_HISTORY_FILE = os.path.join(DATA_DIR, "game_history.json")  # Legacy, migrated to GAME_HISTORY_JSONL
+GAME_HISTORY_JSONL = os.path.join(DATA_DIR, "game_history.jsonl")
+PLAYER_STATS_JSON_FILE = os.path.join(DATA_DIR, "player_stats.json")  # Migrated to msgpack when installed
+PLAYER_STATS_MSGPACK_FILE = os.path.join(DATA_DIR, "player_stats.msgpack")
+PLAYER_STATS_FILE = PLAYER_STATS_MSGPACK_FILE if msgpack is not None else PLAYER_STATS_JSON_FILE
 MOVES_INPUT_FILE = os.path.join(DATA_DIR, "moves_input.json")
+PARSE_CACHE_DIR = os.path.join(DATA_DIR, ".cache")
+
+
+# JSON parser for file contents (bytes or str)
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data as JSON.
+    
+    Args:
+        data: Data to serialize
+        indent: Whether to pretty-print with two-space indentation
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+# Version of the msgpack player stats layout: {"schema_version": ..., "stats": {...}}
+PLAYER_STATS_SCHEMA_VERSION = 1
+
+
+# Parsed file contents by path: (file stamp, data). The stamp is the file's
+# (mtime_ns, size) when it was read, so a changed file is parsed again
+_JSON_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _file_stamp(file_path: str) -> Optional[Tuple[int, int]]:
+    """
+    Get a stamp that changes whenever a file is written.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        (mtime_ns, size) of the file, or None if it doesn't exist
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def clear_json_cache() -> None:
+    """Forget all parsed files so the next load reads from disk."""
+    _JSON_CACHE.clear()
+
+
+class _WriteBackCache:
+    """
+    Buffers data file writes and flushes them together a moment later.
+    
+    Repeated saves of the same file within the delay are written once, with the
+    latest data, and appended lines are written in one go. Pending writes are
+    also flushed once enough have queued up, and at interpreter exit. Writes
+    that fail stay queued and are retried later, waiting twice as long after
+    each failed flush.
+    """
+    
+    def __init__(self, delay: float = 0.1, max_pending: int = 32, max_retry_delay: float = 30.0):
+        """
+        Initialize the write-back cache.
+        
+        Args:
+            delay: Seconds to wait after the first buffered write before flushing
+            max_pending: Number of buffered writes that triggers an immediate flush
+            max_retry_delay: Longest wait in seconds before retrying failed writes
+        """
+        self.delay = delay
+        self.max_pending = max_pending
+        self.max_retry_delay = max_retry_delay
+        self._retry_delay = delay
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._pending_count = 0
+        self._saves: Dict[str, Tuple[Any, Callable[[Any, str], bool]]] = {}  # path -> (data, writer)
+        self._appends: Dict[str, List[bytes]] = {}  # path -> lines to append
+    
+    def save(self, file_path: str, data: Any,
+             writer: Optional[Callable[[Any, str], bool]] = None) -> None:
+        """
+        Buffer replacing a data file's contents.
+        
+        Args:
+            file_path: Path to the data file
+            data: Data to save; a snapshot is taken so the caller may keep modifying it
+            writer: Function writing (data, file_path); JSON by default
+        """
+        with self._lock:
+            self._saves[file_path] = (copy.deepcopy(data), writer or _write_json)
+            self._queued()
+    
+    def append(self, file_path: str, line: bytes) -> None:
+        """
+        Buffer appending a line to a file.
+        
+        Args:
+            file_path: Path to the file
+            line: Encoded line, including its newline
+        """
+        with self._lock:
+            self._appends.setdefault(file_path, []).append(line)
+            self._queued()
+    
+    def pending_save(self, file_path: str) -> Any:
+        """
+        Get a copy of the buffered data for a data file.
+        
+        Args:
+            file_path: Path to the data file
+            
+        Returns:
+            Buffered data, or None if no save is pending
+        """
+        with self._lock:
+            if file_path not in self._saves:
+                return None
+            return copy.deepcopy(self._saves[file_path][0])
+    
+    def pending_lines(self, file_path: str) -> List[bytes]:
+        """
+        Get the buffered lines to append to a file.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Buffered lines, oldest first
+        """
+        with self._lock:
+            return list(self._appends.get(file_path, []))
+    
+    def discard(self, file_path: str) -> None:
+        """
+        Drop buffered writes for a file that is about to be replaced directly.
+        
+        Args:
+            file_path: Path to the file
+        """
+        with self._lock:
+            self._saves.pop(file_path, None)
+            self._appends.pop(file_path, None)
+    
+    def flush(self, file_path: str) -> bool:
+        """
+        Write any buffered writes for one file now.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            True if all of them were written, False if any failed (and stay queued)
+        """
+        with self._lock:
+            if self._write(file_path, self._saves.pop(file_path, None),
+                           self._appends.pop(file_path, None)):
+                return True
+            self._retry_later()
+            return False
+    
+    def flush_all(self) -> bool:
+        """
+        Write all buffered writes now.
+        
+        Returns:
+            True if all of them were written, False if any failed (and stay queued)
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending_count = 0
+            saves, self._saves = self._saves, {}
+            appends, self._appends = self._appends, {}
+            success = True
+            for file_path in saves.keys() | appends.keys():
+                success &= self._write(file_path, saves.get(file_path), appends.get(file_path))
+            if success:
+                self._retry_delay = self.delay
+            else:
+                self._retry_later()
+            return success
+    
+    def _write(self, file_path: str, save: Optional[Tuple[Any, Callable[[Any, str], bool]]],
+               lines: Optional[List[bytes]]) -> bool:
+        """
+        Write one file's buffered writes, queueing them again if they fail
+        (called with the lock held).
+        
+        Args:
+            file_path: Path to the file
+            save: Buffered (data, writer) replacing the file, or None
+            lines: Buffered lines to append after it, or None
+            
+        Returns:
+            True if everything was written, False otherwise
+        """
+        if save is not None and not save[1](save[0], file_path):
+            # Keep the lines queued behind the save they follow
+            self._saves.setdefault(file_path, save)
+            if lines:
+                self._appends[file_path] = lines + self._appends.get(file_path, [])
+            return False
+        if lines and not _append_lines(lines, file_path):
+            self._appends[file_path] = lines + self._appends.get(file_path, [])
+            return False
+        return True
+    
+    def _retry_later(self) -> None:
+        """Schedule another flush after a failed write (called with the lock held)."""
+        if self._timer is None:
+            self._timer = threading.Timer(self._retry_delay, self.flush_all)
+            self._timer.daemon = True
+            self._timer.start()
+        self._retry_delay = min(self._retry_delay * 2, self.max_retry_delay)
+    
+    def _queued(self) -> None:
+        """Schedule a flush after a buffered write (called with the lock held)."""
+        self._pending_count += 1
+        if self._pending_count >= self.max_pending:
+            self.flush_all()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.delay, self.flush_all)
+            self._timer.daemon = True
+            self._timer.start()
+
+
+# Buffered writes of the player stats, moves input and game history files
+_WRITE_BACK = _WriteBackCache()
+atexit.register(_WRITE_BACK.flush_all)
+
+
+def flush_all() -> bool:
+    """
+    Write all buffered data file changes to disk now.
+    
+    Returns:
+        True if everything was written, False if any write failed; failed
+        data file writes stay queued and are retried on the next flush
+    """
+    success = _WRITE_BACK.flush_all()
+    return flush_pgn_files() and success
+
+
+# Directories made or found to exist, which aren't checked again
+_DIR_EXISTS = set()
+
+
+def _ensure_dir(directory: str) -> None:
+    """
+    Make a directory (and its parents) unless it is already known to exist.
+    
+    Args:
+        directory: Directory path; empty for the current directory
+    """
+    if directory and directory not in _DIR_EXISTS:
+        os.makedirs(directory, exist_ok=True)
+        _DIR_EXISTS.add(directory)
+
+
+def _open_in_dir(file_path: str, opener: Callable[[], Any]) -> Any:
+    """
+    Open a file for writing, making its directory first.
+    
+    A directory removed since it was made (such as a deleted data directory)
+    is made again and the open retried once.
+    
+    Args:
+        file_path: Path to the file
+        opener: Function opening the file (or a temporary file beside it)
+        
+    Returns:
+        Whatever opener returns
+    """
+    directory = os.path.dirname(file_path)
+    _ensure_dir(directory)
+    try:
+        return opener()
+    except FileNotFoundError:
+        if directory not in _DIR_EXISTS:
+            raise
+        _DIR_EXISTS.discard(directory)
+        _ensure_dir(directory)
+        return opener()
 
 
 def ensure_data_dir() -> None:
     """Ensure the data directory exists."""
-    os.makedirs(DATA_DIR, exist_ok=True)
+    _ensure_dir(DATA_DIR)
 
 
 def load_json(file_path: str) -> Dict[str, Any]:
@@ -35,16 +347,19 @@ def load_json(file_path: str) -> Dict[str, Any]:
         file_path: Path to the JSON file
         
     Returns:
-        Dictionary containing the loaded data
+        Dictionary containing the loaded data (a copy the caller may modify)
         
     Raises:
         FileNotFoundError: If the file doesn't exist
         json.JSONDecodeError: If the file contains invalid JSON
     """
+    # Data saved but not yet written is newer than the file
+    pending = _WRITE_BACK.pending_save(file_path)
+    if pending is not None:
+        return pending
+    
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        return data
+        return _load_cached(file_path, _read_json_file)
     except FileNotFoundError:
         logger.warning(f"File not found: {file_path}")
         raise
@@ -53,54 +368,350 @@ def load_json(file_path: str) -> Dict[str, Any]:
         raise
 
 
-def save_json(data: Union[Dict[str, Any], List[Any]], file_path: str) -> bool:
+def _load_cached(file_path: str, read: Callable[[str], Any]) -> Any:
+    """
+    Load a data file, reusing the last parse while the file is unchanged.
+    
+    Args:
+        file_path: Path to the data file
+        read: Function reading and parsing the file
+        
+    Returns:
+        Parsed data (a copy the caller may modify)
+    """
+    stamp = _file_stamp(file_path)
+    cached = _JSON_CACHE.get(file_path)
+    if cached is not None and cached[0] == stamp:
+        return copy.deepcopy(cached[1])
+    
+    data = read(file_path)
+    if stamp is not None:
+        _JSON_CACHE[file_path] = (stamp, data)
+    return copy.deepcopy(data)
+
+
+# Files larger than this are parsed straight from a memory map when orjson is installed
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_json_file(file_path: str) -> Any:
+    """
+    Read and parse a JSON file.
+    
+    Args:
+        file_path: Path to the JSON file
+        
+    Returns:
+        Parsed data
+    """
+    with open(file_path, 'rb') as f:
+        # orjson parses any buffer, so a large file needn't be copied into bytes first
+        if orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release()
+        return _loads(f.read())
+
+
+def save_json(data: Union[Dict[str, Any], List[Any]], file_path: str, *, pretty: bool = False) -> bool:
     """
     Save data to a JSON file.
     
     Args:
         data: Data to save (dictionary or list)
         file_path: Path to save the JSON file
+        pretty: Whether to indent the JSON for people to read; compact by default
         
     Returns:
         True if successful, False otherwise
     """
+    # This write supersedes any buffered one
+    _WRITE_BACK.discard(file_path)
+    return _write_json(data, file_path, pretty=pretty)
+
+
+def _replace_file(file_path: str, chunks: Iterable[bytes]) -> None:
+    """
+    Replace a file's contents atomically.
+    
+    The data is written to a temporary file in the same directory, which then
+    takes the file's place, so a crash mid-write leaves the old file intact.
+    The contents go to the kernel with a single unbuffered write where possible.
+    
+    Args:
+        file_path: Path to the file
+        chunks: Encoded contents, in order
+        
+    Raises:
+        OSError: If the file can't be written
+    """
+    data = memoryview(b"".join(chunks))
+    
+    # Unique per thread, since buffered writes are flushed from a timer thread
+    tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fd = _open_in_dir(file_path, lambda: os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
     try:
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _write_json(data: Union[Dict[str, Any], List[Any]], file_path: str, pretty: bool = False) -> bool:
+    """
+    Write data to a JSON file.
+    
+    Args:
+        data: Data to save (dictionary or list)
+        file_path: Path to save the JSON file
+        pretty: Whether to indent the JSON
         
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=4)
+    Returns:
+        True if successful, False otherwise
+    """
+    # The saved file is parsed again on next load
+    _JSON_CACHE.pop(file_path, None)
+    
+    try:
+        _replace_file(file_path, [_dumps(data, indent=pretty)])
         return True
     except Exception as e:
         logger.error(f"Error saving to {file_path}: {e}")
         return False
 
 
-def load_game_history() -> List[Dict[str, Any]]:
+def _json_line(entry: Dict[str, Any]) -> bytes:
     """
-    Load game history from the default file.
+    Serialize one entry as a JSON Lines record.
     
+    Args:
+        entry: Entry to serialize
+        
     Returns:
-        List of game history entries
+        Compact UTF-8 JSON followed by a newline
+    """
+    return _dumps(entry) + b"\n"
+
+
+def _append_lines(lines: List[bytes], file_path: str) -> bool:
+    """
+    Append JSON Lines records to a file.
+    
+    Args:
+        lines: Encoded records, each ending in a newline
+        file_path: Path to the file
+        
+    Returns:
+        True if successful, False otherwise
     """
     try:
-        return load_json(GAME_HISTORY_FILE)
-    except FileNotFoundError:
-        # Create empty game history file
-        save_json([], GAME_HISTORY_FILE)
+        stamp = _file_stamp(file_path)
+        with _open_in_dir(file_path, lambda: open(file_path, 'ab+')) as f:
+            # A last line cut short by a crash has no newline; end it so the new
+            # records start on their own lines (it is skipped when loading)
+            end = f.seek(0, os.SEEK_END)
+            ended_cleanly = True
+            if end:
+                f.seek(end - 1)
+                ended_cleanly = f.read(1) == b"\n"
+                if not ended_cleanly:
+                    f.write(b"\n")
+            f.writelines(lines)
+        
+        # Extend a cached parse that was current before the append, as if re-read;
+        # after a truncated line it is dropped and the file parsed again instead
+        cached = _JSON_CACHE.pop(file_path, None)
+        if cached is not None and cached[0] == stamp and ended_cleanly:
+            cached[1].extend(_loads(line) for line in lines)
+            _JSON_CACHE[file_path] = (_file_stamp(file_path), cached[1])
+        return True
+    except Exception as e:
+        logger.error(f"Error appending to {file_path}: {e}")
+        return False
+
+
+def _migrate_game_history() -> List[Dict[str, Any]]:
+    """
+    Move the legacy JSON game history into the JSON Lines file.
+    
+    Returns:
+        List of migrated game history entries (empty if there was no legacy file)
+    """
+    if not os.path.exists(GAME_HISTORY_FILE):
         return []
+    
+    try:
+        history = load_json(GAME_HISTORY_FILE)
     except json.JSONDecodeError:
-        # Backup corrupted file and create new one
+        # Older versions overwrote this file in place, so a crash could corrupt it;
+        # backup corrupted file and start a new history
         backup_file = f"{GAME_HISTORY_FILE}.bak.{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
         logger.warning(f"Corrupted game history file. Backing up to {backup_file}")
         os.rename(GAME_HISTORY_FILE, backup_file)
-        save_json([], GAME_HISTORY_FILE)
         return []
+    
+    if save_game_history(history):
+        logger.info(f"Migrated {len(history)} games from {GAME_HISTORY_FILE} to {GAME_HISTORY_JSONL}")
+    return history
+
+
+def load_game_history() -> List[Dict[str, Any]]:
+    """
+    Load game history from the default file.
+    
+    The history is stored as JSON Lines, one game per line. Lines that can't be
+    parsed (such as a write cut short by a crash) are skipped. Games that are
+    still queued because writing them failed are included at the end.
+    
+    Returns:
+        List of game history entries
+    """
+    unwritten = _unwritten_games()
+    return _read_game_history() + unwritten
+
+
+def _unwritten_games() -> List[Dict[str, Any]]:
+    """
+    Write buffered games to the history file.
+    
+    Returns:
+        Games that are still queued because the write failed, oldest first
+    """
+    if _WRITE_BACK.flush(GAME_HISTORY_JSONL):
+        return []
+    return [_loads(line) for line in _WRITE_BACK.pending_lines(GAME_HISTORY_JSONL)]
+
+
+def _read_game_history() -> List[Dict[str, Any]]:
+    """
+    Read the games in the history file.
+    
+    Returns:
+        List of game history entries
+    """
+    stamp = _file_stamp(GAME_HISTORY_JSONL)
+    if stamp is None:
+        return _migrate_game_history()
+    
+    # Reuse the last parse while the file is unchanged
+    cached = _JSON_CACHE.get(GAME_HISTORY_JSONL)
+    if cached is not None and cached[0] == stamp:
+        return copy.deepcopy(cached[1])
+    
+    history = []
+    with open(GAME_HISTORY_JSONL, 'rb') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                history.append(_loads(line))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Skipping invalid game on line {line_number} of {GAME_HISTORY_JSONL}: {e}")
+    
+    _JSON_CACHE[GAME_HISTORY_JSONL] = (stamp, history)
+    return copy.deepcopy(history)
+
+
+# Bytes read at a time when reading the history file backwards
+_TAIL_CHUNK_SIZE = 64 * 1024
+
+
+def _reverse_lines(file_path: str) -> Iterator[bytes]:
+    """
+    Read a file's lines from the end, a chunk at a time.
+    
+    Args:
+        file_path: Path to the file
+        
+    Yields:
+        Non-blank lines, newest first
+    """
+    with open(file_path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        head = b""  # Start of the earliest line read so far, which may continue further back
+        while position > 0:
+            size = min(_TAIL_CHUNK_SIZE, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + head).split(b"\n")
+            head = lines[0]
+            for line in reversed(lines[1:]):
+                if line.strip():
+                    yield line
+        if head.strip():
+            yield head
+
+
+def load_recent_games(count: int) -> List[Dict[str, Any]]:
+    """
+    Load the most recent games from the game history.
+    
+    Only the end of the history file is read and parsed, so this takes time in
+    proportion to count, not to the size of the history. Games that are still
+    queued because writing them failed are included, as in load_game_history().
+    
+    Args:
+        count: Number of games to load
+        
+    Returns:
+        Up to count most recent game history entries, oldest first
+    """
+    if count <= 0:
+        return []
+    
+    unwritten = _unwritten_games()[-count:]
+    if len(unwritten) == count:
+        return unwritten
+    return _read_recent_games(count - len(unwritten)) + unwritten
+
+
+def _read_recent_games(count: int) -> List[Dict[str, Any]]:
+    """
+    Read the most recent games in the history file.
+    
+    Args:
+        count: Number of games to read (at least 1)
+        
+    Returns:
+        Up to count most recent games in the file, oldest first
+    """
+    stamp = _file_stamp(GAME_HISTORY_JSONL)
+    if stamp is None:
+        return _read_game_history()[-count:]
+    
+    # A current parse of the whole history already has them
+    cached = _JSON_CACHE.get(GAME_HISTORY_JSONL)
+    if cached is not None and cached[0] == stamp:
+        return copy.deepcopy(cached[1][-count:])
+    
+    # Read back until enough lines parse; invalid lines don't count
+    games = []
+    for line in _reverse_lines(GAME_HISTORY_JSONL):
+        try:
+            games.append(_loads(line))
+        except json.JSONDecodeError as e:
+            logger.warning(f"Skipping invalid game in {GAME_HISTORY_JSONL}: {e}")
+            continue
+        if len(games) == count:
+            break
+    games.reverse()
+    return games
 
 
 def save_game_history(game_history: List[Dict[str, Any]]) -> bool:
     """
-    Save game history to the default file.
+    Save game history to the default file, replacing its contents.
+    
+    If the history only gained games since it was loaded, just the new games
+    are serialized and appended.
     
     Args:
         game_history: List of game history entries
@@ -108,44 +719,170 @@ def save_game_history(game_history: List[Dict[str, Any]]) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    return save_json(game_history, GAME_HISTORY_FILE)
+    # Buffered games are replaced along with the rest of the file
+    _WRITE_BACK.discard(GAME_HISTORY_JSONL)
+    
+    try:
+        cached = _JSON_CACHE.get(GAME_HISTORY_JSONL)
+        if cached is not None and cached[0] == _file_stamp(GAME_HISTORY_JSONL):
+            saved = cached[1]
+            if len(game_history) >= len(saved) and game_history[:len(saved)] == saved:
+                new_games = game_history[len(saved):]
+                return not new_games or _append_lines([_json_line(game) for game in new_games],
+                                                      GAME_HISTORY_JSONL)
+        
+        # The rewritten file is parsed again on next load
+        _JSON_CACHE.pop(GAME_HISTORY_JSONL, None)
+        _replace_file(GAME_HISTORY_JSONL, (_json_line(game) for game in game_history))
+        return True
+    except Exception as e:
+        logger.error(f"Error saving to {GAME_HISTORY_JSONL}: {e}")
+        return False
 
 
 def add_game_to_history(game_data: Dict[str, Any]) -> bool:
     """
     Add a new game entry to the game history.
     
+    Only the new game is serialized; it is appended to the history file as one
+    line, buffered with any other games added within a short delay.
+    
     Args:
         game_data: Game data to add
         
     Returns:
-        True if successful, False otherwise
+        True once the game is queued, False if it couldn't be serialized;
+        flush_all() reports whether the write itself succeeded
     """
     try:
-        # Load existing history
-        history = load_game_history()
+        # Carry over a legacy history before appending to a new file
+        if not os.path.exists(GAME_HISTORY_JSONL):
+            _migrate_game_history()
         
         # Add timestamp if not present
         if "timestamp" not in game_data:
             game_data["timestamp"] = datetime.datetime.now().isoformat()
             
-        # Add the new game
-        history.append(game_data)
-        
-        # Save updated history
-        return save_game_history(history)
+        # Append the new game
+        _WRITE_BACK.append(GAME_HISTORY_JSONL, _json_line(game_data))
+        return True
     except Exception as e:
         logger.error(f"Error adding game to history: {e}")
         return False
 
 
+def _read_msgpack_file(file_path: str) -> Any:
+    """
+    Read and unpack a msgpack file.
+    
+    Args:
+        file_path: Path to the msgpack file
+        
+    Returns:
+        Unpacked data
+    """
+    with open(file_path, 'rb') as f:
+        return msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+
+
+def _write_msgpack(data: Any, file_path: str) -> bool:
+    """
+    Write data to a msgpack file.
+    
+    Args:
+        data: Data to save
+        file_path: Path to save the msgpack file
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    # The saved file is unpacked again on next load
+    _JSON_CACHE.pop(file_path, None)
+    
+    try:
+        _replace_file(file_path, [msgpack.packb(data, use_bin_type=True)])
+        return True
+    except Exception as e:
+        logger.error(f"Error saving to {file_path}: {e}")
+        return False
+
+
+def _player_stats_record(player_stats: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Wrap player statistics for the msgpack file.
+    
+    Args:
+        player_stats: Player statistics dictionary
+        
+    Returns:
+        Versioned record holding the statistics
+    """
+    return {"schema_version": PLAYER_STATS_SCHEMA_VERSION, "stats": player_stats}
+
+
+def _stats_from_record(record: Any) -> Dict[str, Any]:
+    """
+    Get the player statistics out of a msgpack file record.
+    
+    Args:
+        record: Unpacked file contents
+        
+    Returns:
+        Player statistics (empty if the record has an unknown layout)
+    """
+    if not isinstance(record, dict) or record.get("schema_version") != PLAYER_STATS_SCHEMA_VERSION:
+        logger.error(f"Unsupported player stats format in {PLAYER_STATS_MSGPACK_FILE}")
+        return {}
+    if "stats" not in record:
+        logger.error(f"Player stats record in {PLAYER_STATS_MSGPACK_FILE} has no stats")
+    return record.get("stats", {})
+
+
+def _migrate_player_stats() -> Dict[str, Any]:
+    """
+    Move JSON player statistics into the msgpack file.
+    
+    Returns:
+        Migrated player statistics (empty if there was no JSON file)
+    """
+    try:
+        player_stats = load_json(PLAYER_STATS_JSON_FILE)
+    except FileNotFoundError:
+        player_stats = {}
+    except json.JSONDecodeError:
+        # Leave the unreadable file as is and start empty
+        player_stats = {}
+    else:
+        logger.info(f"Migrating player stats from {PLAYER_STATS_JSON_FILE} to {PLAYER_STATS_MSGPACK_FILE}")
+    
+    _write_msgpack(_player_stats_record(player_stats), PLAYER_STATS_MSGPACK_FILE)
+    return player_stats
+
+
 def load_player_stats() -> Dict[str, Any]:
     """
     Load player statistics from the default file.
     
+    Statistics are stored as msgpack when it is installed, and as JSON otherwise.
+    
     Returns:
         Dictionary containing player statistics
     """
+    if msgpack is not None:
+        # Data saved but not yet written is newer than the file
+        pending = _WRITE_BACK.pending_save(PLAYER_STATS_FILE)
+        if pending is not None:
+            return _stats_from_record(pending)
+        
+        try:
+            return _stats_from_record(_load_cached(PLAYER_STATS_FILE, _read_msgpack_file))
+        except FileNotFoundError:
+            return _migrate_player_stats()
+        except ValueError as e:
+            # Saves replace the file atomically, so it was changed outside the app
+            logger.error(f"Invalid player stats in {PLAYER_STATS_FILE}: {e}")
+            return {}
+    
     try:
         return load_json(PLAYER_STATS_FILE)
     except FileNotFoundError:
@@ -153,11 +890,8 @@ def load_player_stats() -> Dict[str, Any]:
         save_json({}, PLAYER_STATS_FILE)
         return {}
     except json.JSONDecodeError:
-        # Backup corrupted file and create new one
-        backup_file = f"{PLAYER_STATS_FILE}.bak.{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
-        logger.warning(f"Corrupted player stats file. Backing up to {backup_file}")
-        os.rename(PLAYER_STATS_FILE, backup_file)
-        save_json({}, PLAYER_STATS_FILE)
+        # Saves replace the file atomically, so it was edited outside the app;
+        # start empty and leave the file as is until the next save
         return {}
 
 
@@ -165,13 +899,20 @@ def save_player_stats(player_stats: Dict[str, Any]) -> bool:
     """
     Save player statistics to the default file.
     
+    The write is buffered, so repeated saves within a short delay are written once.
+    
     Args:
         player_stats: Player statistics dictionary
         
     Returns:
-        True if successful, False otherwise
+        True once the save is queued; flush_all() reports whether the write
+        itself succeeded
     """
-    return save_json(player_stats, PLAYER_STATS_FILE)
+    if msgpack is not None:
+        _WRITE_BACK.save(PLAYER_STATS_FILE, _player_stats_record(player_stats), _write_msgpack)
+    else:
+        _WRITE_BACK.save(PLAYER_STATS_FILE, player_stats)
+    return True
 
 
 def load_moves_input() -> Dict[str, Any]:
@@ -188,11 +929,8 @@ def load_moves_input() -> Dict[str, Any]:
         save_json({}, MOVES_INPUT_FILE)
         return {}
     except json.JSONDecodeError:
-        # Backup corrupted file and create new one
-        backup_file = f"{MOVES_INPUT_FILE}.bak.{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
-        logger.warning(f"Corrupted moves input file. Backing up to {backup_file}")
-        os.rename(MOVES_INPUT_FILE, backup_file)
-        save_json({}, MOVES_INPUT_FILE)
+        # Saves replace the file atomically, so it was edited outside the app;
+        # start empty and leave the file as is until the next save
         return {}
 
 
@@ -200,13 +938,17 @@ def save_moves_input(moves_data: Dict[str, Any]) -> bool:
     """
     Save moves input data to the default file.
     
+    The write is buffered, so repeated saves within a short delay are written once.
+    
     Args:
         moves_data: Moves input data dictionary
         
     Returns:
-        True if successful, False otherwise
+        True once the save is queued; flush_all() reports whether the write
+        itself succeeded
     """
-    return save_json(moves_data, MOVES_INPUT_FILE)
+    _WRITE_BACK.save(MOVES_INPUT_FILE, moves_data)
+    return True
 
 
 def save_pgn(pgn_text: str, file_path: Optional[str] = None) -> str:
@@ -226,10 +968,7 @@ def save_pgn(pgn_text: str, file_path: Optional[str] = None) -> str:
         file_path = os.path.join(DATA_DIR, f"game_{timestamp}.pgn")
     
     try:
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
-        with open(file_path, 'w') as f:
+        with _open_in_dir(file_path, lambda: open(file_path, 'w')) as f:
             f.write(pgn_text)
         
         logger.info(f"PGN saved to {file_path}")
@@ -239,6 +978,77 @@ def save_pgn(pgn_text: str, file_path: Optional[str] = None) -> str:
         return ""
 
 
+# PGN files kept open for appending by save_pgn_append, by path
+_PGN_FILES: Dict[str, IO[str]] = {}
+
+# Write buffer size of PGN files opened for appending
+_PGN_BUFFER_SIZE = 1 << 20
+
+
+def save_pgn_append(pgn_text: str, file_path: str) -> bool:
+    """
+    Append a game to a multi-game PGN file.
+    
+    The file stays open with a large write buffer, so saving many games to it
+    doesn't reopen it each time. Games reach the file when the buffer fills,
+    on flush_pgn_files() and at interpreter exit.
+    
+    Args:
+        pgn_text: PGN text of the game
+        file_path: Path to the PGN file
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        f = _PGN_FILES.get(file_path)
+        if f is None:
+            f = _open_in_dir(file_path, lambda: open(file_path, 'a', buffering=_PGN_BUFFER_SIZE))
+            _PGN_FILES[file_path] = f
+        
+        # Games in a PGN file are separated by a blank line
+        f.write(pgn_text.rstrip("\n") + "\n\n")
+        return True
+    except Exception as e:
+        logger.error(f"Error appending PGN to {file_path}: {e}")
+        return False
+
+
+def flush_pgn_files(sync: bool = False) -> bool:
+    """
+    Write games buffered by save_pgn_append to their files.
+    
+    Args:
+        sync: Whether to also wait for the data to reach the disk (fsync)
+        
+    Returns:
+        True if successful, False if any file couldn't be flushed
+    """
+    success = True
+    for file_path, f in _PGN_FILES.items():
+        try:
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+        except OSError as e:
+            logger.error(f"Error flushing PGN file {file_path}: {e}")
+            success = False
+    return success
+
+
+def close_pgn_files() -> None:
+    """Flush and close the PGN files opened by save_pgn_append."""
+    while _PGN_FILES:
+        file_path, f = _PGN_FILES.popitem()
+        try:
+            f.close()
+        except OSError as e:
+            logger.error(f"Error closing PGN file {file_path}: {e}")
+
+
+atexit.register(close_pgn_files)
+
+
 def load_pgn(file_path: str) -> str:
     """
     Load a PGN file.
@@ -252,6 +1062,11 @@ def load_pgn(file_path: str) -> str:
     Raises:
         FileNotFoundError: If the file doesn't exist
     """
+    # Include games still buffered for this file
+    appending = _PGN_FILES.get(file_path)
+    if appending is not None:
+        appending.flush()
+    
     try:
         with open(file_path, 'r') as f:
             pgn_text = f.read()
@@ -264,6 +1079,44 @@ def load_pgn(file_path: str) -> str:
         raise
 
 
+def load_pgn_cached(file_path: str, parse: Callable[[str], Any], cache_key: str) -> Any:
+    """
+    Load a PGN file and parse it, reusing the result of an earlier parse.
+    
+    Results are stored in PARSE_CACHE_DIR, keyed by the SHA-1 of the file's
+    contents and cache_key, so an unchanged file is parsed only once across
+    runs, whatever its path.
+    
+    Args:
+        file_path: Path to the PGN file
+        parse: Function parsing PGN text; its result must be JSON-serializable
+        cache_key: Name and version of the parser; change it whenever parse
+            would give a different result
+        
+    Returns:
+        Parse result (as read back from JSON when cached)
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    pgn_bytes = load_pgn(file_path).encode()
+    key = hashlib.sha1(pgn_bytes)
+    key.update(cache_key.encode())
+    cache_path = os.path.join(PARSE_CACHE_DIR, f"{key.hexdigest()}.json")
+    
+    # Read directly: each result is used once, so it isn't kept in _JSON_CACHE
+    try:
+        return _read_json_file(cache_path)
+    except FileNotFoundError:
+        pass
+    except json.JSONDecodeError as e:
+        logger.warning(f"Ignoring invalid parse cache {cache_path}: {e}")
+    
+    result = parse(pgn_bytes.decode())
+    _write_json(result, cache_path)
+    return result
+
+
 def export_analysis_to_json(analysis_data: Dict[str, Any], file_path: Optional[str] = None) -> str:
     """
     Export analysis results to a JSON file.
@@ -285,8 +1138,8 @@ def export_analysis_to_json(analysis_data: Dict[str, Any], file_path: Optional[s
         if "timestamp" not in analysis_data:
             analysis_data["timestamp"] = datetime.datetime.now().isoformat()
         
-        # Save the analysis data
-        save_json(analysis_data, file_path)
+        # Save the analysis data, readable since it's meant for people
+        save_json(analysis_data, file_path, pretty=True)
         
         logger.info(f"Analysis exported to {file_path}")
         return file_path
@@ -303,22 +1156,26 @@ def backup_data_files() -> bool:
         True if successful, False otherwise
     """
     try:
+        # Back up what has been saved, not what was last written
+        flush_all()
+        
         timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
         backup_dir = os.path.join(DATA_DIR, "backups", timestamp)
         os.makedirs(backup_dir, exist_ok=True)
         
         # Files to backup
         files_to_backup = [
+            GAME_HISTORY_JSONL,
             GAME_HISTORY_FILE,
-            PLAYER_STATS_FILE,
+            PLAYER_STATS_MSGPACK_FILE,
+            PLAYER_STATS_JSON_FILE,
             MOVES_INPUT_FILE
         ]
         
         for file_path in files_to_backup:
             if os.path.exists(file_path):
                 backup_path = os.path.join(backup_dir, os.path.basename(file_path))
-                with open(file_path, 'r') as src, open(backup_path, 'w') as dst:
-                    dst.write(src.read())
+                shutil.copyfile(file_path, backup_path)
                 logger.info(f"Backed up {file_path} to {backup_path}")
         
         return True
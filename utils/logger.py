@@ -6,13 +6,18 @@ Provides consistent logging format and levels across the application.
 """
 
 import os
+import queue
+import atexit
 import logging
 import datetime
-from typing import Optional
+import functools
+import logging.handlers
+from typing import Dict, Optional, Tuple
 
 
 # Create logs directory if it doesn't exist
-os.makedirs(os.path.join("logs"), exist_ok=True)
+LOG_DIR = "logs"
+os.makedirs(LOG_DIR, exist_ok=True)
 
 # Configure default logging format
 DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -27,6 +32,59 @@ LOG_LEVELS = {
     "critical": logging.CRITICAL
 }
 
+# Log file for this run, named with the date the application started
+LOG_FILE = os.path.join(LOG_DIR, f"chess_iq_{datetime.datetime.now().strftime('%Y-%m-%d')}.log")
+
+# Configured loggers by (name, level, log_to_file, log_to_console, log_format, date_format)
+_LOGGER_CACHE: Dict[Tuple[str, str, bool, bool, str, str], logging.Logger] = {}
+
+@functools.lru_cache(maxsize=None)
+def _get_formatter(log_format: str, date_format: str) -> logging.Formatter:
+    """
+    Get the shared formatter for a log format.
+    
+    Args:
+        log_format: Log message format
+        date_format: Date format in log messages
+        
+    Returns:
+        Formatter, created on first use
+    """
+    return logging.Formatter(log_format, date_format)
+
+
+# Handlers queueing records for LOG_FILE by (log_format, date_format), shared by all loggers
+_FILE_HANDLERS: Dict[Tuple[str, str], logging.handlers.QueueHandler] = {}
+
+
+def _get_file_handler(log_format: str, date_format: str) -> logging.handlers.QueueHandler:
+    """
+    Get the shared handler writing the log file in a format.
+    
+    Logging calls only queue the record; a background thread writes it to
+    the file. The thread drains its queue and stops at interpreter exit.
+    
+    Args:
+        log_format: Log message format
+        date_format: Date format in log messages
+        
+    Returns:
+        Queue handler, created on first use
+    """
+    handler = _FILE_HANDLERS.get((log_format, date_format))
+    if handler is None:
+        file_handler = logging.FileHandler(LOG_FILE)
+        file_handler.setFormatter(_get_formatter(log_format, date_format))
+        
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+        atexit.register(listener.stop)
+        
+        handler = logging.handlers.QueueHandler(log_queue)
+        _FILE_HANDLERS[(log_format, date_format)] = handler
+    return handler
+
 
 def setup_logger(name: str = "chess_iq", level: str = "info", 
                log_to_file: bool = True, 
@@ -36,6 +94,8 @@ def setup_logger(name: str = "chess_iq", level: str = "info",
     """
     Set up and return a logger with the specified configuration.
     
+    A logger already set up with the same configuration is returned as is.
+    
     Args:
         name: Logger name (typically __name__ of the calling module)
         level: Log level (debug, info, warning, error, critical)
@@ -47,43 +107,38 @@ def setup_logger(name: str = "chess_iq", level: str = "info",
     Returns:
         Configured logger instance
     """
+    key = (name, level, log_to_file, log_to_console, log_format, date_format)
+    cached = _LOGGER_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
     # Map string level to logging level
-    level_map = {
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "warning": logging.WARNING,
-        "error": logging.ERROR,
-        "critical": logging.CRITICAL
-    }
-    log_level = level_map.get(level.lower(), logging.INFO)
+    log_level = LOG_LEVELS.get(level.lower(), logging.INFO)
     
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(log_level)
     
     # Clear existing handlers to avoid duplicates
-    if logger.hasHandlers():
-        logger.handlers.clear()
-    
-    # Create formatter
-    formatter = logging.Formatter(log_format, date_format)
+    for handler in logger.handlers:
+        if handler not in _FILE_HANDLERS.values():
+            handler.close()
+    logger.handlers.clear()
     
     # Add console handler if requested
     if log_to_console:
         console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_get_formatter(log_format, date_format))
         logger.addHandler(console_handler)
     
     # Add file handler if requested
     if log_to_file:
-        # Create log filename with date
-        today = datetime.datetime.now().strftime("%Y-%m-%d")
-        log_file = os.path.join("logs", f"chess_iq_{today}.log")
-        
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        logger.addHandler(_get_file_handler(log_format, date_format))
     
+    # A different configuration of the same logger replaces this one
+    for other_key in [k for k in _LOGGER_CACHE if k[0] == name]:
+        del _LOGGER_CACHE[other_key]
+    _LOGGER_CACHE[key] = logger
     return logger
 
 
@@ -96,7 +151,7 @@ def log_game_start(logger: logging.Logger, player_white: str, player_black: str)
         player_white: Name of player with white pieces
         player_black: Name of player with black pieces
     """
-    logger.info(f"New game started: {player_white} (White) vs {player_black} (Black)")
+    logger.info("New game started: %s (White) vs %s (Black)", player_white, player_black)
 
 
 def log_move(logger: logging.Logger, move_notation: str, player: str, 
@@ -111,8 +166,21 @@ def log_move(logger: logging.Logger, move_notation: str, player: str,
         move_number: Move number in the game
         time_taken: Time taken to make the move in seconds (optional)
     """
-    time_str = f" in {time_taken:.1f}s" if time_taken is not None else ""
-    logger.info(f"Move {move_number}: {player.capitalize()} played {move_notation}{time_str}")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    if time_taken is not None:
+        logger.info("Move %d: %s played %s in %.1fs", move_number, player.capitalize(), move_notation, time_taken)
+    else:
+        logger.info("Move %d: %s played %s", move_number, player.capitalize(), move_notation)
+
+
+# Descriptions of game results for log messages
+_RESULT_NAMES = {
+    "white_win": "White wins",
+    "black_win": "Black wins",
+    "draw": "Game drawn"
+}
 
 
 def log_game_end(logger: logging.Logger, result: str, reason: str) -> None:
@@ -124,13 +192,8 @@ def log_game_end(logger: logging.Logger, result: str, reason: str) -> None:
         result: Game result ("white_win", "black_win", "draw")
         reason: Reason for the result (e.g., "checkmate", "resignation", "time")
     """
-    result_str = {
-        "white_win": "White wins",
-        "black_win": "Black wins",
-        "draw": "Game drawn"
-    }.get(result, "Game ended")
-    
-    logger.info(f"Game ended: {result_str} by {reason}")
+    result_str = _RESULT_NAMES.get(result, "Game ended")
+    logger.info("Game ended: %s by %s", result_str, reason)
 
 
 def log_analysis_result(logger: logging.Logger, accuracy: float, 
@@ -147,9 +210,9 @@ def log_analysis_result(logger: logging.Logger, accuracy: float,
         inaccuracies: Number of inaccuracies
         iq_score: Calculated Chess IQ score
     """
-    logger.info(f"Game analysis: Accuracy {accuracy:.1f}%, "
-               f"Blunders: {blunders}, Mistakes: {mistakes}, Inaccuracies: {inaccuracies}, "
-               f"Chess IQ: {iq_score:.1f}")
+    logger.info("Game analysis: Accuracy %.1f%%, "
+                "Blunders: %d, Mistakes: %d, Inaccuracies: %d, "
+                "Chess IQ: %.1f", accuracy, blunders, mistakes, inaccuracies, iq_score)
 
 
 def log_error(logger: logging.Logger, error_type: str, details: str) -> None:
@@ -161,17 +224,9 @@ def log_error(logger: logging.Logger, error_type: str, details: str) -> None:
         error_type: Type of error
         details: Error details
     """
-    logger.error(f"{error_type}: {details}")
+    logger.error("%s: %s", error_type, details)
 
 
-if __name__ == "__main__":
-    # Example usage
-    test_logger = get_logger("test")
-    log_game_start(test_logger, "Player", "AI")
-    log_move(test_logger, "e4", "white", 1, 2.5)
-    log_move(test_logger, "e5", "black", 1, 1.8)
-    log_game_end(test_logger, "white_win", "checkmate")
-    log_analysis_result(test_logger, 85.5, 1, 2, 3, 1450.0)
 def get_logger(name: str, level: str = "info", 
                log_to_file: bool = True, 
                log_to_console: bool = True,
@@ -181,3 +236,13 @@ def get_logger(name: str, level: str = "info",
     Alias for setup_logger for backward compatibility.
     """
     return setup_logger(name, level, log_to_file, log_to_console, log_format, date_format)
+
+
+if __name__ == "__main__":
+    # Example usage
+    test_logger = get_logger("test")
+    log_game_start(test_logger, "Player", "AI")
+    log_move(test_logger, "e4", "white", 1, 2.5)
+    log_move(test_logger, "e5", "black", 1, 1.8)
+    log_game_end(test_logger, "white_win", "checkmate")
+    log_analysis_result(test_logger, 85.5, 1, 2, 3, 1450.0)